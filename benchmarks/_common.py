@@ -0,0 +1,58 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run from the repository root, e.g.::
+
+    python benchmarks/bench_parser.py --messages 500000
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+AUTHORS = ["Alice", "Bob", "Charlie", "Dana", "Emre", "Greta"]
+WORDS = ["hello", "ok", "see", "you", "tomorrow", "haha", "what", "time", "are", "we", "meeting"]
+SPECIAL = ["image omitted", "This message was deleted.", "Check https://example.com", "Nice 😀👍"]
+
+
+def generate_chat(n_messages: int, seed: int = 0, multiline_every: int = 50) -> bytes:
+    """
+    Generate a synthetic Android-format WhatsApp export.
+
+    Args:
+        n_messages: Number of messages to generate
+        seed: Random seed for reproducible output
+        multiline_every: Emit a two-line message every N messages
+
+    Returns:
+        Export file contents as UTF-8 bytes
+    """
+    rng = random.Random(seed)
+    ts = datetime(2018, 1, 1, 8, 0)
+    lines = []
+    for i in range(n_messages):
+        ts += timedelta(minutes=rng.choice([0, 1, 1, 2, 5, 30, 240, 600]))
+        stamp = f"{ts.month}/{ts.day}/{ts.strftime('%y')}, {ts.strftime('%I:%M %p').lstrip('0')}"
+        if i % 20 == 0:
+            body = rng.choice(SPECIAL)
+        else:
+            body = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 12)))
+        lines.append(f"{stamp} - {rng.choice(AUTHORS)}: {body}")
+        if multiline_every and i % multiline_every == 0:
+            lines.append("and a second line")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class Timer:
+    """Context manager measuring wall time in seconds."""
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.seconds = time.perf_counter() - self.start
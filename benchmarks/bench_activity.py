@@ -0,0 +1,85 @@
+"""
+Benchmark activity() without the author x day cross-join.
+
+Compares the previous activity(), which merged every distinct day with
+every author and left-joined a per-day groupby, with counting the distinct
+(author, day) pairs directly. The chat is a synthetic group with many
+members over several years, where the cross-join is largest. Both
+variants must produce identical results.
+"""
+
+import argparse
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from _common import Timer
+
+
+def _old_activity(df):
+    """activity() as it was, with the author x day cross-join."""
+    distinct_dates = df[["day"]].drop_duplicates()
+    distinct_authors = df[["author"]].drop_duplicates()
+    distinct_authors['key'] = 1
+    distinct_dates['key'] = 1
+    distinct_dates = pd.merge(distinct_dates, distinct_authors, on="key", how="left").drop("key", axis=1)
+    activity_df = pd.DataFrame(df.groupby(["author", "day"], observed=True)["words"].nunique()).reset_index()
+    activity_df["start_date"] = activity_df.groupby(["author"], observed=True)["day"].transform("min")
+    activity_df["is_active"] = np.where(activity_df['words'] > 0, 1, 0)
+    distinct_dates = pd.merge(distinct_dates, activity_df, on=["day", "author"], how="left")
+    distinct_dates["max_date"] = df["day"].max()
+    distinct_dates["date_diff"] = distinct_dates['max_date'] - distinct_dates['start_date']
+    o = distinct_dates.groupby("author", as_index=False, observed=True).agg({"is_active": "sum", "date_diff": "max"})
+    o["is_active_percent"] = 100 * (o["is_active"] / o["date_diff"])
+    return o.reset_index().drop(["is_active", "date_diff"], axis=1).rename(columns={"is_active_percent": "Activity %"})
+
+
+def _group_chat(n_messages, n_authors, years, seed=0):
+    """Messages of a large group, authors joining at different times."""
+    rng = np.random.default_rng(seed)
+    first_day = np.datetime64("2016-01-01").astype(np.int64)
+    span = 365 * years
+    joined = rng.integers(0, span, n_authors)
+    authors = rng.integers(0, n_authors, n_messages)
+    days = joined[authors] + (rng.random(n_messages) * (span - joined[authors])).astype(np.int64)
+    return pd.DataFrame({
+        "author": pd.Index([f"Member {i:03d}" for i in range(n_authors)])[authors],
+        "day": (first_day + days).astype(np.int32),
+        "words": rng.integers(1, 12, n_messages),
+    })
+
+
+def _measure(func, df):
+    """Run func(df), returning its result, wall seconds and peak MB."""
+    tracemalloc.start()
+    with Timer() as timer:
+        result = func(df)
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return result, timer.seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--authors", type=int, default=300)
+    parser.add_argument("--years", type=int, default=8)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.analyzers import activity
+
+    df = _group_chat(args.messages, args.authors, args.years)
+
+    old, old_seconds, old_peak = _measure(_old_activity, df)
+    new, new_seconds, new_peak = _measure(activity, df)
+    pd.testing.assert_frame_equal(old, new, check_dtype=False)
+
+    print(f"{len(df)} messages, {args.authors} authors, {df['day'].nunique()} days, identical results")
+    print(f"{'variant':<12} {'seconds':>9} {'peak MB':>9}")
+    print(f"{'cross-join':<12} {old_seconds:>9.2f} {old_peak:>9.1f}")
+    print(f"{'pairs':<12} {new_seconds:>9.2f} {new_peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
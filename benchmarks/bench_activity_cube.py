@@ -0,0 +1,132 @@
+"""
+Benchmark the temporal analyzers as reductions of the shared activity cube.
+
+Compares the previous per-analyzer groupbys over the message frame with
+building the ActivityCube once and reducing it in every analyzer. Both
+variants must produce identical tables.
+"""
+
+import argparse
+import io
+
+import pandas as pd
+from scipy.ndimage import gaussian_filter
+
+from _common import Timer, generate_chat
+
+
+def _old_day_of_week(df):
+    """activity_day_of_week_ts() table as it was."""
+    return df.groupby([df.timestamp.dt.dayofweek, df.author], observed=True)['msg_length'].sum().unstack(fill_value=0)
+
+
+def _old_time_of_day(df):
+    """activity_time_of_day_ts() table as it was."""
+    a = df.groupby(
+        [df.timestamp.dt.hour, df.timestamp.dt.minute, 'author'], observed=True
+    )['msg_length'].sum().unstack(fill_value=0)
+    return a.reindex(pd.MultiIndex.from_product([range(24), range(60)], names=['hour', 'minute']), fill_value=0)
+
+
+def _old_smoothed_activity(df, years=3):
+    """smoothed_daily_activity() as it was."""
+    min_year = df.year.max() - years
+    daily = df.loc[df["year"] > min_year].groupby(
+        ['author', 'timestamp'], observed=True
+    )['msg_length'].first().unstack(level=0).resample('D').sum().fillna(0)
+    return pd.DataFrame(gaussian_filter(daily, (6, 0)), index=daily.index, columns=daily.columns)
+
+
+def _old_heatmap_counts(df):
+    """heatmap() message counts per day as they were (before day ordinals)."""
+    return df.groupby(df['timestamp'].dt.date)['message'].count()
+
+
+def _old_monthly(df):
+    """analyze_monthly_messages() table as it was."""
+    df = df.copy()
+    df['YearMonth'] = df['timestamp'].dt.to_period('M')
+    df['year'] = df['timestamp'].dt.year
+    return df.groupby('YearMonth').agg({'message': 'count', 'year': 'first'}).reset_index()
+
+
+def _old_time_data(df):
+    """prepare_time_data() as it was."""
+    df = df.copy()
+    df["yearmonth"] = df["timestamp"].dt.to_period('M')
+    return df.groupby(["yearmonth", "author"], observed=True).size().unstack(fill_value=0).sort_index()
+
+
+def _old_year_month(df):
+    """year_month() as it was."""
+    df = df.copy()
+    df['YearMonth'] = df.timestamp.dt.year * 100 + df.timestamp.dt.month
+    year_content = df.groupby(["year", 'YearMonth'], as_index=False).count()[["year", 'YearMonth', 'message']]
+    return year_content.sort_values('YearMonth')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.analyzers import (
+        activity_day_of_week_ts,
+        activity_time_of_day_ts,
+        analyze_monthly_messages,
+        heatmap,
+        prepare_time_data,
+        smoothed_daily_activity,
+        year_month,
+    )
+    from whatsapp_analyzer.analyzers.activity_cube import activity_cube, cube_matrix
+    from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+    from whatsapp_analyzer.preprocessors import preprocess_chat
+    from whatsapp_analyzer.utils.dates import ordinal_weekdays
+
+    raw = parse_stream(io.BytesIO(generate_chat(args.messages)))
+    df, _ = preprocess_chat(raw, "English")
+
+    with Timer() as old_timer:
+        old = {
+            "day of week": _old_day_of_week(df),
+            "time of day": _old_time_of_day(df),
+            "smoothed activity": _old_smoothed_activity(df),
+            "heatmap": _old_heatmap_counts(df),
+            "monthly": _old_monthly(df),
+            "time data": _old_time_data(df),
+            "year month": _old_year_month(df),
+        }
+
+    with Timer() as build_timer:
+        cube = activity_cube(df)
+    with Timer() as new_timer:
+        activity_day_of_week_ts(df)
+        activity_time_of_day_ts(df)
+        smoothed = smoothed_daily_activity(df)
+        heatmap_data = heatmap(df).data
+        monthly = analyze_monthly_messages(df)
+        time_data = prepare_time_data(df)
+        year_content = year_month(df)
+
+    weekdays = ordinal_weekdays(cube.day)
+    day_of_week = cube_matrix(cube, weekdays, 7, cube.msg_length)
+    minute_of_day = cube.hour.astype(int) * 60 + cube.minute
+    assert (old["day of week"].to_numpy() == day_of_week[sorted(set(weekdays))]).all()
+    assert (old["time of day"].to_numpy() == cube_matrix(cube, minute_of_day, 24 * 60, cube.msg_length)).all()
+    pd.testing.assert_frame_equal(old["smoothed activity"], smoothed)
+    recent = old["heatmap"][-len(heatmap_data):]
+    assert recent.tolist() == heatmap_data["message"].tolist()
+    assert old["monthly"]["message"].tolist() == monthly["chart"].data["message"].tolist()
+    pd.testing.assert_frame_equal(old["time data"], time_data, check_column_type=False)
+    assert old["year month"].to_numpy().tolist() == year_content.to_numpy().tolist()
+
+    print(f"{len(df)} messages, {len(cube.author)} cube cells, identical results")
+    print(f"{'step':<28} {'seconds':>9}")
+    print(f"{'groupbys (before)':<28} {old_timer.seconds:>9.2f}")
+    print(f"{'build cube':<28} {build_timer.seconds:>9.2f}")
+    print(f"{'analyzers on the cube':<28} {new_timer.seconds:>9.2f}  (including their charts)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the daily activity series on the shared days x authors matrix.
+
+Compares the previous smoothed_daily_activity() and relative_activity_ts(),
+which each filtered the frame to the years window, unstacked it at
+timestamp resolution and resampled to days, with slicing the frame's
+cached daily activity matrix and smoothing all authors in one pass. The
+chat is a synthetic group with many members over several years. Both
+variants must produce identical results.
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+from scipy.ndimage import gaussian_filter
+
+from _common import Timer
+
+
+def _old_smoothed(df, years):
+    """smoothed_daily_activity() as it was."""
+    min_year = df.year.max() - years
+    daily = df.loc[df["year"] > min_year].groupby(
+        ['author', 'timestamp'], observed=True
+    )['msg_length'].first().unstack(level=0).resample('D').sum().fillna(0)
+    return pd.DataFrame(gaussian_filter(daily, (6, 0)), index=daily.index, columns=daily.columns)
+
+
+def _old_relative(df, years):
+    """relative_activity_ts() as it was."""
+    smoothed = _old_smoothed(df, years)
+    return smoothed.div(smoothed.sum(axis=1), axis=0)
+
+
+def _group_chat(n_messages, n_authors, years, seed=0):
+    """Messages of a large group at minute resolution."""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2016-01-01T00:00", "m").astype(np.int64)
+    minutes = np.sort(rng.integers(0, years * 365 * 24 * 60, n_messages))
+    timestamps = pd.to_datetime((start + minutes).astype("datetime64[m]"))
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "author": pd.Index([f"Member {i:03d}" for i in range(n_authors)])[rng.integers(0, n_authors, n_messages)],
+        "msg_length": rng.integers(1, 80, n_messages).astype(float),
+        "year": timestamps.year,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--authors", type=int, default=300)
+    parser.add_argument("--years", type=int, default=8)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.analyzers import relative_activity_ts, smoothed_daily_activity
+
+    df = _group_chat(args.messages, args.authors, args.years)
+
+    with Timer() as old_timer:
+        old_smoothed = _old_smoothed(df, 3)
+        old_relative = _old_relative(df, 3)
+    with Timer() as first_timer:
+        smoothed = smoothed_daily_activity(df, 3)
+        relative = relative_activity_ts(df, 3)
+    with Timer() as cached_timer:
+        smoothed_daily_activity(df, 5)
+        relative_activity_ts(df, 5)
+    pd.testing.assert_frame_equal(old_smoothed, smoothed)
+    pd.testing.assert_frame_equal(old_relative, relative)
+
+    print(f"{len(df)} messages, {args.authors} authors, identical results")
+    print(f"{'both series':<36} {'seconds':>9}")
+    print(f"{'groupby, unstack, resample (before)':<36} {old_timer.seconds:>9.2f}")
+    print(f"{'daily matrix, first call':<36} {first_timer.seconds:>9.2f}")
+    print(f"{'daily matrix, cached':<36} {cached_timer.seconds:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
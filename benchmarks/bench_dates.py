@@ -0,0 +1,95 @@
+"""
+Benchmark calendar days stored as a datetime64 date and an int32 ordinal.
+
+Compares the previous string dates (``strftime('%Y-%m-%d')`` during
+preprocessing, parsed again with ``pd.to_datetime`` in activity() and
+regrouped by ``dt.date`` in heatmap()) with the day columns now stored by
+preprocess_timestamps() and the np.bincount aggregation over day ordinals.
+Both variants must produce identical results.
+"""
+
+import argparse
+import io
+
+import numpy as np
+import pandas as pd
+
+from _common import Timer, generate_chat
+
+
+def _old_activity(df):
+    """activity() as it was, over string dates."""
+    distinct_dates = df[["date"]].drop_duplicates()
+    distinct_authors = df[["author"]].drop_duplicates()
+    distinct_authors['key'] = 1
+    distinct_dates['key'] = 1
+    distinct_dates = pd.merge(distinct_dates, distinct_authors, on="key", how="left").drop("key", axis=1)
+    activity_df = pd.DataFrame(df.groupby(["author", "date"], observed=True)["words"].nunique()).reset_index()
+    activity_df["start_date"] = activity_df.groupby(["author"], observed=True)["date"].transform("min")
+    activity_df["is_active"] = np.where(activity_df['words'] > 0, 1, 0)
+    distinct_dates = pd.merge(distinct_dates, activity_df, on=["date", "author"], how="left")
+    distinct_dates["max_date"] = df.date.max()
+    distinct_dates[['max_date', 'start_date']] = distinct_dates[['max_date', 'start_date']].apply(pd.to_datetime)
+    distinct_dates["date_diff"] = (distinct_dates['max_date'] - distinct_dates['start_date']).dt.days
+    o = distinct_dates.groupby("author", as_index=False, observed=True).agg({"is_active": "sum", "date_diff": "max"})
+    o["is_active_percent"] = 100 * (o["is_active"] / o["date_diff"])
+    return o.reset_index().drop(["is_active", "date_diff"], axis=1).rename(columns={"is_active_percent": "Activity %"})
+
+
+def _old_heatmap_data(df):
+    """heatmap() table as it was, grouped by dt.date."""
+    df = df.copy()
+    df['date'] = df['timestamp'].dt.date
+    df['weekday'] = df['timestamp'].dt.weekday
+    df['week'] = df['timestamp'].dt.isocalendar().week
+    df['year'] = df['timestamp'].dt.year
+    df = df[df['year'] >= df['year'].max() - 1]
+    return df.groupby(['date', 'weekday', 'week', 'year'])['message'].count().reset_index()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.analyzers import activity, heatmap
+    from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+    from whatsapp_analyzer.preprocessors import preprocess_chat
+    from whatsapp_analyzer.utils.dates import day_ordinals
+
+    raw = parse_stream(io.BytesIO(generate_chat(args.messages)))
+    df, _ = preprocess_chat(raw, "English")
+    timestamps = df["timestamp"]
+
+    with Timer() as old_derive_timer:
+        old_dates = timestamps.dt.strftime('%Y-%m-%d')
+    with Timer() as new_derive_timer:
+        timestamps.to_numpy().astype("datetime64[D]")
+        day_ordinals(timestamps)
+    old_df = df.assign(date=old_dates)
+
+    with Timer() as old_activity_timer:
+        old_activity = _old_activity(old_df)
+    with Timer() as new_activity_timer:
+        new_activity = activity(df)
+    pd.testing.assert_frame_equal(old_activity, new_activity, check_dtype=False)
+
+    with Timer() as old_heatmap_timer:
+        old_heatmap = _old_heatmap_data(old_df)
+    with Timer() as new_heatmap_timer:
+        new_heatmap = heatmap(df).data
+    assert old_heatmap["message"].tolist() == new_heatmap["message"].tolist()
+    assert [str(day) for day in old_heatmap["date"]] == new_heatmap["date"].dt.strftime('%Y-%m-%d').tolist()
+
+    print(f"{len(df)} messages, {df['day'].nunique()} days, identical results")
+    print(f"{'step':<22} {'before':>9} {'after':>9}")
+    for step, before, after in [
+        ("derive date", old_derive_timer, new_derive_timer),
+        ("activity()", old_activity_timer, new_activity_timer),
+        ("heatmap() table", old_heatmap_timer, new_heatmap_timer),
+    ]:
+        print(f"{step:<22} {before.seconds:>9.2f} {after.seconds:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
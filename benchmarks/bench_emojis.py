@@ -0,0 +1,59 @@
+"""
+Benchmark emoji scanning for preprocessing and the emoji table.
+
+Compares the previous approach (one per-row ``apply`` regex search for the
+is_emoji flag, then a second scan of every message for the top-emoji
+table) with the shared engine, which scans once during preprocessing and
+serves the flag, the top-emoji table and per-author stats from the stored
+result. The old regex counts code points, not emojis, so only the timings
+are compared.
+"""
+
+import argparse
+import io
+import re
+from collections import Counter
+
+from _common import Timer, generate_chat
+
+_OLD_PATTERN = re.compile(
+    "[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251]+"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=500_000)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.analyzers import emoji_stats_by_author, get_most_used_emoji
+    from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+    from whatsapp_analyzer.preprocessors import process_emojis
+
+    df = parse_stream(io.BytesIO(generate_chat(args.messages)))
+
+    with Timer() as old_flag_timer:
+        df["message"].apply(lambda x: bool(_OLD_PATTERN.search(x)) if isinstance(x, str) else False)
+    with Timer() as old_table_timer:
+        all_emojis = " ".join(df["message"].astype(str).apply(lambda s: "".join(_OLD_PATTERN.findall(s))))
+        Counter(all_emojis).most_common(10)
+
+    with Timer() as scan_timer:
+        processed = process_emojis(df)
+    with Timer() as table_timer:
+        get_most_used_emoji(processed)
+    with Timer() as authors_timer:
+        emoji_stats_by_author(processed)
+
+    print(f"{len(df)} messages, {int(processed['is_emoji'].sum())} with emojis")
+    print(f"{'step':<26} {'seconds':>9}")
+    print(f"{'flag, apply (before)':<26} {old_flag_timer.seconds:>9.2f}")
+    print(f"{'top table, rescan (before)':<26} {old_table_timer.seconds:>9.2f}")
+    print(f"{'shared scan + flag':<26} {scan_timer.seconds:>9.2f}")
+    print(f"{'top table from scan':<26} {table_timer.seconds:>9.2f}")
+    print(f"{'per-author stats from scan':<26} {authors_timer.seconds:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark word and letter counting for read_file().
+
+Compares the previous per-row ``apply`` lambdas with the pandas string
+accessor and with the counts the parser now derives while assembling each
+message (the extra work in parse_lines is one ``str.count`` and one ``len``
+per message). All variants must produce identical counts.
+"""
+
+import argparse
+import io
+
+import pandas as pd
+
+from _common import Timer, generate_chat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+
+    df = parse_stream(io.BytesIO(generate_chat(args.messages)))
+    messages = df["message"]
+
+    with Timer() as apply_timer:
+        apply_words = messages.apply(lambda s: len(s.split(" ")))
+        apply_letters = messages.apply(len)
+
+    with Timer() as accessor_timer:
+        accessor_words = messages.str.count(" ") + 1
+        accessor_letters = messages.str.len()
+
+    with Timer() as in_pass_timer:
+        words, letters = [], []
+        for body in messages.tolist():
+            words.append(body.count(" ") + 1)
+            letters.append(len(body))
+
+    for counts in (apply_words, accessor_words, pd.Series(words)):
+        assert counts.tolist() == df["words"].tolist()
+    for counts in (apply_letters, accessor_letters, pd.Series(letters)):
+        assert counts.tolist() == df["letters"].tolist()
+
+    print(f"{len(df)} messages, identical counts in all variants")
+    print(f"{'variant':<16} {'seconds':>9}")
+    print(f"{'apply (before)':<16} {apply_timer.seconds:>9.2f}")
+    print(f"{'str accessor':<16} {accessor_timer.seconds:>9.2f}")
+    print(f"{'in parse pass':<16} {in_pass_timer.seconds:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark the native WhatsApp parser against the chat-miner temp-file path.
+
+The parallel mode uses one worker per CPU.
+
+Each parser runs in a fresh subprocess so peak RSS (ru_maxrss) is measured
+for that parser alone.
+"""
+
+import argparse
+import io
+import logging
+import multiprocessing
+import resource
+import tempfile
+
+from _common import Timer, generate_chat
+
+
+def _chatminer(data: bytes):
+    from chatminer.chatparsers import WhatsAppParser
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.NamedTemporaryFile(mode="wb") as temp:
+        temp.write(data)
+        temp.flush()
+        parser = WhatsAppParser(temp.name)
+        parser.parse_file()
+        return parser.parsed_messages.get_df(as_pandas=True)
+
+
+def _native(data: bytes):
+    from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+
+    return parse_stream(io.BytesIO(data))
+
+
+def _parallel(data: bytes):
+    from whatsapp_analyzer.parsers.chunked_parser import parse_bytes_parallel
+
+    return parse_bytes_parallel(data)
+
+
+PARSERS = {"chatminer": _chatminer, "native": _native, "parallel": _parallel}
+
+
+def _run(name: str, n_messages: int, queue):
+    data = generate_chat(n_messages)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    with Timer() as timer:
+        df = PARSERS[name](data)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((name, len(df), timer.seconds, (peak - baseline) / 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200_000)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    print(f"{'parser':<10} {'rows':>10} {'seconds':>9} {'peak RSS +MB':>13}")
+    for name in PARSERS:
+        proc = ctx.Process(target=_run, args=(name, args.messages, queue))
+        proc.start()
+        name, rows, seconds, rss_mb = queue.get()
+        proc.join()
+        print(f"{name:<10} {rows:>10} {seconds:>9.2f} {rss_mb:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
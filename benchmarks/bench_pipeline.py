@@ -0,0 +1,44 @@
+"""
+Benchmark preprocess_data: wall time and peak traced memory.
+
+Peak memory is measured with tracemalloc on top of the raw frame that is
+already in memory, and also reported relative to the size of the
+processed frame.
+"""
+
+import argparse
+import io
+import tracemalloc
+
+from _common import Timer, generate_chat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=500_000)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+    from whatsapp_analyzer.preprocessors import preprocess_data
+    from whatsapp_analyzer.preprocessors.schema import memory_usage_mb
+
+    raw = parse_stream(io.BytesIO(generate_chat(args.messages)))
+    raw.insert(3, "weekday", raw["timestamp"].dt.strftime("%A"))
+    raw.insert(4, "hour", raw["timestamp"].dt.hour)
+    authors = raw["author"].unique().tolist()
+
+    tracemalloc.start()
+    with Timer() as timer:
+        df, _ = preprocess_data(raw, "English", authors)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    frame_mb = memory_usage_mb(df)
+    peak_mb = peak / (1024 * 1024)
+    print(f"{len(df)} messages in {timer.seconds:.2f} s")
+    print(f"processed frame: {frame_mb:.1f} MB")
+    print(f"peak allocated:  {peak_mb:.1f} MB ({peak_mb / frame_mb:.2f}x frame)")
+
+
+if __name__ == "__main__":
+    main()
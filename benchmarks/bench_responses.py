@@ -0,0 +1,81 @@
+"""
+Benchmark the response analyzers on the shared reply-event table.
+
+Compares the previous analyze_response_time() and response_matrix(),
+which each copied the frame and recomputed the time gaps, the same-author
+flag and the self-reply filter, with building the reply events once. The
+chat is a synthetic group with many members. The medians and the
+response shares must be identical. No two messages share a timestamp,
+so the old sort by timestamp and author keeps the frame order that the
+reply events use.
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from _common import Timer
+
+
+def _old_medians(df):
+    """analyze_response_time() medians as they were."""
+    df = df.sort_values(["timestamp", "author"]).copy()
+    df['time_diff'] = df['timestamp'].diff().dt.total_seconds()
+    df['same_author'] = df['author'] == df['author'].shift()
+    response_data = df[~((df['time_diff'] < 180) & df['same_author'])].copy()
+    response_data['response_time'] = response_data['time_diff'] / 60
+    response_data['log_response_time'] = np.log10(response_data['response_time'])
+    return response_data.groupby('author', observed=True)['response_time'].median().reset_index()
+
+
+def _old_matrix(df):
+    """response_matrix() shares as they were."""
+    df = df.copy()
+    df['time_diff'] = df['timestamp'].diff().dt.total_seconds()
+    df['same_author'] = df['author'] == df['author'].shift()
+    response_data = df[~((df['time_diff'] < 180) & df['same_author'])]
+    return pd.crosstab(response_data['author'], response_data['author'].shift(), normalize='index')
+
+
+def _group_chat(n_messages, n_authors, seed=0):
+    """Messages of a large group, a few minutes apart on average and never at the same minute."""
+    rng = np.random.default_rng(seed)
+    gaps = rng.choice([1, 1, 1, 2, 5, 30, 240], n_messages)
+    timestamps = pd.Timestamp("2018-01-01") + pd.to_timedelta(np.cumsum(gaps), unit="min")
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "author": pd.Index([f"Member {i:03d}" for i in range(n_authors)])[rng.integers(0, n_authors, n_messages)],
+        "message": "hello",
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=2_000_000)
+    parser.add_argument("--authors", type=int, default=300)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.analyzers import analyze_response_time, response_matrix
+
+    df = _group_chat(args.messages, args.authors)
+
+    with Timer() as old_timer:
+        old_medians = _old_medians(df)
+        old_matrix = _old_matrix(df)
+    with Timer() as new_timer:
+        medians = analyze_response_time(df)["median_chart"].data
+        matrix = response_matrix(df).data.pivot(index="author", columns="responding_to", values="response_rate")
+
+    assert old_medians["author"].tolist() == medians["author"].astype(str).tolist()
+    assert np.allclose(old_medians["response_time"], medians["response_time"])
+    assert np.allclose(old_matrix.to_numpy(), matrix.loc[old_matrix.index, old_matrix.columns].to_numpy())
+
+    print(f"{len(df)} messages, {args.authors} authors, identical results")
+    print(f"{'both analyzers':<28} {'seconds':>9}")
+    print(f"{'separate passes (before)':<28} {old_timer.seconds:>9.2f}")
+    print(f"{'shared reply events':<28} {new_timer.seconds:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
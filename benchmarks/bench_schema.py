@@ -0,0 +1,45 @@
+"""
+Benchmark memory use of the preprocessed frame with and without the
+compact schema (see whatsapp_analyzer.preprocessors.schema).
+"""
+
+import argparse
+import io
+
+from _common import Timer, generate_chat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=500_000)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+    from whatsapp_analyzer.preprocessors import preprocess_data
+    from whatsapp_analyzer.preprocessors.schema import memory_usage_mb, to_compact_schema
+
+    raw = parse_stream(io.BytesIO(generate_chat(args.messages)))
+    raw.insert(3, "weekday", raw["timestamp"].dt.strftime("%A"))
+    raw.insert(4, "hour", raw["timestamp"].dt.hour)
+    df, _ = preprocess_data(raw, "English", raw["author"].unique().tolist())
+
+    with Timer() as timer:
+        compact = to_compact_schema(df)
+
+    default_mb = memory_usage_mb(df)
+    compact_mb = memory_usage_mb(compact)
+    print(f"{len(df)} messages, conversion took {timer.seconds:.2f} s")
+    print(f"{'schema':<10} {'MB':>10}")
+    print(f"{'default':<10} {default_mb:>10.1f}")
+    print(f"{'compact':<10} {compact_mb:>10.1f}")
+    print(f"reduction: {100 * (1 - compact_mb / default_mb):.1f}%")
+
+    print(f"\n{'column':<24} {'default MB':>11} {'compact MB':>11}")
+    default_columns = df.memory_usage(deep=True, index=False) / (1024 * 1024)
+    compact_columns = compact.memory_usage(deep=True, index=False) / (1024 * 1024)
+    for column in df.columns:
+        print(f"{column:<24} {default_columns[column]:>11.1f} {compact_columns[column]:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark activity_time_of_day_ts() with circular smoothing on the cube.
+
+Compares the previous three-key groupby, padded with 120 minutes on each
+side before a sigma-60 gaussian_filter, with the per-minute histogram of
+the activity cube smoothed in wrap mode. The smoothing kernel reaches 240
+minutes, so the old padding only gave correct values from 02:00 to 22:00.
+The two variants must agree there. Near midnight only the new one is
+circular.
+"""
+
+import argparse
+import io
+
+import numpy as np
+import pandas as pd
+from scipy.ndimage import gaussian_filter
+
+from _common import Timer, generate_chat
+
+
+def _old_smoothed(df):
+    """activity_time_of_day_ts() table as it was."""
+    a = df.groupby(
+        [df.timestamp.dt.hour, df.timestamp.dt.minute, 'author'], observed=True
+    )['msg_length'].sum().unstack(fill_value=0)
+    a = a.reindex(pd.MultiIndex.from_product([range(24), range(60)], names=['hour', 'minute']), fill_value=0)
+    a = pd.concat([a.tail(120), a, a.head(120)])
+    smoothed = pd.DataFrame(gaussian_filter(a.values, (60, 0)), index=a.index, columns=a.columns)
+    return smoothed.iloc[120:-120]
+
+
+def _chart_table(chart):
+    """Minutes by authors table of a time of day chart."""
+    return chart.data.pivot(index=['hour', 'minute'], columns='author', values='activity')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from whatsapp_analyzer.analyzers import activity_time_of_day_ts
+    from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+    from whatsapp_analyzer.preprocessors import preprocess_chat
+
+    raw = parse_stream(io.BytesIO(generate_chat(args.messages)))
+    df, _ = preprocess_chat(raw, "English")
+
+    with Timer() as old_timer:
+        old = _old_smoothed(df)
+    with Timer() as first_timer:
+        new = _chart_table(activity_time_of_day_ts(df))
+    with Timer() as rerun_timer:
+        for bandwidth in (20, 40, 90, 120):
+            activity_time_of_day_ts(df, bandwidth=bandwidth)
+
+    old_values = old.to_numpy()
+    new_values = new[list(old.columns)].to_numpy()
+    daytime = slice(120, 24 * 60 - 120)
+    assert np.allclose(old_values[daytime], new_values[daytime])
+    midnight_difference = np.abs(old_values - new_values).max() / old_values.max()
+
+    print(f"{len(df)} messages, identical from 02:00 to 22:00, "
+          f"up to {midnight_difference:.1%} apart near midnight")
+    print(f"{'step':<34} {'seconds':>9}")
+    print(f"{'groupby and padded filter (before)':<34} {old_timer.seconds:>9.2f}")
+    print(f"{'first call (builds the cube)':<34} {first_timer.seconds:>9.2f}")
+    print(f"{'re-run per bandwidth':<34} {rerun_timer.seconds / 4:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,7 +30,12 @@ def __getattr__(name):
 
 _PREPROCESSOR_EXPORTS = {
     "get_language_settings",
+    "detect_languages",
     "preprocess_data",
+    "preprocess_chat",
+    "select_authors",
+    "build_sessions",
+    "PipelineCache",
     "preprocess_timestamps",
     "process_multimedia",
     "process_emojis",
@@ -40,6 +45,7 @@ _PREPROCESSOR_EXPORTS = {
     "filter_authors",
     "add_conversation_starter_flag",
     "add_year_week",
+    "to_compact_schema",
     "SUPPORTED_LANGUAGES",
 }
 
@@ -54,13 +60,16 @@ _ANALYZER_EXPORTS = {
     "calculate_author_stats",
     "analyze_response_time",
     "response_matrix",
+    "reply_events",
     "find_longest_consecutive_streak",
+    "conversation_stats",
     "get_message_count_by_author",
     "activity_time_of_day_ts",
     "activity_day_of_week_ts",
     "heatmap",
     "word_stats",
     "get_most_used_emoji",
+    "emoji_stats_by_author",
     "analyze_monthly_messages",
     "get_activity_stats",
 }
@@ -77,8 +86,13 @@ __all__ = [
     "read_file",
     # Preprocessors
     "get_language_settings",
+    "detect_languages",
     "SUPPORTED_LANGUAGES",
     "preprocess_data",
+    "preprocess_chat",
+    "select_authors",
+    "build_sessions",
+    "PipelineCache",
     "preprocess_timestamps",
     "process_multimedia",
     "process_emojis",
@@ -88,6 +102,7 @@ __all__ = [
     "filter_authors",
     "add_conversation_starter_flag",
     "add_year_week",
+    "to_compact_schema",
     # Analyzers
     "basic_stats",
     "stats_overall",
@@ -99,13 +114,16 @@ __all__ = [
     "calculate_author_stats",
     "analyze_response_time",
     "response_matrix",
+    "reply_events",
     "find_longest_consecutive_streak",
+    "conversation_stats",
     "get_message_count_by_author",
     "activity_time_of_day_ts",
     "activity_day_of_week_ts",
     "heatmap",
     "word_stats",
     "get_most_used_emoji",
+    "emoji_stats_by_author",
     "analyze_monthly_messages",
     "get_activity_stats",
     # Visualizations
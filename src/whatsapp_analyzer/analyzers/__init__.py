@@ -17,15 +17,19 @@ from whatsapp_analyzer.analyzers.trend_analyzer import (
     trendline,
 )
 from whatsapp_analyzer.analyzers.response_analyzer import (
+    SELF_REPLY_GAP,
+    reply_events,
     analyze_response_time,
     response_matrix,
 )
 from whatsapp_analyzer.analyzers.streak_analyzer import find_longest_consecutive_streak
+from whatsapp_analyzer.analyzers.session_analyzer import conversation_stats
 from whatsapp_analyzer.analyzers.message_counter import (
     get_message_count_by_author,
     get_most_active_author,
 )
 from whatsapp_analyzer.analyzers.temporal_analyzer import (
+    TIME_OF_DAY_BANDWIDTH,
     activity_time_of_day_ts,
     activity_day_of_week_ts,
     heatmap,
@@ -34,6 +38,7 @@ from whatsapp_analyzer.analyzers.temporal_analyzer import (
 from whatsapp_analyzer.analyzers.content_analyzer import (
     word_stats,
     get_most_used_emoji,
+    emoji_stats_by_author,
     extract_emojis,
     analyze_monthly_messages,
 )
@@ -52,17 +57,22 @@ __all__ = [
     "calculate_messaging_trends",
     "analyze_trend",
     "trendline",
+    "SELF_REPLY_GAP",
+    "reply_events",
     "analyze_response_time",
     "response_matrix",
     "find_longest_consecutive_streak",
+    "conversation_stats",
     "get_message_count_by_author",
     "get_most_active_author",
+    "TIME_OF_DAY_BANDWIDTH",
     "activity_time_of_day_ts",
     "activity_day_of_week_ts",
     "heatmap",
     "year_month",
     "word_stats",
     "get_most_used_emoji",
+    "emoji_stats_by_author",
     "extract_emojis",
     "analyze_monthly_messages",
 ]
@@ -5,15 +5,23 @@ Activity analysis for WhatsApp chat data.
 import numpy as np
 import pandas as pd
 import altair as alt
-from scipy.ndimage import gaussian_filter
+from scipy.ndimage import gaussian_filter1d
 
+from whatsapp_analyzer.analyzers.activity_cube import daily_activity
+from whatsapp_analyzer.utils.dates import MISSING_DAY, days_of
+from whatsapp_analyzer.utils.profiling import profiled
 
+
+@profiled("analyzer.activity")
 def activity(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate activity percentage for each author.
 
     Activity is defined as the percentage of days (since first message)
-    on which the author sent at least one message.
+    on which the author sent at least one message. It is computed from
+    the distinct (author, day ordinal) pairs of the messages, so the work
+    and memory grow with the number of active days rather than with
+    authors times days.
 
     Args:
         df: Preprocessed DataFrame
@@ -21,46 +29,36 @@ def activity(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with author and Activity % columns
     """
-    distinct_dates = df[["date"]].drop_duplicates()
-    distinct_authors = df[["author"]].drop_duplicates()
-    distinct_authors['key'] = 1
-    distinct_dates['key'] = 1
-    distinct_dates = pd.merge(
-        distinct_dates, distinct_authors,
-        on="key",
-        how="left"
-    ).drop("key", axis=1)
-
-    activity_df = pd.DataFrame(
-        df.groupby(["author", "date"])["words"].nunique()
-    ).reset_index()
-    activity_df["start_date"] = activity_df.groupby(["author"])["date"].transform("min")
-    activity_df["is_active"] = np.where(activity_df['words'] > 0, 1, 0)
-
-    distinct_dates = pd.merge(
-        distinct_dates, activity_df,
-        on=["date", "author"],
-        how="left"
-    )
-    distinct_dates["max_date"] = df.date.max()
-    distinct_dates[['max_date', 'start_date']] = distinct_dates[
-        ['max_date', 'start_date']
-    ].apply(pd.to_datetime)
-    distinct_dates["date_diff"] = (
-        distinct_dates['max_date'] - distinct_dates['start_date']
-    ).dt.days
-
-    o = distinct_dates.groupby("author", as_index=False).agg({
-        "is_active": "sum",
-        "date_diff": "max"
+    days = days_of(df)
+    has_day = days != MISSING_DAY
+    codes, authors = pd.factorize(df["author"][has_day], sort=True)
+    has_author = codes >= 0
+    days = days[has_day][has_author]
+    has_words = df["words"].notna().to_numpy()[has_day][has_author]
+
+    first_day = days.min() if len(days) else 0
+    span = int(days.max()) - first_day + 1 if len(days) else 1
+    pairs = codes[has_author].astype(np.int64) * span + (days - first_day)
+
+    # Pairs are sorted by author, then day, so each author's first pair
+    # holds the author's first day
+    author_days = np.unique(pairs)
+    first_pairs = np.searchsorted(author_days, np.arange(len(authors)) * span)
+    date_diff = (span - 1) - author_days[first_pairs] % span
+
+    # A day counts as active if the author sent a message with words
+    active_days = np.bincount(np.unique(pairs[has_words]) // span, minlength=len(authors))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        active_percent = 100 * (active_days / date_diff)
+
+    return pd.DataFrame({
+        "index": np.arange(len(authors)),
+        "author": authors,
+        "Activity %": active_percent,
     })
-    o["is_active_percent"] = 100 * (o["is_active"] / o["date_diff"])
-
-    return o.reset_index().drop(["is_active", "date_diff"], axis=1).rename(
-        columns={"is_active_percent": "Activity %"}
-    )
 
 
+@profiled("analyzer.smoothed_daily_activity")
 def smoothed_daily_activity(df: pd.DataFrame, years: int = 3) -> pd.DataFrame:
     """
     Calculate Gaussian-smoothed daily activity.
@@ -72,23 +70,10 @@ def smoothed_daily_activity(df: pd.DataFrame, years: int = 3) -> pd.DataFrame:
     Returns:
         Smoothed daily activity DataFrame
     """
-    df = df.copy()
-    df["year"] = df["timestamp"].dt.year
-    min_year = df.year.max() - years
-
-    daily_activity_df = df.loc[df["year"] > min_year].groupby(
-        ['author', 'timestamp']
-    ).first().unstack(level=0).resample('D').sum().msg_length.fillna(0)
-
-    smoothed_daily_activity_df = pd.DataFrame(
-        gaussian_filter(daily_activity_df, (6, 0)),
-        index=daily_activity_df.index,
-        columns=daily_activity_df.columns
-    )
-
-    return smoothed_daily_activity_df
+    return _smoothed_activity(df, years)
 
 
+@profiled("analyzer.relative_activity_ts")
 def relative_activity_ts(df: pd.DataFrame, years: int = 3) -> pd.DataFrame:
     """
     Calculate relative activity time series (normalized by total daily activity).
@@ -100,17 +85,7 @@ def relative_activity_ts(df: pd.DataFrame, years: int = 3) -> pd.DataFrame:
     Returns:
         Relative activity DataFrame (each row sums to 1)
     """
-    min_year = df.year.max() - years
-
-    daily_activity_df = df.loc[df["year"] > min_year].groupby(
-        ['author', 'timestamp']
-    ).first().unstack(level=0).resample('D').sum().msg_length.fillna(0)
-
-    smoothed_daily_activity_df = pd.DataFrame(
-        gaussian_filter(daily_activity_df, (6, 0)),
-        index=daily_activity_df.index,
-        columns=daily_activity_df.columns
-    )
+    smoothed_daily_activity_df = _smoothed_activity(df, years)
 
     o = smoothed_daily_activity_df.div(
         smoothed_daily_activity_df.sum(axis=1),
@@ -119,6 +94,39 @@ def relative_activity_ts(df: pd.DataFrame, years: int = 3) -> pd.DataFrame:
     return o
 
 
+def _smoothed_activity(df: pd.DataFrame, years: int) -> pd.DataFrame:
+    """
+    Smooth the daily activity of the last calendar years over time.
+
+    The window is a slice of the frame's cached daily activity matrix (see
+    daily_activity); all authors are smoothed in one pass along the days.
+
+    Args:
+        df: Preprocessed DataFrame
+        years: Number of calendar years to include, counting the year of
+            the last message
+
+    Returns:
+        DataFrame with one row per day from the first message in the
+        window to the last message and one column per author with
+        messages in the window; of several messages an author sent at the
+        same timestamp only the first counts
+    """
+    daily = daily_activity(df)
+    day_years = daily.dates.year
+    start = int(np.argmax((day_years > day_years.max() - years) & (daily.messages > 0)))
+    in_window = daily.last_days >= start
+
+    # Smoothed after slicing, so the window's edges are reflected as before
+    smoothed = gaussian_filter1d(daily.lengths[start:, in_window], 6, axis=0)
+    return pd.DataFrame(
+        smoothed,
+        index=pd.DatetimeIndex(daily.dates[start:].as_unit(df['timestamp'].dt.unit), freq='D', name='timestamp'),
+        columns=daily.authors[in_window].rename('author')
+    )
+
+
+@profiled("analyzer.get_activity_stats")
 def get_activity_stats(df: pd.DataFrame) -> dict:
     """
     Get activity statistics and chart.
@@ -0,0 +1,215 @@
+"""
+Aggregate cube of message activity shared by the temporal analyzers.
+
+The activity charts, the heatmap and the monthly and trend tables all
+aggregate the same few columns over time and author. Instead of each of
+them grouping the full message frame, the frame is reduced once to an
+ActivityCube: one cell per (author, day, hour, minute) with messages,
+holding the cell's counts and message length sums. Analyzers then reduce
+the cells with np.bincount (see cube_matrix), which touches at most one
+entry per message and usually far fewer.
+
+The daily activity series are read from a second, dense aggregate built
+from the cube: a days by authors matrix of message lengths covering the
+whole chat (see daily_activity), of which each chart takes a slice.
+
+Cubes and daily matrices are cached per frame (see frame_cached), so
+every analyzer and every rerun of the app on the same processed frame
+share them.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from whatsapp_analyzer.utils.dates import ordinals_to_dates
+from whatsapp_analyzer.utils.frame_cache import frame_cached
+
+MINUTES_PER_DAY = 24 * 60
+
+_NS_PER_MINUTE = 60 * 10**9
+
+
+class ActivityCube(NamedTuple):
+    """
+    Message activity per (author, day, hour, minute) cell.
+
+    Only cells with at least one message are stored; all cell arrays are
+    aligned and ordered by author, then time.
+    """
+
+    # Author names; the author codes of the cells index into this
+    authors: pd.Index
+    # Day ordinal of the first cell (0 for an empty cube)
+    first_day: int
+    # Cell keys
+    author: np.ndarray
+    day: np.ndarray
+    hour: np.ndarray
+    minute: np.ndarray
+    # Number of messages
+    messages: np.ndarray
+    # Number of messages with text (not cleared media or deleted messages)
+    texts: np.ndarray
+    # Sum of msg_length
+    msg_length: np.ndarray
+    # Sum of msg_length over the first message with a length of each
+    # author and timestamp
+    first_msg_length: np.ndarray
+
+    @property
+    def day_count(self) -> int:
+        """Number of calendar days from the first to the last cell."""
+        return int(self.day.max()) - self.first_day + 1 if len(self.day) else 0
+
+
+class DailyActivity(NamedTuple):
+    """
+    Message lengths per calendar day and author, from the first day of a
+    chat to the last.
+    """
+
+    # Every day from the first to the last message
+    dates: pd.DatetimeIndex
+    authors: pd.Index
+    # Days by authors sums of the first msg_length of each author and
+    # timestamp (ActivityCube.first_msg_length)
+    lengths: np.ndarray
+    # Number of messages per day
+    messages: np.ndarray
+    # Position in dates of each author's last day with messages
+    last_days: np.ndarray
+
+
+def activity_cube(df: pd.DataFrame) -> ActivityCube:
+    """
+    Get the activity cube of a frame, building it on first use.
+
+    Args:
+        df: DataFrame with 'timestamp' and 'author' columns; 'message' and
+            'msg_length' are aggregated when present
+
+    Returns:
+        ActivityCube of the frame's messages (messages without timestamp or
+        author are left out)
+    """
+    return frame_cached(df, "activity_cube", _build_cube)
+
+
+def daily_activity(df: pd.DataFrame) -> DailyActivity:
+    """
+    Get the daily activity matrix of a frame, building it on first use.
+
+    Args:
+        df: DataFrame accepted by activity_cube()
+
+    Returns:
+        DailyActivity of the frame's messages
+    """
+    return frame_cached(df, "daily_activity", _build_daily_activity)
+
+
+def cube_matrix(
+    cube: ActivityCube,
+    rows: np.ndarray,
+    row_count: int,
+    values: Optional[np.ndarray] = None,
+    cells: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Sum the cells of a cube into a matrix of rows by authors.
+
+    Args:
+        cube: ActivityCube
+        rows: Row of each cell, from 0 to row_count - 1
+        row_count: Number of rows
+        values: Measure to sum, such as cube.msg_length (cells are counted
+            if not given)
+        cells: Boolean mask of the cells to include (all if not given)
+
+    Returns:
+        float64 array of shape (row_count, len(cube.authors))
+    """
+    author_count = len(cube.authors)
+    flat = np.asarray(rows, dtype=np.int64) * author_count + cube.author
+    if cells is not None:
+        flat = flat[cells]
+        values = values[cells] if values is not None else None
+    totals = np.bincount(flat, weights=values, minlength=row_count * author_count)
+    return totals.astype(np.float64).reshape(row_count, author_count)
+
+
+def cube_dates(cube: ActivityCube) -> pd.DatetimeIndex:
+    """
+    Get the calendar days covered by a cube.
+
+    Args:
+        cube: ActivityCube
+
+    Returns:
+        DatetimeIndex of every day from the first to the last cell; a
+        cell's day is at position ``cube.day - cube.first_day``
+    """
+    return ordinals_to_dates(np.arange(cube.first_day, cube.first_day + cube.day_count))
+
+
+def _build_daily_activity(df: pd.DataFrame) -> DailyActivity:
+    """Sum a frame's cube into a dense days by authors matrix."""
+    cube = activity_cube(df)
+    offsets = cube.day - cube.first_day
+    # Cells are ordered by author, then time, so each author's last cell
+    # holds the author's last day
+    last_cells = np.searchsorted(cube.author, np.arange(len(cube.authors)), side="right") - 1
+    return DailyActivity(
+        dates=cube_dates(cube),
+        authors=cube.authors,
+        lengths=cube_matrix(cube, offsets, cube.day_count, cube.first_msg_length),
+        messages=np.bincount(offsets, weights=cube.messages, minlength=cube.day_count).astype(np.int64),
+        last_days=offsets[last_cells],
+    )
+
+
+def _build_cube(df: pd.DataFrame) -> ActivityCube:
+    """Aggregate a frame's messages into cube cells."""
+    timestamps = df["timestamp"].to_numpy(dtype="datetime64[ns]")
+    codes, authors = pd.factorize(df["author"], sort=True)
+    valid = (codes >= 0) & ~np.isnat(timestamps)
+
+    if "msg_length" in df.columns:
+        lengths = df["msg_length"].to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        lengths = np.full(len(df), np.nan)
+    has_length = valid & ~np.isnan(lengths)
+    # Only the first message with a length of an author and timestamp counts
+    # towards first_msg_length
+    repeated = pd.DataFrame({"author": codes, "timestamp": timestamps})[has_length].duplicated().to_numpy()
+    first_length = np.zeros(len(df))
+    first_length[np.flatnonzero(has_length)[~repeated]] = lengths[has_length][~repeated]
+
+    minutes = timestamps[valid].astype(np.int64) // _NS_PER_MINUTE
+    first_day = int(minutes.min() // MINUTES_PER_DAY) if len(minutes) else 0
+    minutes -= first_day * MINUTES_PER_DAY
+    span = int(minutes.max()) + 1 if len(minutes) else 0
+    keys, cells = np.unique(codes[valid].astype(np.int64) * span + minutes, return_inverse=True)
+
+    if "message" in df.columns:
+        texts = df["message"].notna().to_numpy()[valid]
+    else:
+        texts = np.ones(len(minutes))
+    cell_count = len(keys)
+    author, minute_of_span = np.divmod(keys, span) if span else (keys, keys)
+    day, minute_of_day = np.divmod(minute_of_span, MINUTES_PER_DAY)
+    hour, minute = np.divmod(minute_of_day, 60)
+    return ActivityCube(
+        authors=authors,
+        first_day=first_day,
+        author=author.astype(np.int32),
+        day=(day + first_day).astype(np.int32),
+        hour=hour.astype(np.int8),
+        minute=minute.astype(np.int8),
+        messages=np.bincount(cells, minlength=cell_count),
+        texts=np.bincount(cells, weights=texts, minlength=cell_count).astype(np.int64),
+        msg_length=np.bincount(cells, weights=np.where(has_length, lengths, 0)[valid], minlength=cell_count),
+        first_msg_length=np.bincount(cells, weights=first_length[valid], minlength=cell_count),
+    )
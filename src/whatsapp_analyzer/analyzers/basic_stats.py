@@ -4,7 +4,10 @@ Basic statistics calculations for WhatsApp chat data.
 
 import pandas as pd
 
+from whatsapp_analyzer.utils.profiling import profiled
 
+
+@profiled("analyzer.basic_stats")
 def basic_stats(df: pd.DataFrame):
     """
     Calculate mean statistics per author for various message attributes.
@@ -20,7 +23,7 @@ def basic_stats(df: pd.DataFrame):
         df = df.drop("hour", axis=1)
 
     # Calculate mean values for each author
-    df_mean = df.groupby('author').mean(numeric_only=True)
+    df_mean = df.groupby('author', observed=True).mean(numeric_only=True)
 
     # Define column renaming dictionary
     rename_dict = {
@@ -75,6 +78,7 @@ def basic_stats(df: pd.DataFrame):
     return styled_df
 
 
+@profiled("analyzer.stats_overall")
 def stats_overall(df: pd.DataFrame):
     """
     Calculate overall distribution of message types across authors.
@@ -102,7 +106,7 @@ def stats_overall(df: pd.DataFrame):
         temp = df.loc[df[col] == 1]
         if temp[col].sum() == 0:
             return pd.DataFrame({'author': df['author'].unique(), col: 0})
-        return pd.DataFrame(temp.groupby("author")[col].sum() / temp[col].sum()).reset_index()
+        return pd.DataFrame(temp.groupby("author", observed=True)[col].sum() / temp[col].sum()).reset_index()
 
     # Process all columns
     processed_dfs = {col: process_column(col) for col in columns}
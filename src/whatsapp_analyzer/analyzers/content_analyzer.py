@@ -2,14 +2,19 @@
 Content analysis for WhatsApp chat data (words, emojis, monthly stats).
 """
 
-import re
+import numpy as np
 import pandas as pd
 import altair as alt
 from collections import Counter
 
+from whatsapp_analyzer.analyzers.activity_cube import activity_cube
+from whatsapp_analyzer.utils.dates import months_to_periods, ordinal_months
+from whatsapp_analyzer.utils.emojis import count_emojis, emoji_graphemes, explode_emojis
 from whatsapp_analyzer.utils.math_helpers import percent_helper
+from whatsapp_analyzer.utils.profiling import profiled
 
 
+@profiled("analyzer.word_stats")
 def word_stats(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate word frequency statistics.
@@ -20,7 +25,9 @@ def word_stats(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with word, count, and frequency description
     """
-    words_lst = ''.join(df["message"].values.astype(str)).split(' ')
+    # Missing messages read as "nan" whatever the column's string dtype
+    messages = df["message"].to_numpy(dtype=object, na_value=np.nan).astype(str)
+    words_lst = ''.join(messages).split(' ')
     words_lst = [i for i in words_lst if len(i) > 3]
 
     result = pd.DataFrame.from_dict(
@@ -45,23 +52,19 @@ def extract_emojis(s: str) -> str:
         s: Input string
 
     Returns:
-        String containing only emoji characters
+        String containing only the emojis, in order of appearance
     """
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        u"\U00002702-\U000027B0"
-        u"\U000024C2-\U0001F251"
-        "]+", flags=re.UNICODE)
-    return ''.join(emoji_pattern.findall(s))
+    return ''.join(emoji_graphemes(s))
 
 
+@profiled("analyzer.get_most_used_emoji")
 def get_most_used_emoji(df: pd.DataFrame) -> pd.DataFrame:
     """
     Get the most frequently used emojis in the chat.
 
+    Counts are read from the 'emojis' column filled by preprocessing; a
+    multi-codepoint emoji (👍🏽, 🇩🇪, 👩‍💻) counts as one.
+
     Args:
         df: Preprocessed DataFrame
 
@@ -69,26 +72,42 @@ def get_most_used_emoji(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with top 10 emojis and their counts
     """
     try:
-        # Combine all messages and extract emojis
-        all_emojis = ' '.join(df['message'].astype(str).apply(extract_emojis))
-        emoji_counts = Counter(all_emojis)
-
-        # Convert to DataFrame for sorting
-        emoji_df = pd.DataFrame(emoji_counts.items(), columns=['Emoji', 'Count'])
-
-        # Clean emoji column: remove whitespace and filter invalid entries
-        emoji_df['Emoji'] = emoji_df['Emoji'].str.replace(r'\s+', '', regex=True)
-        emoji_df = emoji_df[emoji_df['Emoji'].notna() & (emoji_df['Emoji'] != '')]
-
-        # Sort by count in descending order
-        emoji_df = emoji_df.sort_values('Count', ascending=False)
-        emoji_df['Count'] = emoji_df['Count'].astype(int)
-
-        return emoji_df.head(10)
+        return count_emojis(df, top=10)
     except Exception:
         return pd.DataFrame(columns=['Emoji', 'Count'])
 
 
+@profiled("analyzer.emoji_stats_by_author")
+def emoji_stats_by_author(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarize emoji usage per author.
+
+    Args:
+        df: Preprocessed DataFrame
+
+    Returns:
+        DataFrame with Author, Emojis (total used), Distinct (number of
+        different emojis) and Favourite (most used emoji) columns, sorted
+        by total usage
+    """
+    exploded = explode_emojis(df)
+    if exploded.empty:
+        return pd.DataFrame(columns=['Author', 'Emojis', 'Distinct', 'Favourite'])
+
+    # Plain strings keep categorical authors from adding empty groups
+    exploded['author'] = exploded['author'].astype(str)
+    counts = exploded.groupby(['author', 'emoji']).size().reset_index(name='count')
+    counts = counts.sort_values(['author', 'count'], ascending=[True, False], kind='stable')
+    grouped = counts.groupby('author')
+    result = pd.DataFrame({
+        'Emojis': grouped['count'].sum(),
+        'Distinct': grouped.size(),
+        'Favourite': grouped['emoji'].first(),
+    }).rename_axis('Author').reset_index()
+    return result.sort_values('Emojis', ascending=False, kind='stable', ignore_index=True)
+
+
+@profiled("analyzer.analyze_monthly_messages")
 def analyze_monthly_messages(df: pd.DataFrame) -> dict:
     """
     Analyze monthly message volume over time.
@@ -102,15 +121,19 @@ def analyze_monthly_messages(df: pd.DataFrame) -> dict:
         - peak_month: Month with most messages
         - total_messages: Message count in peak month
     """
-    df = df.copy()
-    df['YearMonth'] = df['timestamp'].dt.to_period('M')
-    df['year'] = df['timestamp'].dt.year
-
-    # Group by YearMonth and count messages
-    year_content = df.groupby('YearMonth').agg({
-        'message': 'count',
-        'year': 'first'
-    }).reset_index()
+    # Count messages with text per month, for the months with any messages
+    cube = activity_cube(df)
+    months = ordinal_months(cube.day)
+    first_month = months.min() if len(months) else 0
+    active_months = np.flatnonzero(np.bincount(months - first_month))
+    counts = np.bincount(months - first_month, weights=cube.texts)[active_months].astype(int)
+
+    months = active_months + first_month
+    year_content = pd.DataFrame({
+        'YearMonth': months_to_periods(months),
+        'message': counts,
+        'year': months // 12 + 1970,
+    })
 
     # Find the month with the most messages
     peak_month = year_content.loc[year_content['message'].idxmax()]
@@ -1,12 +1,48 @@
 """
 Response time and pattern analysis for WhatsApp chat data.
+
+Both analyzers read the reply events of a frame (see reply_events): every
+message paired with the message before it, built once per frame in one
+vectorized pass and cached.
 """
 
 import numpy as np
 import pandas as pd
 import altair as alt
 
+from whatsapp_analyzer.utils.frame_cache import frame_cached
+from whatsapp_analyzer.utils.profiling import profiled
+
+# Messages following a message of the same author within this many
+# seconds continue it and are not replies
+SELF_REPLY_GAP = 180
+
+
+def reply_events(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Get the reply events of a frame, building them on first use.
 
+    Messages are taken in the frame's order, which for processed frames
+    is time order with messages of the same minute kept in export order
+    (frames out of time order are stable-sorted by timestamp first). Each
+    message is a reply to the message before it, except messages
+    following one of the same author within SELF_REPLY_GAP seconds.
+
+    Args:
+        df: DataFrame with 'timestamp' and 'author' columns
+
+    Returns:
+        DataFrame indexed like df (in time order) with columns:
+        - responder: Author of the reply (categorical)
+        - responded_to: Author of the message before (categorical, NaN
+          for the first message)
+        - latency: Seconds since the message before (NaN for the first
+          message)
+    """
+    return frame_cached(df, "reply_events", _build_reply_events)
+
+
+@profiled("analyzer.analyze_response_time")
 def analyze_response_time(df: pd.DataFrame) -> dict:
     """
     Analyze response times for each author.
@@ -22,21 +58,12 @@ def analyze_response_time(df: pd.DataFrame) -> dict:
         - median_chart: Altair chart of median response times
         - slowest_responder: Author with highest median response time
     """
-    df = df.sort_values(["timestamp", "author"]).copy()
-    df['time_diff'] = df['timestamp'].diff().dt.total_seconds()
-    df['same_author'] = df['author'] == df['author'].shift()
-
-    # Filter out self-responses within 3 minutes
-    response_data = df[~((df['time_diff'] < 180) & df['same_author'])].copy()
+    events = reply_events(df)
 
-    # Calculate response time in minutes
-    response_data['response_time'] = response_data['time_diff'] / 60
-
-    # Calculate log response time for distribution plot
-    response_data['log_response_time'] = np.log10(response_data['response_time'])
-
-    # Calculate median response time for each author
-    median_response_time = response_data.groupby('author')['response_time'].median().reset_index()
+    # Calculate median response time in minutes for each author
+    median_response_time = (events['latency'] / 60).groupby(
+        events['responder'], observed=True
+    ).median().rename_axis('author').rename('response_time').reset_index()
 
     # Create median response time chart
     median_chart = alt.Chart(median_response_time).mark_bar().encode(
@@ -55,6 +82,7 @@ def analyze_response_time(df: pd.DataFrame) -> dict:
     }
 
 
+@profiled("analyzer.response_matrix")
 def response_matrix(df: pd.DataFrame):
     """
     Create a response matrix showing who responds to whom.
@@ -65,18 +93,25 @@ def response_matrix(df: pd.DataFrame):
     Returns:
         Altair heatmap chart
     """
-    df = df.copy()
-    df['time_diff'] = df['timestamp'].diff().dt.total_seconds()
-    df['same_author'] = df['author'] == df['author'].shift()
-
-    # Filter out self-responses within 3 minutes
-    response_data = df[~((df['time_diff'] < 180) & df['same_author'])]
-
-    # Create response matrix
-    matrix = pd.crosstab(
-        response_data['author'],
-        response_data['author'].shift(),
-        normalize='index'
+    events = reply_events(df)
+    authors = events['responder'].cat.categories
+
+    # Count replies per (responder, responded to) pair
+    responders = events['responder'].cat.codes.to_numpy(dtype=np.int64)
+    responded_to = events['responded_to'].cat.codes.to_numpy(dtype=np.int64)
+    is_reply = responded_to >= 0
+    counts = np.bincount(
+        responders[is_reply] * len(authors) + responded_to[is_reply],
+        minlength=len(authors) ** 2
+    ).reshape(len(authors), len(authors))
+
+    # Share of each responder's replies, for the pairs that occur
+    rows, columns = counts.sum(axis=1) > 0, counts.sum(axis=0) > 0
+    counts = counts[rows][:, columns]
+    matrix = pd.DataFrame(
+        counts / counts.sum(axis=1, keepdims=True),
+        index=authors[rows].rename('author'),
+        columns=authors[columns].rename('author')
     )
 
     # Prepare data for Altair
@@ -116,3 +151,29 @@ def response_matrix(df: pd.DataFrame):
         labelFontSize=12,
         titleFontSize=14
     )
+
+
+def _build_reply_events(df: pd.DataFrame) -> pd.DataFrame:
+    """Pair every message with the one before it and drop self-continuations."""
+    codes, authors = pd.factorize(df['author'], sort=True)
+    timestamps = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+    if df['timestamp'].is_monotonic_increasing:
+        order = np.arange(len(df))
+    else:
+        order = np.argsort(timestamps, kind='stable')
+        codes, timestamps = codes[order], timestamps[order]
+
+    latency = np.full(len(order), np.nan)
+    latency[1:] = np.diff(timestamps) / np.timedelta64(1, 's')
+    previous = np.empty_like(codes)
+    previous[:1] = -1
+    previous[1:] = codes[:-1]
+
+    # NaN latencies compare as False, so the first message is kept
+    keep = ~((latency < SELF_REPLY_GAP) & (codes == previous))
+    categories = pd.Index(np.asarray(authors, dtype=object))
+    return pd.DataFrame({
+        'responder': pd.Categorical.from_codes(codes[keep], categories=categories),
+        'responded_to': pd.Categorical.from_codes(previous[keep], categories=categories),
+        'latency': latency[keep],
+    }, index=df.index[order][keep])
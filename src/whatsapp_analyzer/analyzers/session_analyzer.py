@@ -0,0 +1,34 @@
+"""
+Conversation (session) analysis for WhatsApp chat data.
+
+Works on the session table from build_sessions(), one row per
+conversation, instead of the messages.
+"""
+
+import pandas as pd
+
+from whatsapp_analyzer.utils.profiling import profiled
+
+
+@profiled("analyzer.conversation_stats")
+def conversation_stats(sessions: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarize the conversations each author started.
+
+    Args:
+        sessions: Session table from build_sessions()
+
+    Returns:
+        DataFrame with Author, Conversations Started, Share (%),
+        Median Messages and Median Duration (minutes) columns, most
+        conversations first
+    """
+    grouped = sessions.groupby('initiator', observed=True)
+    stats = pd.DataFrame({
+        'Conversations Started': grouped.size(),
+        'Median Messages': grouped['messages'].median(),
+        'Median Duration (minutes)': grouped['duration'].median().dt.total_seconds() / 60,
+    })
+    stats.insert(1, 'Share (%)', stats['Conversations Started'] / len(sessions) * 100)
+    stats = stats.sort_values('Conversations Started', ascending=False, kind='stable')
+    return stats.rename_axis('Author').reset_index().round(1)
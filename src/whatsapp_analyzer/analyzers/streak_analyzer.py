@@ -4,7 +4,10 @@ Messaging streak analysis for WhatsApp chat data.
 
 import pandas as pd
 
+from whatsapp_analyzer.utils.profiling import profiled
 
+
+@profiled("analyzer.find_longest_consecutive_streak")
 def find_longest_consecutive_streak(df: pd.DataFrame) -> dict:
     """
     Find the longest consecutive messaging streak by a single author.
@@ -29,7 +32,7 @@ def find_longest_consecutive_streak(df: pd.DataFrame) -> dict:
     df['author_change'] = (df['author'] != df['author'].shift()).cumsum()
 
     # Group by the author and the change indicator
-    grouped = df.groupby(['author', 'author_change'])
+    grouped = df.groupby(['author', 'author_change'], observed=True)
 
     # Find the group with the maximum count
     streak_info = grouped.size().reset_index(name='streak_length')
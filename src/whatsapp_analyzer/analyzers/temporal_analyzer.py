@@ -1,13 +1,24 @@
 """
 Temporal analysis for WhatsApp chat data (time of day, day of week, heatmaps).
+
+All analyzers here are reductions of the frame's ActivityCube (see
+activity_cube), not groupbys over the messages.
 """
 
 import numpy as np
 import pandas as pd
 import altair as alt
-from scipy.ndimage import gaussian_filter
+from scipy.ndimage import gaussian_filter1d
+
+from whatsapp_analyzer.analyzers.activity_cube import MINUTES_PER_DAY, activity_cube, cube_matrix
+from whatsapp_analyzer.utils.dates import ordinal_months, ordinal_weekdays, ordinals_to_dates
+from whatsapp_analyzer.utils.profiling import profiled
+
+# Default smoothing of activity_time_of_day_ts(), in minutes
+TIME_OF_DAY_BANDWIDTH = 60
 
 
+@profiled("analyzer.activity_day_of_week_ts")
 def activity_day_of_week_ts(df: pd.DataFrame):
     """
     Create a heatmap of activity by day of week per author.
@@ -19,7 +30,11 @@ def activity_day_of_week_ts(df: pd.DataFrame):
         Altair chart
     """
     days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    o = df.groupby([df.timestamp.dt.dayofweek, df.author])['msg_length'].sum().unstack(fill_value=0)
+    cube = activity_cube(df)
+    weekdays = ordinal_weekdays(cube.day)
+    lengths = cube_matrix(cube, weekdays, len(days), cube.msg_length)
+    has_messages = np.bincount(weekdays, minlength=len(days)) > 0
+    o = pd.DataFrame(lengths[has_messages], index=np.flatnonzero(has_messages), columns=cube.authors)
     o.index = pd.CategoricalIndex(o.index.map(lambda x: days[x]), categories=days, ordered=True)
     o = o.sort_index()
 
@@ -65,45 +80,35 @@ def activity_day_of_week_ts(df: pd.DataFrame):
     return chart + text
 
 
-def activity_time_of_day_ts(df: pd.DataFrame):
+@profiled("analyzer.activity_time_of_day_ts")
+def activity_time_of_day_ts(df: pd.DataFrame, bandwidth: float = TIME_OF_DAY_BANDWIDTH):
     """
     Create a smoothed line chart of activity by time of day per author.
 
+    Message lengths are summed per minute of the day and smoothed with a
+    circular Gaussian filter, so activity shortly before midnight carries
+    over to shortly after it. All authors are smoothed in one pass.
+
     Args:
         df: Preprocessed DataFrame
+        bandwidth: Standard deviation of the smoothing, in minutes
 
     Returns:
         Altair chart
     """
-    # Group by hour and minute, sum message lengths
-    a = df.groupby(
-        [df.timestamp.dt.hour, df.timestamp.dt.minute, 'author']
-    )['msg_length'].sum().unstack(fill_value=0)
-
-    # Reindex to fill missing times with 0
-    a = a.reindex(
-        pd.MultiIndex.from_product([range(24), range(60)], names=['hour', 'minute']),
-        fill_value=0
-    )
-
-    # Temporarily add the tail at the start and head at the end for continuous smoothing
-    a = pd.concat([a.tail(120), a, a.head(120)])
+    # Sum message lengths per minute of the day
+    cube = activity_cube(df)
+    minute_of_day = cube.hour.astype(np.int64) * 60 + cube.minute
+    lengths = cube_matrix(cube, minute_of_day, MINUTES_PER_DAY, cube.msg_length)
 
-    # Apply gaussian convolution
     smoothed = pd.DataFrame(
-        gaussian_filter(a.values, (60, 0)),
-        index=a.index,
-        columns=a.columns
-    )
-
-    # Remove the temporarily added points
-    smoothed = smoothed.iloc[120:-120]
-
-    # Reset index and prepare for plotting
-    smoothed = smoothed.reset_index()
-    smoothed['time'] = pd.to_datetime(
-        smoothed['hour'].astype(str) + ':' + smoothed['minute'].astype(str).str.zfill(2)
+        gaussian_filter1d(lengths, bandwidth, axis=0, mode='wrap'),
+        columns=cube.authors.astype(object)
     )
+    minutes = np.arange(MINUTES_PER_DAY)
+    smoothed.insert(0, 'time', pd.to_datetime(minutes, unit='m'))
+    smoothed.insert(0, 'minute', minutes % 60)
+    smoothed.insert(0, 'hour', minutes // 60)
 
     # Melt the dataframe for Altair
     melted = smoothed.melt(
@@ -126,30 +131,40 @@ def activity_time_of_day_ts(df: pd.DataFrame):
     return chart
 
 
+@profiled("analyzer.heatmap")
 def heatmap(df: pd.DataFrame):
     """
     Create a GitHub-style activity heatmap for the last two years.
 
+    Messages are counted per day from the activity cube; calendar fields
+    are only derived for the days with messages.
+
     Args:
         df: Preprocessed DataFrame
 
     Returns:
         Altair faceted chart
     """
-    df = df.copy()
-    df['date'] = df['timestamp'].dt.date
-    df['weekday'] = df['timestamp'].dt.weekday
-    df['week'] = df['timestamp'].dt.isocalendar().week
-    df['year'] = df['timestamp'].dt.year
+    cube = activity_cube(df)
+    offsets = cube.day - cube.first_day
+
+    # Count messages per day (media and deleted messages have no text and
+    # are not counted, but their days are shown)
+    active_days = np.flatnonzero(np.bincount(offsets))
+    counts = np.bincount(offsets, weights=cube.texts)[active_days].astype(int)
+
+    dates = ordinals_to_dates(active_days + cube.first_day)
+    heatmap_data = pd.DataFrame({
+        'date': dates,
+        'weekday': dates.weekday,
+        'week': dates.isocalendar().week.to_numpy(),
+        'year': dates.year,
+        'message': counts,
+    })
 
     # Filter for last two years
-    last_two_years = df['year'].max() - 1
-    df_filtered = df[df['year'] >= last_two_years]
-
-    # Count messages per day
-    heatmap_data = df_filtered.groupby(
-        ['date', 'weekday', 'week', 'year']
-    )['message'].count().reset_index()
+    last_two_years = heatmap_data['year'].max() - 1
+    heatmap_data = heatmap_data[heatmap_data['year'] >= last_two_years].reset_index(drop=True)
 
     # Calculate the maximum message count
     max_message_count = heatmap_data['message'].max()
@@ -191,6 +206,7 @@ def heatmap(df: pd.DataFrame):
     return chart
 
 
+@profiled("analyzer.year_month")
 def year_month(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate messages by year and month.
@@ -201,10 +217,19 @@ def year_month(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with year, YearMonth, and message count
     """
-    df = df.copy()
-    df['YearMonth'] = df.timestamp.dt.year * 100 + df.timestamp.dt.month
-    year_content = df.groupby(
-        ["year", 'YearMonth'], as_index=False
-    ).count()[["year", 'YearMonth', 'message']]
-    year_content = year_content.sort_values('YearMonth')
-    return year_content
+    cube = activity_cube(df)
+    months = ordinal_months(cube.day)
+    first_month = months.min() if len(months) else 0
+    offsets = months - first_month
+
+    # Messages with text per month, for the months with any messages
+    active_months = np.flatnonzero(np.bincount(offsets))
+    counts = np.bincount(offsets, weights=cube.texts)[active_months].astype(int)
+
+    months = active_months + first_month
+    years = months // 12 + 1970
+    return pd.DataFrame({
+        'year': years,
+        'YearMonth': years * 100 + months % 12 + 1,
+        'message': counts,
+    })
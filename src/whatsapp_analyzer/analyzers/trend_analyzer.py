@@ -10,6 +10,10 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from whatsapp_analyzer.analyzers.activity_cube import activity_cube, cube_matrix
+from whatsapp_analyzer.utils.dates import months_to_periods, ordinal_months
+from whatsapp_analyzer.utils.profiling import profiled
+
 
 def calculate_talkativeness(percentage: float, num_authors: int) -> str:
     """
@@ -47,6 +51,7 @@ def calculate_talkativeness(percentage: float, num_authors: int) -> str:
 talkativeness = calculate_talkativeness
 
 
+@profiled("analyzer.trend_stats")
 def trend_stats(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate comprehensive trend statistics for all authors.
@@ -63,6 +68,7 @@ def trend_stats(df: pd.DataFrame) -> pd.DataFrame:
     return author_stats
 
 
+@profiled("analyzer.calculate_author_stats")
 def calculate_author_stats(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate basic statistics per author.
@@ -93,6 +99,7 @@ def calculate_author_stats(df: pd.DataFrame) -> pd.DataFrame:
     return author_stats
 
 
+@profiled("analyzer.prepare_time_data")
 def prepare_time_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Prepare time-series data for trend analysis.
@@ -103,12 +110,22 @@ def prepare_time_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Pivoted DataFrame with months as rows and authors as columns
     """
-    df = df.copy()
-    df["yearmonth"] = df["timestamp"].dt.to_period('M')
-    time_data = df.groupby(["yearmonth", "author"]).size().unstack(fill_value=0)
-    return time_data.sort_index()
+    cube = activity_cube(df)
+    months = ordinal_months(cube.day)
+    first_month = months.min() if len(months) else 0
+    month_count = months.max() - first_month + 1 if len(months) else 0
+    counts = cube_matrix(cube, months - first_month, month_count, cube.messages)
+
+    # Only months with messages are kept
+    active_months = np.flatnonzero(counts.sum(axis=1))
+    return pd.DataFrame(
+        counts[active_months].astype(np.int64),
+        index=months_to_periods(active_months + first_month, name='yearmonth'),
+        columns=cube.authors.rename('author')
+    )
 
 
+@profiled("analyzer.calculate_messaging_trends")
 def calculate_messaging_trends(
     author_stats: pd.DataFrame,
     time_data: pd.DataFrame
@@ -174,6 +191,7 @@ def analyze_trend(series: pd.Series) -> str:
     return f"{strength} {trend}"
 
 
+@profiled("analyzer.trendline")
 def trendline(df: pd.DataFrame, order: int = 1) -> str:
     """
     Calculate simple linear trendline.
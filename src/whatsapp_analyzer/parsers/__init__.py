@@ -1,5 +1,26 @@
 """Parser modules for WhatsApp chat files."""
 
+from whatsapp_analyzer.parsers.whatsapp_parser import (
+    parse_lines,
+    parse_stream,
+    parse_timestamps,
+    sniff_timestamp_format,
+)
+from whatsapp_analyzer.parsers.chunked_parser import parse_bytes_parallel
+from whatsapp_analyzer.parsers.parse_cache import ParseCache, content_hash, get_parse_cache
+from whatsapp_analyzer.parsers.zip_reader import index_media_members, match_media
 from whatsapp_analyzer.parsers.file_reader import read_file
 
-__all__ = ["read_file"]
+__all__ = [
+    "read_file",
+    "parse_lines",
+    "parse_stream",
+    "parse_timestamps",
+    "sniff_timestamp_format",
+    "parse_bytes_parallel",
+    "ParseCache",
+    "content_hash",
+    "get_parse_cache",
+    "index_media_members",
+    "match_media",
+]
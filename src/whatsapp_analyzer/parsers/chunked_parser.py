@@ -0,0 +1,152 @@
+"""
+Parallel chunked parsing for large WhatsApp chat exports.
+
+The raw export bytes are split into chunks whose boundaries are moved
+forward to the next message header line, so a multi-line message is never
+split away from its header. Chunks are parsed in a process pool and the
+columnar results are concatenated in order, giving exactly the same rows
+as the serial parser.
+"""
+
+import codecs
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from whatsapp_analyzer.parsers.whatsapp_parser import is_header, parse_lines, to_dataframe
+
+# Chunks smaller than this are not worth the process pool overhead
+MIN_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Initial size of the tail scanned by last_header_offset()
+_TAIL_WINDOW = 256 * 1024
+
+
+def find_chunk_boundaries(data: bytes, n_chunks: int) -> List[int]:
+    """
+    Split export bytes into chunks starting on message header lines.
+
+    Args:
+        data: Raw export bytes
+        n_chunks: Desired number of chunks
+
+    Returns:
+        Sorted byte offsets, starting with 0 and ending with len(data).
+        May describe fewer than n_chunks chunks if headers are sparse.
+    """
+    size = len(data)
+    boundaries = [0]
+    for i in range(1, n_chunks):
+        offset = _next_header_offset(data, max(size * i // n_chunks, boundaries[-1] + 1))
+        if offset >= size:
+            break
+        if offset > boundaries[-1]:
+            boundaries.append(offset)
+    boundaries.append(size)
+    return boundaries
+
+
+def _next_header_offset(data: bytes, offset: int) -> int:
+    """Return the offset of the first header line starting at or after offset."""
+    size = len(data)
+    start = data.rfind(b"\n", 0, offset) + 1
+    if start < offset:
+        start = data.find(b"\n", offset) + 1 or size
+    while start < size:
+        end = data.find(b"\n", start)
+        end = size if end == -1 else end
+        if is_header(data[start:end].decode("utf-8", errors="replace")):
+            return start
+        start = end + 1
+    return size
+
+
+def last_header_offset(data) -> int:
+    """
+    Find the start of the last message header line.
+
+    Only a window at the end of the export is scanned (grown as needed), so
+    this is cheap even for very large exports.
+
+    Args:
+        data: Raw export bytes (any bytes-like object)
+
+    Returns:
+        Byte offset of the last header line, or -1 if there is none
+    """
+    view = memoryview(data)
+    window = _TAIL_WINDOW
+    while True:
+        low = max(0, len(view) - window)
+        tail = bytes(view[low:])
+        # Past the start of the export, the window may begin mid-line
+        offset = _next_header_offset(tail, 1 if low else 0)
+        last = -1
+        while offset < len(tail):
+            last = offset
+            offset = _next_header_offset(tail, offset + 1)
+        if last >= 0:
+            return low + last
+        if low == 0:
+            return -1
+        window *= 4
+
+
+def _usable_cpu_count() -> int:
+    """Count the CPUs this process may run on, honouring its CPU affinity where reported."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _parse_chunk(chunk: bytes, encoding: str) -> Dict[str, list]:
+    """Parse one chunk of export bytes (process pool worker)."""
+    text = io.TextIOWrapper(io.BytesIO(chunk), encoding=encoding)
+    return parse_lines(text)
+
+
+def parse_bytes_parallel(
+    data: bytes,
+    workers: Optional[int] = None,
+    encoding: str = "utf-8-sig"
+) -> pd.DataFrame:
+    """
+    Parse export bytes in parallel chunks.
+
+    Produces the same rows, in the same order, as parse_stream().
+
+    Args:
+        data: Raw export bytes
+        workers: Number of worker processes (default: CPUs this process
+            may run on); with fewer than two, the bytes are parsed serially
+        encoding: Text encoding of the export
+
+    Returns:
+        DataFrame with timestamp, author, message, words and letters columns
+    """
+    workers = workers or _usable_cpu_count()
+    if workers < 2:
+        return to_dataframe(_parse_chunk(data, encoding))
+
+    n_chunks = max(1, min(workers, len(data) // MIN_CHUNK_BYTES))
+    boundaries = find_chunk_boundaries(data, n_chunks)
+    chunks = [data[start:end] for start, end in zip(boundaries, boundaries[1:])]
+
+    # Only the first chunk can start with a byte order mark
+    rest_encoding = "utf-8" if codecs.lookup(encoding).name == "utf-8-sig" else encoding
+    encodings = [encoding] + [rest_encoding] * (len(chunks) - 1)
+
+    if len(chunks) == 1:
+        results = [_parse_chunk(chunks[0], encoding)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            results = list(executor.map(_parse_chunk, chunks, encodings))
+
+    columns = {name: [] for name in ("timestamp", "author", "message", "words", "letters")}
+    for result in results:
+        for name, values in result.items():
+            columns[name].extend(values)
+    return to_dataframe(columns)
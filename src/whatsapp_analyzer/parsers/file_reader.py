@@ -2,22 +2,35 @@
 File reading and parsing for WhatsApp chat exports.
 """
 
-import tempfile
+from typing import Optional
+
 import streamlit as st
 import pandas as pd
-from chatminer.chatparsers import WhatsAppParser
+
+from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+from whatsapp_analyzer.parsers.chunked_parser import MIN_CHUNK_BYTES, parse_bytes_parallel
+from whatsapp_analyzer.parsers.parse_cache import ParseCache, content_hash, get_parse_cache
+from whatsapp_analyzer.parsers.incremental import export_metadata, find_cached_prefix, parse_suffix
+from whatsapp_analyzer.parsers.zip_reader import is_zip_export, open_chat_member
+from whatsapp_analyzer.utils.profiling import profile_stage, profiled
 
 
 @st.cache_data(show_spinner=False)
+@profiled("read_file")
 def read_file(file) -> pd.DataFrame:
     """
     Read and parse a WhatsApp chat export file.
 
-    Uses ChatMiner library to parse the WhatsApp format and extracts
+    Streams the upload through the native WhatsApp parser and extracts
     basic features like weekday, hour, word count, and letter count.
+    Large uploads are split on message boundaries and parsed in parallel.
+    Results are kept in the on-disk parse cache, so re-uploading a chat
+    that was seen before skips parsing, and a newer export of a cached
+    chat only parses the messages appended since. Zip exports are read by
+    streaming the chat member straight out of the archive.
 
     Args:
-        file: Streamlit UploadedFile object
+        file: Streamlit UploadedFile object (.txt export or .zip archive)
 
     Returns:
         DataFrame with columns:
@@ -29,15 +42,57 @@ def read_file(file) -> pd.DataFrame:
         - words: word count
         - letters: character count
     """
-    with tempfile.NamedTemporaryFile(mode="wb") as temp:
-        with st.spinner('This may take a while. Wait for it...'):
-            bytes_data = file.getvalue()
-            temp.write(bytes_data)
-            parser = WhatsAppParser(temp.name)
-            parser.parse_file()
-            df = parser.parsed_messages.get_df(as_pandas=True)
-            df["weekday"] = df["timestamp"].dt.strftime("%A")
-            df["hour"] = df["timestamp"].dt.hour
-            df["words"] = df["message"].apply(lambda s: len(s.split(" ")))
-            df["letters"] = df["message"].apply(len)
+    file_hash = content_hash(file)
+    cache = get_parse_cache()
+    with profile_stage("read_file.cache_lookup") as stage:
+        df = cache.get(file_hash)
+        stage.cache_hit = df is not None
+    if df is not None:
+        return df
+
+    with st.spinner('This may take a while. Wait for it...'), profile_stage("read_file.parse") as stage:
+        if is_zip_export(file):
+            with open_chat_member(file) as chat:
+                df = _add_basic_features(parse_stream(chat))
+            # Incremental re-ingest works on raw text exports only
+            metadata = {}
+        else:
+            df = _read_appended(file, cache)
+            if df is None:
+                if file.size >= 2 * MIN_CHUNK_BYTES:
+                    df = parse_bytes_parallel(file.getvalue())
+                else:
+                    df = parse_stream(file)
+                df = _add_basic_features(df)
+            metadata = export_metadata(file.getbuffer(), df) if cache.enabled else {}
+        stage.rows_out = len(df)
+
+    with profile_stage("read_file.cache_store", rows_in=len(df)):
+        cache.put(file_hash, df, metadata)
+    return df
+
+
+def _read_appended(file, cache: ParseCache) -> Optional[pd.DataFrame]:
+    """Parse only the messages appended to a cached export, if there is one."""
+    if not cache.enabled:
+        return None
+
+    data = file.getbuffer()
+    match = find_cached_prefix(data, cache)
+    if match is None:
+        return None
+    prefix, metadata = match
+    new_rows = parse_suffix(data, metadata)
+    if new_rows is None:
+        return None
+
+    df = pd.concat([prefix, _add_basic_features(new_rows)], ignore_index=True)
+    df.attrs["date_order"] = metadata["date_order"]
+    return df
+
+
+def _add_basic_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Add weekday and hour columns (words and letters come from the parser)."""
+    df.insert(3, "weekday", df["timestamp"].dt.strftime("%A"))
+    df.insert(4, "hour", df["timestamp"].dt.hour)
     return df
@@ -0,0 +1,108 @@
+"""
+Incremental re-ingest of newer exports of an already parsed chat.
+
+A weekly re-export of the same chat is the previous export plus a tail of
+new messages. For every cached export we remember where its last message
+header starts (the prefix before it consists only of complete messages),
+together with a hash of that prefix. When a new upload starts with the
+same prefix, only the bytes from that offset onwards are parsed and the
+new rows are appended to the cached prefix rows.
+"""
+
+import hashlib
+import io
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from whatsapp_analyzer.parsers.chunked_parser import last_header_offset
+from whatsapp_analyzer.parsers.parse_cache import ParseCache
+from whatsapp_analyzer.parsers.whatsapp_parser import infer_date_order, parse_lines, to_dataframe
+
+# Bytes hashed to cheaply rule out cache entries of unrelated chats
+_HEAD_BYTES = 64 * 1024
+
+
+def export_metadata(data, df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Build the prefix metadata stored with a cached export.
+
+    Args:
+        data: Raw export bytes (any bytes-like object)
+        df: Frame parsed from data (with ``attrs["date_order"]`` set)
+
+    Returns:
+        Dictionary with prefix size, hashes, row count and date order
+    """
+    view = memoryview(data)
+    prefix_size = max(last_header_offset(view), 0)
+    tail_rows = len(_parse_suffix_columns(view, prefix_size)["author"])
+    return {
+        "prefix_size": prefix_size,
+        "prefix_rows": len(df) - tail_rows,
+        "head_hash": hashlib.md5(view[:min(_HEAD_BYTES, prefix_size)]).hexdigest(),
+        "prefix_hash": hashlib.md5(view[:prefix_size]).hexdigest(),
+        "date_order": df.attrs.get("date_order"),
+    }
+
+
+def find_cached_prefix(data, cache: ParseCache) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+    """
+    Find the longest cached export whose complete messages prefix data.
+
+    Args:
+        data: Raw bytes of the new upload
+        cache: Parse cache to search
+
+    Returns:
+        Tuple of (cached rows of the matching prefix, entry metadata),
+        or None if no cached export matches
+    """
+    view = memoryview(data)
+    candidates = []
+    for path, metadata in cache.entries():
+        prefix_size = metadata.get("prefix_size", 0)
+        if prefix_size <= 0 or prefix_size > len(view):
+            continue
+        head = view[:min(_HEAD_BYTES, prefix_size)]
+        if hashlib.md5(head).hexdigest() == metadata.get("head_hash"):
+            candidates.append((prefix_size, path, metadata))
+
+    for prefix_size, path, metadata in sorted(candidates, key=lambda c: c[0], reverse=True):
+        if hashlib.md5(view[:prefix_size]).hexdigest() != metadata.get("prefix_hash"):
+            continue
+        df = cache.load(path)
+        if df is not None and len(df) >= metadata["prefix_rows"]:
+            return df.iloc[:metadata["prefix_rows"]], metadata
+    return None
+
+
+def parse_suffix(data, metadata: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Parse the bytes following a cached prefix.
+
+    Dates are read with the cached export's date order. If the new messages
+    prove that order wrong (for example the first day above 12 shows up),
+    None is returned and the whole export has to be parsed again.
+
+    Args:
+        data: Raw bytes of the new upload
+        metadata: Metadata of the matching cache entry
+
+    Returns:
+        DataFrame with timestamp, author, message, words and letters
+        columns, or None
+    """
+    columns = _parse_suffix_columns(memoryview(data), metadata["prefix_size"])
+    date_order = metadata.get("date_order")
+    suffix_order = infer_date_order(pd.Series(columns["timestamp"], dtype=object).astype(str))
+    if suffix_order is not None and suffix_order != date_order:
+        return None
+    return to_dataframe(columns, date_order=date_order)
+
+
+def _parse_suffix_columns(view: memoryview, offset: int) -> Dict[str, list]:
+    """Parse export bytes from a header offset onwards into columns."""
+    # Anything after offset 0 cannot start with a byte order mark
+    encoding = "utf-8-sig" if offset == 0 else "utf-8"
+    return parse_lines(io.TextIOWrapper(io.BytesIO(view[offset:]), encoding=encoding))
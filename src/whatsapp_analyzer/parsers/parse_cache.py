@@ -0,0 +1,208 @@
+"""
+Persistent on-disk cache of parsed WhatsApp chat exports.
+
+Parsed frames are stored as Arrow IPC (Feather) files keyed by the upload's
+content hash and the parser version, so re-uploading a chat that has been
+seen before skips parsing entirely, even across app restarts. The cache
+directory is kept under a size budget by evicting the least recently used
+entries. Each entry can carry a small metadata dictionary in its Arrow
+schema, readable without loading the frame (see entries()).
+
+Configuration (environment variables):
+- WHATSAPP_ANALYZER_CACHE_DIR: cache directory
+  (default: ~/.cache/whatsapp-analyzer)
+- WHATSAPP_ANALYZER_CACHE_MAX_MB: size budget in MB, 0 disables the cache
+  (default: 1024)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+from whatsapp_analyzer.parsers.whatsapp_parser import PARSER_VERSION
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "whatsapp-analyzer")
+DEFAULT_MAX_MB = 1024
+
+_SUFFIX = ".arrow"
+_METADATA_KEY = b"whatsapp_analyzer"
+
+
+def content_hash(file) -> str:
+    """
+    Compute the md5 content hash of an uploaded file.
+
+    Args:
+        file: Binary file-like object (e.g. Streamlit UploadedFile)
+
+    Returns:
+        Hex digest of the file contents
+    """
+    if hasattr(file, "getbuffer"):
+        return hashlib.md5(file.getbuffer()).hexdigest()
+    return hashlib.md5(file.getvalue()).hexdigest()
+
+
+class ParseCache:
+    """
+    Size-bounded LRU cache of parsed frames on disk.
+
+    Recency is tracked with file modification times, which are refreshed
+    on every cache hit.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_bytes > 0
+
+    def path(self, file_hash: str) -> str:
+        """Return the cache file path for a content hash."""
+        return os.path.join(self.directory, f"{file_hash}-v{PARSER_VERSION}{_SUFFIX}")
+
+    def get(self, file_hash: str) -> Optional[pd.DataFrame]:
+        """
+        Load a cached frame.
+
+        Args:
+            file_hash: Content hash of the upload
+
+        Returns:
+            Cached DataFrame, or None on a cache miss
+        """
+        if not self.enabled:
+            return None
+
+        return self.load(self.path(file_hash))
+
+    def load(self, path: str) -> Optional[pd.DataFrame]:
+        """
+        Load a cache entry by path and mark it as recently used.
+
+        Args:
+            path: Cache file path (see path() and entries())
+
+        Returns:
+            Cached DataFrame, or None if the entry is missing or unreadable
+        """
+        try:
+            df = feather.read_table(path).to_pandas()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Corrupt or unreadable entry: drop it and re-parse
+            self._remove(path)
+            return None
+        return df
+
+    def entries(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over current-version cache entries and their metadata.
+
+        Only the Arrow schema is read, not the cached frames.
+
+        Yields:
+            Tuples of (path, metadata dictionary)
+        """
+        if not self.enabled or not os.path.isdir(self.directory):
+            return
+        suffix = f"-v{PARSER_VERSION}{_SUFFIX}"
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(suffix):
+                continue
+            try:
+                with pa.memory_map(entry.path) as source:
+                    schema_metadata = pa.ipc.open_file(source).schema.metadata or {}
+                metadata = json.loads(schema_metadata.get(_METADATA_KEY, b"{}"))
+            except (OSError, ValueError):
+                continue
+            yield entry.path, metadata
+
+    def put(self, file_hash: str, df: pd.DataFrame, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store a frame and evict old entries to stay within the size budget.
+
+        Write failures are ignored; the cache is an optimization only.
+
+        Args:
+            file_hash: Content hash of the upload
+            df: Parsed DataFrame
+            metadata: Optional JSON-serializable metadata stored with the entry
+        """
+        if not self.enabled:
+            return
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            os.close(fd)
+            try:
+                table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+                table = table.replace_schema_metadata({
+                    **(table.schema.metadata or {}),
+                    _METADATA_KEY: json.dumps(metadata or {}).encode("utf-8"),
+                })
+                feather.write_feather(table, temp_path)
+                os.replace(temp_path, self.path(file_hash))
+            finally:
+                self._remove(temp_path)
+        except (OSError, ValueError):
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the budget is met."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Delete all cache entries."""
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(_SUFFIX):
+                    self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def get_parse_cache() -> ParseCache:
+    """
+    Get the parse cache configured from the environment.
+
+    Returns:
+        ParseCache instance
+    """
+    return ParseCache(
+        directory=os.environ.get("WHATSAPP_ANALYZER_CACHE_DIR", DEFAULT_CACHE_DIR),
+        max_bytes=int(float(os.environ.get("WHATSAPP_ANALYZER_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024),
+    )
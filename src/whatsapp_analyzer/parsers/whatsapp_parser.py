@@ -0,0 +1,321 @@
+"""
+Native line-oriented parser for WhatsApp chat exports.
+
+Reads the export as a stream of lines and builds the timestamp, author and
+message columns directly, without a temporary file or intermediate message
+objects. Both export flavours are recognised:
+
+- Android: ``3/12/22, 1:05 AM - Jack: message``
+- iOS:     ``[12/03/2022, 01:05:33] Jack: message``
+
+Lines that do not start with a header are continuation lines of a
+multi-line message and are joined onto the preceding message with a space.
+Header lines without an ``author: `` part are system messages and skipped.
+Word and letter counts are derived while each message is assembled, so no
+separate pass over the message column is needed.
+"""
+
+import io
+import re
+import unicodedata
+from typing import BinaryIO, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+# Bump whenever the frame produced by read_file() changes; this invalidates
+# entries in the on-disk parse cache
+PARSER_VERSION = 1
+
+# Header of a message line; the date part is validated further in parse_timestamps
+HEADER_PATTERN = re.compile(
+    r"^\[?(?P<stamp>\d{1,4}[./-]\d{1,2}[./-]\d{2,4},?\s\d{1,2}:\d{2}(?::\d{2})?"
+    r"(?:\s?[AaPp]\.?\s?[Mm]\.?)?)(?:\]\s?|\s-\s)(?P<rest>.*)$",
+    flags=re.DOTALL,
+)
+
+_STAMP_PATTERN = (
+    r"^(?P<first>\d{1,4})[./-](?P<second>\d{1,2})[./-](?P<third>\d{2,4}),?\s"
+    r"(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second_of_minute>\d{2}))?"
+    r"\s?(?:(?P<ampm>[AaPp])\.?\s?[Mm]\.?)?$"
+)
+
+# Layout of a header timestamp, used to build an explicit strptime format
+_LAYOUT_PATTERN = re.compile(
+    r"^(?P<first>\d{1,4})(?P<sep>[./-])(?P<second>\d{1,2})[./-](?P<third>\d{2,4})(?P<date_end>,?\s)"
+    r"\d{1,2}:\d{2}(?P<seconds>:\d{2})?(?P<ampm_sep>\s?)(?P<ampm>[AaPp][Mm])?$"
+)
+
+# Number of leading timestamps inspected by sniff_timestamp_format()
+FORMAT_SAMPLE_SIZE = 500
+
+_LEFT_TO_RIGHT_MARK = "\u200e"
+
+
+def is_header(line: str) -> bool:
+    """
+    Check whether a line starts a new message.
+
+    Args:
+        line: A single export line
+
+    Returns:
+        True if the line begins with a message timestamp header
+    """
+    return HEADER_PATTERN.match(line.replace(_LEFT_TO_RIGHT_MARK, "")) is not None
+
+
+def parse_lines(lines: Iterable[str]) -> Dict[str, list]:
+    """
+    Parse chat export lines into columnar lists.
+
+    Timestamps are returned as their raw header text so the date format can
+    be inferred over the whole chat afterwards (see parse_timestamps).
+
+    Args:
+        lines: Iterable of text lines (line endings are stripped)
+
+    Returns:
+        Dictionary with 'timestamp', 'author', 'message', 'words' (number of
+        space-separated tokens) and 'letters' (character count) lists
+    """
+    stamps: List[str] = []
+    authors: List[str] = []
+    messages: List[str] = []
+    words: List[int] = []
+    letters: List[int] = []
+
+    stamp = None
+    parts: List[str] = []
+
+    def flush():
+        text = "".join(parts)
+        if ": " in text:
+            author, body = text.split(": ", 1)
+            body = body.strip()
+            stamps.append(stamp)
+            authors.append(author.strip())
+            messages.append(body)
+            # Same as len(body.split(" ")) without building the word list
+            words.append(body.count(" ") + 1)
+            letters.append(len(body))
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not is_header(line):
+            if stamp is not None:
+                parts.append(" ")
+                parts.append(line)
+            continue
+
+        if stamp is not None:
+            flush()
+        header = line.replace(_LEFT_TO_RIGHT_MARK, "").strip()
+        match = HEADER_PATTERN.match(unicodedata.normalize("NFKC", header))
+        stamp = match.group("stamp")
+        parts = [match.group("rest")]
+
+    if stamp is not None:
+        flush()
+
+    return {"timestamp": stamps, "author": authors, "message": messages, "words": words, "letters": letters}
+
+
+def infer_date_order(stamps: pd.Series) -> Optional[str]:
+    """
+    Infer the date field order of raw header timestamps.
+
+    A first field of 100 or more means year-first, otherwise a first field
+    above 12 means day-first and a second field above 12 means month-first.
+
+    Args:
+        stamps: Series of raw header timestamp strings
+
+    Returns:
+        "YMD", "DMY" or "MDY", or None if the stamps are ambiguous
+    """
+    parts = stamps.str.extract(_STAMP_PATTERN)
+    first = pd.to_numeric(parts["first"])
+    second = pd.to_numeric(parts["second"])
+
+    if not len(first):
+        return None
+    if first.max() >= 100:
+        return "YMD"
+    if first.max() > 12 >= second.max():
+        return "DMY"
+    if second.max() > 12 >= first.max():
+        return "MDY"
+    return None
+
+
+def sniff_date_order(stamps: pd.Series, sample_size: int = FORMAT_SAMPLE_SIZE) -> str:
+    """
+    Infer the date field order, looking at the leading timestamps first.
+
+    The whole column is only inspected when the sample is ambiguous (for
+    example when the chat starts within the first 12 days of a month).
+
+    Args:
+        stamps: Series of raw header timestamp strings
+        sample_size: Number of leading timestamps to try first
+
+    Returns:
+        "YMD", "DMY" or "MDY" (day-first for chats that stay ambiguous)
+    """
+    date_order = infer_date_order(stamps.iloc[:sample_size])
+    if date_order is None and len(stamps) > sample_size:
+        date_order = infer_date_order(stamps)
+    return date_order or "DMY"
+
+
+def sniff_timestamp_format(
+    stamps: pd.Series,
+    date_order: str,
+    sample_size: int = FORMAT_SAMPLE_SIZE
+) -> Optional[str]:
+    """
+    Settle on one explicit strptime format for a chat's timestamps.
+
+    The most common layout (separators, year width, seconds, 12h or 24h
+    clock) among the leading timestamps determines the format.
+
+    Args:
+        stamps: Series of raw header timestamp strings
+        date_order: "YMD", "DMY" or "MDY"
+        sample_size: Number of leading timestamps to inspect
+
+    Returns:
+        Format string such as "%m/%d/%y, %I:%M %p", or None if the sample
+        has no timestamp in a layout strptime can read
+    """
+    formats = []
+    for stamp in stamps.iloc[:sample_size]:
+        match = _LAYOUT_PATTERN.match(stamp)
+        if match is None:
+            continue
+        fields = dict(zip(date_order, match.group("first", "second", "third")))
+        directives = {
+            "Y": "%Y" if len(fields["Y"]) == 4 else "%y",
+            "M": "%m",
+            "D": "%d",
+        }
+        date_format = match.group("sep").join(directives[field] for field in date_order)
+        time_format = "%I:%M" if match.group("ampm") else "%H:%M"
+        if match.group("seconds"):
+            time_format += ":%S"
+        if match.group("ampm"):
+            time_format += match.group("ampm_sep") + "%p"
+        formats.append(date_format + match.group("date_end") + time_format)
+
+    if not formats:
+        return None
+    return max(set(formats), key=formats.count)
+
+
+def parse_timestamps(stamps: pd.Series, date_order: Optional[str] = None) -> pd.Series:
+    """
+    Convert raw header timestamps to datetimes.
+
+    The format is sniffed once (see sniff_timestamp_format) and the whole
+    column is converted with it in a single pass. Stamps that do not fit
+    that format are read field by field instead.
+
+    Args:
+        stamps: Series of raw header timestamp strings
+        date_order: "YMD", "DMY" or "MDY"; sniffed if not given, falling
+            back to day-first for ambiguous chats
+
+    Returns:
+        datetime64[ns] Series (NaT where a stamp cannot be read)
+    """
+    date_order = date_order or sniff_date_order(stamps)
+    timestamp_format = sniff_timestamp_format(stamps, date_order)
+    if timestamp_format is None:
+        return _parse_timestamp_fields(stamps, date_order)
+
+    timestamps = pd.to_datetime(stamps, format=timestamp_format, errors="coerce")
+    if "%y" in timestamp_format:
+        # strptime maps two-digit years 69-99 to the 1900s; exports are all 2000s
+        last_century = timestamps.dt.year < 2000
+        if last_century.any():
+            timestamps[last_century] = timestamps[last_century] + pd.DateOffset(years=100)
+
+    unread = timestamps.isna() & stamps.notna()
+    if unread.any():
+        timestamps[unread] = _parse_timestamp_fields(stamps[unread], date_order)
+    return timestamps
+
+
+def _parse_timestamp_fields(stamps: pd.Series, date_order: str) -> pd.Series:
+    """Convert timestamps by extracting and assembling their fields."""
+    parts = stamps.str.extract(_STAMP_PATTERN)
+    first = pd.to_numeric(parts["first"])
+    second = pd.to_numeric(parts["second"])
+    third = pd.to_numeric(parts["third"])
+
+    if date_order == "YMD":
+        year, month, day = first, second, third
+    elif date_order == "MDY":
+        month, day, year = first, second, third
+    else:
+        day, month, year = first, second, third
+    year = year.where(year >= 100, year + 2000)
+
+    hour = pd.to_numeric(parts["hour"])
+    ampm = parts["ampm"].str.upper()
+    hour = hour.where(ampm.isna(), hour % 12 + (ampm == "P") * 12)
+
+    return pd.to_datetime(pd.DataFrame({
+        "year": year,
+        "month": month,
+        "day": day,
+        "hour": hour,
+        "minute": pd.to_numeric(parts["minute"]),
+        "second": pd.to_numeric(parts["second_of_minute"]).fillna(0),
+    }), errors="coerce")
+
+
+def to_dataframe(columns: Dict[str, list], date_order: Optional[str] = None) -> pd.DataFrame:
+    """
+    Build the message DataFrame from parsed columns.
+
+    The date order used is recorded in ``df.attrs["date_order"]`` so later
+    incremental parses of the same chat read dates the same way.
+
+    Args:
+        columns: Output of parse_lines()
+        date_order: Date field order (see parse_timestamps)
+
+    Returns:
+        DataFrame with timestamp, author, message, words and letters columns
+    """
+    df = pd.DataFrame(columns, columns=["timestamp", "author", "message", "words", "letters"])
+    stamps = df["timestamp"].astype(str)
+    date_order = date_order or sniff_date_order(stamps)
+    df["timestamp"] = parse_timestamps(stamps, date_order)
+    df.attrs["date_order"] = date_order
+    return df
+
+
+def parse_stream(stream: BinaryIO, encoding: str = "utf-8-sig") -> pd.DataFrame:
+    """
+    Parse a binary WhatsApp export stream.
+
+    The stream is decoded incrementally, so the export is never held in
+    memory as a second full copy.
+
+    Args:
+        stream: Binary file-like object positioned anywhere (read from start)
+        encoding: Text encoding of the export
+
+    Returns:
+        DataFrame with timestamp, author, message, words and letters columns
+    """
+    stream.seek(0)
+    text = io.TextIOWrapper(stream, encoding=encoding)
+    try:
+        columns = parse_lines(text)
+    finally:
+        # Detach so closing the wrapper does not close the caller's stream
+        text.detach()
+    return to_dataframe(columns)
@@ -0,0 +1,132 @@
+"""
+Reading WhatsApp ``.zip`` exports without extracting them.
+
+Exports with media are zip archives holding the chat text (``_chat.txt``
+on iOS, ``WhatsApp Chat with <name>.txt`` on Android) next to the media
+files. The chat member is decompressed as a stream while it is parsed, and
+media members are indexed from the archive directory only, so media bytes
+are never read. Media file names are recognised with the patterns of
+utils.attachments, which preprocessing also uses to flag the messages
+referencing them.
+"""
+
+import zipfile
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+import pandas as pd
+
+from whatsapp_analyzer.utils.attachments import (
+    ANDROID_MEDIA_PATTERN,
+    ATTACHMENT_PATTERN,
+    IOS_MEDIA_PATTERN,
+    MEDIA_KINDS,
+)
+
+
+def is_zip_export(file: IO[bytes]) -> bool:
+    """
+    Check whether an upload is a zip archive.
+
+    Args:
+        file: Binary file-like object
+
+    Returns:
+        True if the file is a zip archive
+    """
+    is_zip = zipfile.is_zipfile(file)
+    file.seek(0)
+    return is_zip
+
+
+def find_chat_member(archive: zipfile.ZipFile) -> zipfile.ZipInfo:
+    """
+    Find the chat text member of an export archive.
+
+    Args:
+        archive: Open export archive
+
+    Returns:
+        ZipInfo of ``_chat.txt`` if present, otherwise of the largest
+        ``.txt`` member
+
+    Raises:
+        ValueError: If the archive contains no text member
+    """
+    members = [info for info in archive.infolist() if info.filename.lower().endswith(".txt")]
+    if not members:
+        raise ValueError("No chat text file found in the zip archive")
+    for info in members:
+        if info.filename.rsplit("/", 1)[-1] == "_chat.txt":
+            return info
+    return max(members, key=lambda info: info.file_size)
+
+
+@contextmanager
+def open_chat_member(file: IO[bytes]) -> Iterator[IO[bytes]]:
+    """
+    Open the chat text of a zip export as a decompressing binary stream.
+
+    Use as a context manager; the stream and the archive are closed on exit.
+
+    Args:
+        file: Binary file-like object of the zip archive
+
+    Yields:
+        Readable binary stream of the chat text
+    """
+    with zipfile.ZipFile(file) as archive, archive.open(find_chat_member(archive)) as chat:
+        yield chat
+
+
+def index_media_members(file: IO[bytes]) -> pd.DataFrame:
+    """
+    Index the media files of a zip export without reading them.
+
+    Args:
+        file: Binary file-like object of the zip archive
+
+    Returns:
+        DataFrame with columns:
+        - name: member file name (without directories)
+        - size: uncompressed size in bytes
+        - kind: image, video, audio, sticker, gif or media (unknown)
+        - date: date encoded in the file name (NaT if none)
+    """
+    with zipfile.ZipFile(file) as archive:
+        chat = find_chat_member(archive)
+        rows = []
+        for info in archive.infolist():
+            if info.is_dir() or info.filename == chat.filename:
+                continue
+            name = info.filename.rsplit("/", 1)[-1]
+            match = IOS_MEDIA_PATTERN.match(name) or ANDROID_MEDIA_PATTERN.match(name)
+            rows.append({
+                "name": name,
+                "size": info.file_size,
+                "kind": MEDIA_KINDS[match.group("kind")] if match else "media",
+                "date": match.group("date") if match else None,
+            })
+
+    media = pd.DataFrame(rows, columns=["name", "size", "kind", "date"])
+    media["date"] = pd.to_datetime(media["date"].str.replace("-", ""), format="%Y%m%d", errors="coerce")
+    return media
+
+
+def match_media(df: pd.DataFrame, media: pd.DataFrame) -> pd.DataFrame:
+    """
+    Match messages referencing an attachment to indexed media members.
+
+    Args:
+        df: Parsed DataFrame with 'message' column
+        media: Output of index_media_members()
+
+    Returns:
+        DataFrame aligned with df with 'media_file' and 'media_size'
+        columns (NaN where a message has no indexed attachment)
+    """
+    names = df["message"].str.extract(ATTACHMENT_PATTERN)
+    names = names["ios"].fillna(names["android"]).str.strip()
+    sizes = media.drop_duplicates("name").set_index("name")["size"]
+    matched = names.where(names.isin(sizes.index))
+    return pd.DataFrame({"media_file": matched, "media_size": matched.map(sizes)}, index=df.index)
@@ -1,28 +1,58 @@
 """Preprocessor modules for WhatsApp chat data."""
 
-from whatsapp_analyzer.preprocessors.language_config import get_language_settings, SUPPORTED_LANGUAGES
+from whatsapp_analyzer.preprocessors.language_config import (
+    get_language_settings,
+    combine_language_settings,
+    detect_languages,
+    SUPPORTED_LANGUAGES,
+)
 from whatsapp_analyzer.preprocessors.message_processor import process_multimedia, process_emojis
 from whatsapp_analyzer.preprocessors.timestamp_processor import preprocess_timestamps, add_year_week
 from whatsapp_analyzer.preprocessors.feature_extractor import (
     add_conversation_starter_flag,
+    update_conversation_starter_flag,
+    build_sessions,
+    CONVERSATION_GAP,
     process_locations,
     process_links,
     process_message_length,
 )
-from whatsapp_analyzer.preprocessors.data_filter import filter_authors
-from whatsapp_analyzer.preprocessors.pipeline import preprocess_data
+from whatsapp_analyzer.preprocessors.data_filter import filter_authors, valid_authors
+from whatsapp_analyzer.preprocessors.schema import to_compact_schema
+from whatsapp_analyzer.preprocessors.pipeline import (
+    preprocess_data,
+    preprocess_chat,
+    select_authors,
+    run_pipeline,
+    PipelineCache,
+    PipelineStep,
+    PIPELINE_STEPS,
+)
 
 __all__ = [
     "get_language_settings",
+    "combine_language_settings",
+    "detect_languages",
     "SUPPORTED_LANGUAGES",
     "process_multimedia",
     "process_emojis",
     "preprocess_timestamps",
     "add_year_week",
     "add_conversation_starter_flag",
+    "update_conversation_starter_flag",
+    "build_sessions",
+    "CONVERSATION_GAP",
     "process_locations",
     "process_links",
     "process_message_length",
     "filter_authors",
+    "valid_authors",
+    "to_compact_schema",
     "preprocess_data",
+    "preprocess_chat",
+    "select_authors",
+    "run_pipeline",
+    "PipelineCache",
+    "PipelineStep",
+    "PIPELINE_STEPS",
 ]
@@ -3,6 +3,7 @@ Data filtering utilities for WhatsApp chat data.
 """
 
 import pandas as pd
+from typing import List
 
 
 def filter_authors(df: pd.DataFrame) -> pd.DataFrame:
@@ -19,6 +20,24 @@ def filter_authors(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Filtered DataFrame
     """
-    has_plus_sign = df.author.str.contains(r'\+', regex=True, na=False)
-    is_null = df.author.isnull()
-    return df[~(has_plus_sign | is_null)]
+    return df[~_is_invalid_author(df.author)]
+
+
+def valid_authors(authors: List[str]) -> List[str]:
+    """
+    Drop the authors that filter_authors() would remove.
+
+    Args:
+        authors: List of author names
+
+    Returns:
+        Authors without phone numbers and null entries, in the same order
+    """
+    authors = pd.Series(authors, dtype=object)
+    return authors[~_is_invalid_author(authors)].tolist()
+
+
+def _is_invalid_author(authors: pd.Series) -> pd.Series:
+    """Flag phone number authors (containing '+') and null authors."""
+    has_plus_sign = authors.str.contains(r'\+', regex=True, na=False)
+    return has_plus_sign | authors.isnull()
@@ -6,57 +6,146 @@ import numpy as np
 import pandas as pd
 from typing import Tuple
 
+# Default silence after which the next message starts a new conversation
+CONVERSATION_GAP = pd.Timedelta('7 hours')
 
-def add_conversation_starter_flag(df: pd.DataFrame) -> pd.DataFrame:
+# Messages linking to a map count as location shares; geo: URIs only at the
+# start of a word and followed by a coordinate, so words ending in "geo:" do not match
+LOCATION_LINK_PATTERN = r'maps\.google\.|google\.[a-z]+(?:\.[a-z]+)?/maps|(?:^|\s)geo:[-+]?\d'
+
+# Coordinates in the map link formats WhatsApp and Google Maps produce:
+# maps.google.com/?q=lat,lon (also loc:lat,lon), query=, ll=, center=,
+# destination= parameters, /@lat,lon and /place/ or /search/ paths, geo:lat,lon
+LOCATION_COORDINATES_PATTERN = (
+    r'(?:[?&](?:q|query|ll|center|destination)=(?:loc:)?|/@|/place/|/search/|(?:^|\s)geo:)'
+    r'(?P<lat>[-+]?\d{1,2}(?:\.\d+)?)\s*(?:,|%2[Cc])\+?\s*(?P<lon>[-+]?\d{1,3}(?:\.\d+)?)'
+)
+
+
+def add_conversation_starter_flag(df: pd.DataFrame, gap: pd.Timedelta = CONVERSATION_GAP) -> pd.DataFrame:
     """
-    Flag messages that start a new conversation.
+    Flag messages that start a new conversation and number the conversations.
 
     A message is considered a conversation starter if it's sent more than
-    7 hours after the previous message.
+    gap (7 hours by default) after the previous message. Conversations are
+    numbered from 0 in order, by the running count of starters.
 
     Args:
         df: DataFrame with 'timestamp' column, sorted chronologically
+        gap: Silence after which a new conversation starts
+
+    Returns:
+        DataFrame with 'is_conversation_starter' flag and 'conversation_id'
+        columns
+    """
+    is_starter = ((df.timestamp - df.timestamp.shift(1)) > gap).astype(int)
+    return df.assign(is_conversation_starter=is_starter, conversation_id=is_starter.cumsum())
+
+
+def update_conversation_starter_flag(
+    df: pd.DataFrame,
+    keep: pd.Series,
+    gap: pd.Timedelta = CONVERSATION_GAP
+) -> pd.DataFrame:
+    """
+    Keep a subset of rows and update their conversation starter flags.
+
+    Gives the same flags and conversation ids as
+    add_conversation_starter_flag() on the kept rows, but only rows whose
+    previous message was dropped are compared again; all other rows keep
+    their flag.
+
+    Args:
+        df: DataFrame with 'timestamp', 'is_conversation_starter' and
+            'conversation_id' columns, sorted chronologically
+        keep: Boolean mask of the rows to keep
+        gap: Silence after which a new conversation starts (the one df
+            was flagged with)
 
     Returns:
-        DataFrame with 'is_conversation_starter' flag column
+        DataFrame with the kept rows and updated flags and ids
+    """
+    positions = np.flatnonzero(keep.to_numpy(dtype=bool))
+    if len(positions) == len(df):
+        return df
+    flags = df['is_conversation_starter'].to_numpy()[positions]
+
+    # Kept rows whose previous message was dropped
+    changed = np.flatnonzero(np.diff(positions, prepend=-1) != 1)
+    if len(changed):
+        flags = flags.copy()
+        if changed[0] == 0:
+            # The first kept row has no previous message at all
+            flags[0] = 0
+            changed = changed[1:]
+        timestamps = df['timestamp'].to_numpy()[positions]
+        flags[changed] = (timestamps[changed] - timestamps[changed - 1]) > pd.Timedelta(gap).to_timedelta64()
+
+    df = df.take(positions)
+    flags = pd.Series(flags, index=df.index, dtype=df['is_conversation_starter'].dtype)
+    conversation_ids = flags.cumsum().astype(df['conversation_id'].dtype)
+    return df.assign(is_conversation_starter=flags, conversation_id=conversation_ids)
+
+
+def build_sessions(df: pd.DataFrame) -> pd.DataFrame:
     """
-    df = df.copy()
-    df['is_conversation_starter'] = (
-        (df.timestamp - df.timestamp.shift(1)) > pd.Timedelta('7 hours')
-    ).astype(int)
-    return df
+    Summarize every conversation in one row.
+
+    Built with one grouped pass over the messages, so session-level
+    analyses can work on this table instead of the messages.
+
+    Args:
+        df: DataFrame with 'timestamp', 'author' and 'conversation_id'
+            columns, sorted chronologically
+
+    Returns:
+        DataFrame indexed by conversation_id with columns:
+        - start, end: Timestamps of the first and last message
+        - duration: end - start
+        - messages: Number of messages
+        - participants: Number of distinct authors
+        - initiator: Author of the first message
+    """
+    grouped = df.groupby('conversation_id', sort=True, observed=True)
+    sessions = grouped['timestamp'].agg(['first', 'last']).rename(columns={'first': 'start', 'last': 'end'})
+    return sessions.assign(
+        duration=sessions['end'] - sessions['start'],
+        messages=grouped.size(),
+        participants=grouped['author'].nunique(),
+        initiator=grouped['author'].first(),
+    )
 
 
 def process_locations(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Extract and process location sharing messages.
 
+    Messages linking to a map are flagged and cleared. Coordinates are
+    read from the links with one regex (see LOCATION_COORDINATES_PATTERN)
+    evaluated by pyarrow's compute kernels; links without coordinates, or
+    with coordinates out of range, are flagged but not located.
+
     Args:
-        df: DataFrame with 'message' column
+        df: DataFrame with 'timestamp', 'author' and 'message' columns
 
     Returns:
-        Tuple of (processed DataFrame, locations DataFrame with lat/lon)
+        Tuple of (processed DataFrame, locations DataFrame with 'timestamp',
+        'author', 'lat' and 'lon' columns, indexed like the shared messages)
     """
-    df = df.copy()
-    df["is_location"] = df.message.str.contains('maps.google', na=False).astype(int)
-    locations = df.loc[df["is_location"] == 1].copy()
-    df.loc[df.is_location == 1, 'message'] = np.nan
-
-    if locations.shape[0] > 0:
-        locs = locations["message"].str.split(" ", expand=True)
-        locs[1] = locs[1].str[27:]
-        locs = locs[1].str.split(",", expand=True)
-        locs = locs.rename(columns={0: "lat", 1: "lon"})
-        locs = locs.loc[
-            (locs["lat"] != "") &
-            (locs["lon"] != "") &
-            (~locs["lat"].isna()) &
-            (~locs["lon"].isna())
-        ]
-        locations = locs[["lat", "lon"]].astype(float).drop_duplicates()
-    else:
-        locations = pd.DataFrame(columns=["lat", "lon"])
-
+    text = df.message.astype("string[pyarrow]")
+    is_location = text.str.contains(LOCATION_LINK_PATTERN, regex=True, na=False).astype(bool)
+
+    coordinates = text[is_location].str.extract(LOCATION_COORDINATES_PATTERN).astype(float)
+    coordinates = coordinates[coordinates['lat'].between(-90, 90) & coordinates['lon'].between(-180, 180)]
+    locations = df.loc[coordinates.index, ['timestamp', 'author']].assign(
+        lat=coordinates['lat'],
+        lon=coordinates['lon'],
+    )
+
+    df = df.assign(
+        message=df.message.mask(is_location, np.nan),
+        is_location=is_location.astype(int),
+    )
     return df, locations
 
 
@@ -70,9 +159,9 @@ def process_links(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with 'is_link' flag column
     """
-    df = df.copy()
-    df['is_link'] = df.message.str.contains(r'https?:\S+', regex=True, na=False).astype(int)
-    return df
+    return df.assign(
+        is_link=df.message.str.contains(r'https?:\S+', regex=True, na=False).astype(int)
+    )
 
 
 def process_message_length(df: pd.DataFrame) -> pd.DataFrame:
@@ -85,7 +174,6 @@ def process_message_length(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with 'msg_length' column
     """
-    df = df.copy()
-    df['msg_length'] = df.message.str.len()
-    df.loc[df.is_link == 1, 'msg_length'] = np.nan
-    return df
+    return df.assign(
+        msg_length=df.message.str.len().astype(float).mask(df.is_link == 1)
+    )
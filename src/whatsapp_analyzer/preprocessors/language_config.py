@@ -1,73 +1,78 @@
 """
 Language configuration for WhatsApp chat analysis.
 
-Supports English, Turkish, and German with patterns for:
+Every language is a pack in the ``languages`` directory next to this module:
+a JSON file named after the language (``english.json`` for English) with
+patterns for:
 - Media types (image, video, gif, audio, sticker)
 - Deleted messages
-- Edited messages (NEW)
+- Edited messages
 - Location sharing
 - Generic media placeholder
+
+Adding a language only takes a new pack file. Packs are read on first use.
+
+The patterns of all packs are compiled once per process into one
+LanguageMatcher (see language_matcher): a hash index of the placeholder
+texts and trie-built regexes of the edit markers and location prefixes.
+Placeholder classification, edited message detection and language
+detection all run on it, so the work per message does not grow with the
+number of languages.
+
+The chat language can also be detected from the messages themselves (see
+detect_languages). Chats whose export language changed over time are
+processed with the combined patterns of all languages found.
 """
 
-from typing import Dict, List, Any
-
-SUPPORTED_LANGUAGES = ["English", "Turkish", "German"]
-
-# Language-specific patterns for WhatsApp message detection
-LANGUAGE_SETTINGS: Dict[str, Dict[str, Any]] = {
-    "English": {
-        "image": "image omitted",
-        "video": "video omitted",
-        "gif": "GIF omitted",
-        "audio": "audio omitted",
-        "sticker": "sticker omitted",
-        "deleted": [
-            "This message was deleted.",
-            "You deleted this message.",
-            "This message was deleted"
-        ],
-        "edited": [
-            "This message was edited",
-            "You edited this message"
-        ],
-        "location": "Location https://",
-        "media": "<Media omitted>",
-    },
-    "Turkish": {
-        "image": "görüntü dahil edilmedi",
-        "video": "video dahil edilmedi",
-        "gif": "GIF dahil edilmedi",
-        "audio": "ses dahil edilmedi",
-        "sticker": "Çıkartma dahil edilmedi",
-        "deleted": [
-            "Bu mesaj silindi.",
-            "Bu mesajı sildiniz."
-        ],
-        "edited": [
-            "Bu mesaj düzenlendi",
-            "Bu mesajı düzenlediniz"
-        ],
-        "location": "Konum https://",
-        "media": "<görüntü dahil edilmedi>"
-    },
-    "German": {
-        "image": "Bild weggelassen",
-        "video": "Video weggelassen",
-        "gif": "GIF weggelassen",
-        "audio": "Audio weggelassen",
-        "sticker": "Sticker weggelassen",
-        "deleted": [
-            "Diese Nachricht wurde gelöscht.",
-            "Du hast diese Nachricht gelöscht."
-        ],
-        "edited": [
-            "Diese Nachricht wurde bearbeitet",
-            "Du hast diese Nachricht bearbeitet"
-        ],
-        "location": "Standort https://",
-        "media": "<Medien weggelassen>"
-    }
-}
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+LANGUAGE_PACK_DIR = os.path.join(os.path.dirname(__file__), "languages")
+
+SUPPORTED_LANGUAGES = sorted(
+    os.path.splitext(name)[0].title()
+    for name in os.listdir(LANGUAGE_PACK_DIR)
+    if name.endswith(".json")
+)
+
+# Keys every language pack defines
+REQUIRED_KEYS = ["image", "video", "gif", "audio", "sticker", "deleted", "edited", "location", "media"]
+
+# Messages inspected by detect_languages(), spread evenly over the chat so
+# a language used only in part of the chat is found as well
+DETECTION_SAMPLE_SIZE = 20000
+
+# Settings whose messages are complete placeholders (the message is only
+# the placeholder text)
+_PLACEHOLDER_KEYS = ["image", "video", "gif", "audio", "sticker", "media", "deleted"]
+
+
+class LanguageMatcher(NamedTuple):
+    """
+    Patterns of all language packs, compiled for matching whole columns.
+
+    Languages are recorded as bit masks over SUPPORTED_LANGUAGES (bit i for
+    SUPPORTED_LANGUAGES[i]), as a text may belong to several languages.
+    """
+
+    # Placeholder texts and the languages of each
+    placeholders: pd.Index
+    placeholder_languages: np.ndarray
+    # Regex of an edit marker at the end of a message, optionally in angle
+    # brackets, and the same with the marker captured (one group)
+    edited_pattern: str
+    edited_capture_pattern: str
+    # Lower-cased edit marker -> languages
+    edited_languages: Dict[str, int]
+    # Regex of a location prefix at the start of a message (one group)
+    location_pattern: str
+    location_languages: Dict[str, int]
 
 
 def get_language_settings(selected_lang: str) -> Dict[str, Any]:
@@ -75,17 +80,189 @@ def get_language_settings(selected_lang: str) -> Dict[str, Any]:
     Get language-specific patterns for WhatsApp message detection.
 
     Args:
-        selected_lang: Language name ("English", "Turkish", or "German")
+        selected_lang: Language name (one of SUPPORTED_LANGUAGES)
 
     Returns:
         Dictionary containing patterns for the selected language
 
     Raises:
-        ValueError: If the language is not supported
+        ValueError: If the language is not supported or its pack is
+            missing required keys
     """
     if selected_lang not in SUPPORTED_LANGUAGES:
         raise ValueError(
             f"Unsupported language: {selected_lang}. "
             f"Supported languages: {', '.join(SUPPORTED_LANGUAGES)}"
         )
-    return LANGUAGE_SETTINGS[selected_lang]
+    return _load_language_pack(selected_lang)
+
+
+def combine_language_settings(languages: List[str]) -> Dict[str, Any]:
+    """
+    Combine the patterns of several languages.
+
+    Args:
+        languages: Language names, in order of precedence
+
+    Returns:
+        Settings dictionary with the same keys as get_language_settings(),
+        each holding the patterns of all given languages as a list (the
+        settings of a single language are returned unchanged)
+
+    Raises:
+        ValueError: If a language is not supported
+    """
+    if len(languages) == 1:
+        return get_language_settings(languages[0])
+
+    combined: Dict[str, List[str]] = {}
+    for language in languages:
+        for key, patterns in get_language_settings(language).items():
+            combined.setdefault(key, []).extend(_as_list(patterns))
+    return combined
+
+
+@lru_cache(maxsize=1)
+def language_matcher() -> LanguageMatcher:
+    """
+    Compile the patterns of all language packs, once per process.
+
+    Returns:
+        LanguageMatcher shared by placeholder classification, edited
+        message detection and language detection
+    """
+    placeholders: Dict[str, int] = {}
+    edited: Dict[str, int] = {}
+    locations: Dict[str, int] = {}
+    for position, language in enumerate(SUPPORTED_LANGUAGES):
+        bit = 1 << position
+        settings = get_language_settings(language)
+        for key in _PLACEHOLDER_KEYS:
+            for text in _as_list(settings[key]):
+                placeholders[text] = placeholders.get(text, 0) | bit
+        for marker in settings["edited"]:
+            edited[marker.lower()] = edited.get(marker.lower(), 0) | bit
+        for prefix in _as_list(settings["location"]):
+            locations[prefix] = locations.get(prefix, 0) | bit
+
+    markers = _trie_pattern(edited)
+    return LanguageMatcher(
+        placeholders=pd.Index(list(placeholders), dtype=object),
+        placeholder_languages=np.fromiter(placeholders.values(), dtype=np.int64, count=len(placeholders)),
+        edited_pattern=rf"(?i)\s*(?:<(?:{markers})>|(?:{markers}))\s*$",
+        edited_capture_pattern=rf"(?i)<?({markers})>?\s*$",
+        edited_languages=edited,
+        location_pattern=f"^({_trie_pattern(locations)})",
+        location_languages=locations,
+    )
+
+
+def detect_languages(messages: pd.Series, sample_size: int = DETECTION_SAMPLE_SIZE) -> List[str]:
+    """
+    Detect the export languages of a chat from its system placeholders.
+
+    A sample of messages is matched against the media, deleted, edited and
+    location placeholders of all supported languages at once (see
+    language_matcher); the regexes are evaluated by pyarrow's compute
+    kernels.
+
+    Args:
+        messages: Series of message texts
+        sample_size: Number of messages to inspect, spread evenly over the
+            chat
+
+    Returns:
+        Languages with at least one placeholder in the sample, most
+        frequent first; empty if the sample has none
+    """
+    sample = messages.dropna()
+    if len(sample) > sample_size:
+        sample = sample.iloc[np.linspace(0, len(sample) - 1, sample_size).astype(int)]
+    if sample.empty:
+        return []
+
+    matcher = language_matcher()
+    text = sample.astype("string[pyarrow]")
+    positions = matcher.placeholders.get_indexer(sample)
+    edited = text.str.extract(matcher.edited_capture_pattern)[0].dropna().astype(object).str.lower()
+    locations = text.str.extract(matcher.location_pattern)[0].dropna().astype(object)
+    masks = np.concatenate([
+        matcher.placeholder_languages[positions[positions >= 0]],
+        edited.map(matcher.edited_languages).to_numpy(dtype=np.int64),
+        locations.map(matcher.location_languages).to_numpy(dtype=np.int64),
+    ])
+
+    counts = np.array([np.count_nonzero(masks & (1 << i)) for i in range(len(SUPPORTED_LANGUAGES))])
+    order = np.argsort(-counts, kind="stable")
+    return [SUPPORTED_LANGUAGES[i] for i in order if counts[i] > 0]
+
+
+def resolve_language_settings(
+    messages: pd.Series,
+    selected_lang: Optional[str] = None
+) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    Get the language settings to process a chat with.
+
+    Args:
+        messages: Series of message texts
+        selected_lang: Language to use; detected from the messages if None
+
+    Returns:
+        Tuple of (languages used, settings dictionary). Chats where no
+        language can be detected are processed with all languages.
+    """
+    if selected_lang is not None:
+        languages = [selected_lang]
+    else:
+        languages = detect_languages(messages) or list(SUPPORTED_LANGUAGES)
+    return languages, combine_language_settings(languages)
+
+
+def __getattr__(name: str) -> Any:
+    # LANGUAGE_SETTINGS reads every pack, so it is only built when asked for
+    if name == "LANGUAGE_SETTINGS":
+        return {language: get_language_settings(language) for language in SUPPORTED_LANGUAGES}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def _load_language_pack(language: str) -> Dict[str, Any]:
+    """Read and check the pack file of a language."""
+    path = os.path.join(LANGUAGE_PACK_DIR, f"{language.lower()}.json")
+    with open(path, encoding="utf-8") as pack_file:
+        settings = json.load(pack_file)
+    missing = [key for key in REQUIRED_KEYS if key not in settings]
+    if missing:
+        raise ValueError(f"Language pack {path} is missing keys: {', '.join(missing)}")
+    return settings
+
+
+def _as_list(patterns: Any) -> List[str]:
+    """Settings values are a single string or a list of strings."""
+    return [patterns] if isinstance(patterns, str) else list(patterns)
+
+
+def _trie_pattern(texts) -> str:
+    """
+    Build a regex alternation of literal texts, factored along their shared
+    prefixes; where one text extends another, the longer one is preferred.
+    """
+    trie: Dict[str, dict] = {}
+    for text in texts:
+        node = trie
+        for char in text:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node: Dict[str, dict]) -> str:
+    """Regex of the text suffixes below a trie node."""
+    branches = [re.escape(char) + _trie_node_pattern(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        pattern = (f"(?:{pattern})" if len(branches) == 1 else pattern) + "?"
+    return pattern
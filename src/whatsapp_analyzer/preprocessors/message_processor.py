@@ -5,7 +5,16 @@ Message processing for multimedia, deleted, and edited message detection.
 import re
 import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+
+from whatsapp_analyzer.preprocessors.language_config import language_matcher
+from whatsapp_analyzer.utils.attachments import attachment_kinds
+from whatsapp_analyzer.utils.emojis import EMOJI_COLUMN, find_emojis
+
+# Placeholder categories in flag column order; deleted comes last so a media
+# placeholder that is also listed as deleted counts as media
+MULTIMEDIA_TYPES = ['image', 'video', 'gif', 'sticker', 'audio', 'media']
+PLACEHOLDER_CATEGORIES = MULTIMEDIA_TYPES + ['deleted']
 
 
 def process_multimedia(df: pd.DataFrame, lang: Dict[str, Any]) -> pd.DataFrame:
@@ -17,8 +26,15 @@ def process_multimedia(df: pd.DataFrame, lang: Dict[str, Any]) -> pd.DataFrame:
     - Deleted messages
     - Edited messages (NEW)
 
-    For deleted and edited messages, the message content is cleared (set to NaN)
-    to exclude from text analysis while preserving the metadata.
+    For multimedia and deleted messages, the message content is cleared (set to
+    NaN) to exclude from text analysis while preserving the metadata. Messages
+    are classified in one pass (see classify_placeholders). Exports with
+    media name the attached file instead of a placeholder; those messages
+    are flagged by the kind of the file (see attachment_kinds).
+
+    Edited messages keep their content, but the edit marker is stripped from
+    the text (see strip_edited_markers) and the words, letters and msg_length
+    columns, where present, are recounted for them.
 
     Args:
         df: DataFrame with 'message' column
@@ -28,90 +44,129 @@ def process_multimedia(df: pd.DataFrame, lang: Dict[str, Any]) -> pd.DataFrame:
         DataFrame with added flag columns:
         - is_image, is_video, is_gif, is_sticker, is_audio, is_media
         - is_deleted
-        - is_edited (NEW)
+        - is_edited
     """
-    df = df.copy()
-
-    # Process multimedia types
-    multimedia_types = ['image', 'video', 'gif', 'sticker', 'audio', 'media']
-    for media_type in multimedia_types:
-        column_name = f'is_{media_type}'
-        df[column_name] = (df.message == lang[media_type]).astype(int)
-        df.loc[df[column_name] == 1, 'message'] = np.nan
+    # Flags for multimedia and deleted messages from one category code array
+    codes = classify_placeholders(df.message, lang)
+    kinds = attachment_kinds(df.message)
+    attached = kinds.notna().to_numpy() & (codes < 0)
+    codes[attached] = pd.Index(PLACEHOLDER_CATEGORIES).get_indexer(kinds[attached])
+    columns = {
+        f'is_{category}': (codes == code).astype(int)
+        for code, category in enumerate(PLACEHOLDER_CATEGORIES)
+    }
+    message = df.message.mask(codes >= 0, np.nan)
 
-    # Process deleted messages
-    df['is_deleted'] = df.message.isin(lang["deleted"]).astype(int)
-    df.loc[df.is_deleted == 1, 'message'] = np.nan
-
-    # Process edited messages (NEW)
-    # Check if message ends with any of the edited patterns
     edited_patterns = lang.get("edited", [])
     if edited_patterns:
-        # Create a regex pattern that matches any of the edited message indicators
-        # These typically appear at the end of the message
-        df['is_edited'] = df.message.apply(
-            lambda x: _check_edited(x, edited_patterns) if pd.notna(x) else False
-        ).astype(int)
-        # Note: We do NOT clear edited message content - just flag it
-        # This differs from deleted messages where content is unavailable
+        message, is_edited = strip_edited_markers(message, edited_patterns)
+        columns['is_edited'] = is_edited.astype(int)
+
+        # Counts of edited messages must not include the stripped marker
+        edited_text = message[is_edited]
+        recounted = {
+            'words': edited_text.str.count(' ') + 1,
+            'letters': edited_text.str.len(),
+            'msg_length': edited_text.str.len(),
+        }
+        for column, counts in recounted.items():
+            if column in df.columns:
+                counts = counts.reindex(df.index, fill_value=0).astype(df[column].dtype)
+                columns[column] = df[column].mask(is_edited & df[column].notna(), counts)
     else:
-        df['is_edited'] = 0
+        columns['is_edited'] = 0
+
+    return df.assign(message=message, **columns)
+
+
+def classify_placeholders(messages: pd.Series, lang: Dict[str, Any]) -> np.ndarray:
+    """
+    Map messages to placeholder categories with a single hash lookup.
 
-    return df
+    The lookup runs on the placeholder index of all language packs (see
+    language_matcher), which is built once per process; placeholders of
+    other languages than the given ones map to -1.
 
+    Args:
+        messages: Series of message texts
+        lang: Language settings dictionary from get_language_settings()
 
-def _check_edited(message: str, edited_patterns: list) -> bool:
+    Returns:
+        Integer array aligned with messages: the position of the category in
+        PLACEHOLDER_CATEGORIES, or -1 for ordinary messages
     """
-    Check if a message contains an edited indicator.
+    placeholders = {}
+    for code, category in enumerate(PLACEHOLDER_CATEGORIES):
+        texts = lang[category]
+        for text in [texts] if isinstance(texts, str) else texts:
+            placeholders.setdefault(text, code)
+
+    index = language_matcher().placeholders
+    known = index.get_indexer(list(placeholders))
+    if (known < 0).any():
+        # Patterns outside the language packs get an index of their own
+        index = pd.Index(list(placeholders))
+        known = np.arange(len(placeholders))
+    codes = np.full(len(index) + 1, -1, dtype=np.intp)
+    codes[known] = list(placeholders.values())
+    return codes[index.get_indexer(messages)]
+
+
+def strip_edited_markers(messages: pd.Series, edited_patterns: List[str]) -> Tuple[pd.Series, pd.Series]:
+    """
+    Detect edited messages and strip the edit marker from their text.
 
-    WhatsApp shows edited status in different ways depending on the version:
-    - Appended to the end of the message
-    - As a separate indicator
+    A message is edited if it ends with one of the patterns (ignoring case
+    and trailing whitespace), optionally wrapped in angle brackets as in
+    Android exports ("text <This message was edited>"). Matching runs as one
+    end-anchored regex over an Arrow-backed copy of the column, so it is
+    evaluated by pyarrow's compute kernels rather than row by row in Python;
+    only the matched rows are rewritten. Markers from the language packs
+    are matched with the shared regex of all packs (see language_matcher).
 
     Args:
-        message: The message text to check
-        edited_patterns: List of patterns indicating edited messages
+        messages: Series of message texts (NaN for cleared messages)
+        edited_patterns: Edit markers of the chat language
 
     Returns:
-        True if the message appears to be edited
+        Tuple of (messages with markers removed, boolean edited mask)
     """
-    if not message:
-        return False
+    matcher = language_matcher()
+    allowed = {pattern.lower() for pattern in edited_patterns}
+    if allowed.issubset(matcher.edited_languages):
+        marker = matcher.edited_pattern
+    else:
+        marker = _edited_marker_pattern(edited_patterns)
+    text = messages.astype("string[pyarrow]")
+    is_edited = text.str.contains(marker, regex=True, na=False).astype(bool)
+    if marker == matcher.edited_pattern and len(allowed) < len(matcher.edited_languages):
+        # Keep only the markers of the given languages
+        found = text[is_edited].str.extract(matcher.edited_capture_pattern)[0].astype(object).str.lower()
+        is_edited[is_edited] = found.isin(allowed).to_numpy()
+    stripped = text[is_edited].str.replace(marker, "", regex=True).astype(object)
+    return messages.mask(is_edited, stripped), is_edited
 
-    message_lower = message.lower().strip()
-    for pattern in edited_patterns:
-        pattern_lower = pattern.lower()
-        # Check if pattern is at the end of message or is the entire message
-        if message_lower.endswith(pattern_lower) or message_lower == pattern_lower:
-            return True
-    return False
+
+def _edited_marker_pattern(edited_patterns: List[str]) -> str:
+    """Build the case-insensitive, end-anchored regex of the edit markers."""
+    # Longest first, so a pattern that ends another one cannot shadow it
+    markers = "|".join(re.escape(p) for p in sorted(edited_patterns, key=len, reverse=True))
+    return rf"(?i)\s*(?:<(?:{markers})>|(?:{markers}))\s*$"
 
 
 def process_emojis(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Detect messages containing emojis.
+    Scan messages for emojis once and keep the result.
+
+    The emojis of every message are stored in the 'emojis' column (a tuple
+    of emoji graphemes, None for messages without any), which the emoji
+    analyzers read instead of scanning the messages again.
 
     Args:
         df: DataFrame with 'message' column
 
     Returns:
-        DataFrame with 'is_emoji' flag column
+        DataFrame with 'emojis' and 'is_emoji' columns
     """
-    df = df.copy()
-
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        u"\U00002702-\U000027B0"
-        u"\U000024C2-\U0001F251"
-        "]+", flags=re.UNICODE)
-
-    def search_emoji(x):
-        if isinstance(x, str):
-            return bool(emoji_pattern.search(x))
-        return False
-
-    df['is_emoji'] = df['message'].apply(search_emoji).astype(int)
-    return df
+    emojis = find_emojis(df['message'])
+    return df.assign(**{EMOJI_COLUMN: emojis, 'is_emoji': emojis.notna().astype(int)})
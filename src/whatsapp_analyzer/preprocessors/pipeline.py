@@ -1,58 +1,360 @@
 """
 Main preprocessing pipeline for WhatsApp chat data.
+
+The pipeline is declared as a list of steps (PIPELINE_STEPS), each naming
+the columns it reads, the columns it writes and the parameters it uses.
+Every column carries a fingerprint of its lineage: input columns are
+fingerprinted once, and a step's output columns get fingerprints derived
+from the step, its parameters and the fingerprints of its inputs. With a
+PipelineCache, a step whose inputs and parameters were seen before is not
+run again and its cached output columns are reused; changing the language,
+for example, reruns only the language-dependent steps.
 """
 
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
 import pandas as pd
-from typing import List, Tuple
 
-from whatsapp_analyzer.preprocessors.language_config import get_language_settings
+from whatsapp_analyzer.preprocessors.language_config import resolve_language_settings
 from whatsapp_analyzer.preprocessors.timestamp_processor import preprocess_timestamps, add_year_week
 from whatsapp_analyzer.preprocessors.feature_extractor import (
     process_links,
     process_message_length,
     process_locations,
     add_conversation_starter_flag,
+    update_conversation_starter_flag,
+    CONVERSATION_GAP,
 )
 from whatsapp_analyzer.preprocessors.message_processor import process_multimedia, process_emojis
-from whatsapp_analyzer.preprocessors.data_filter import filter_authors
+from whatsapp_analyzer.preprocessors.data_filter import valid_authors
+from whatsapp_analyzer.preprocessors.schema import to_compact_schema
+from whatsapp_analyzer.utils.profiling import profile_stage
+
+logger = logging.getLogger(__name__)
+
+# Inputs/outputs of steps that work on the whole frame (selecting,
+# reordering or retyping rows)
+ALL_COLUMNS = ("*",)
+
+
+class PipelineStep(NamedTuple):
+    """
+    A declared preprocessing step.
+
+    The function is called with a frame holding only the input columns
+    (every column for ALL_COLUMNS) and the step's parameters as keyword
+    arguments. It returns a frame with the output columns, or a tuple of
+    that frame and a dictionary of extra results (such as locations).
+    """
+
+    name: str
+    function: Callable[..., Any]
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    params: Tuple[str, ...] = ()
+
+
+class PipelineCache:
+    """
+    In-memory LRU cache of pipeline step results.
+
+    Entries are keyed by step, parameters and input fingerprints. Cached
+    output frames share their columns with the frames built from them
+    (copy-on-write), so a cache hit costs no copying.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        # Step name -> whether it was served from the cache, for the last run
+        self.last_run: Dict[str, bool] = {}
+
+    def get(self, key: str) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """
+        Look up a step result.
+
+        Args:
+            key: Step cache key
+
+        Returns:
+            Tuple of (output frame, extra results), or None
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, output: pd.DataFrame, extras: Dict[str, Any]):
+        """
+        Store a step result, evicting the least recently used entries.
+
+        Args:
+            key: Step cache key
+            output: Frame of the step's output columns
+            extras: Extra results of the step
+        """
+        self._entries[key] = (output, extras)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def hits(self) -> List[str]:
+        """
+        Get the steps that were served from the cache in the last run.
+
+        Returns:
+            Step names in pipeline order
+        """
+        return [name for name, hit in self.last_run.items() if hit]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _sort_valid_authors(df: pd.DataFrame) -> pd.DataFrame:
+    """Process timestamps, keeping the messages of all valid authors."""
+    return preprocess_timestamps(df, valid_authors(df["author"].drop_duplicates().tolist()))
+
+
+def _flag_conversations(df: pd.DataFrame, conversation_gap: pd.Timedelta) -> pd.DataFrame:
+    """Flag conversation starters and number the conversations."""
+    return add_conversation_starter_flag(df, conversation_gap)
+
+
+def _extract_locations(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Process locations, returning the locations frame as an extra result."""
+    df, locations = process_locations(df)
+    return df, {"locations": locations}
+
+
+def _compact(df: pd.DataFrame, compact: bool) -> pd.DataFrame:
+    """Convert to compact column types if requested."""
+    return to_compact_schema(df) if compact else df
+
+
+PIPELINE_STEPS = [
+    PipelineStep("timestamps", _sort_valid_authors, ALL_COLUMNS, ALL_COLUMNS),
+    PipelineStep("links", process_links, ("message",), ("is_link",)),
+    PipelineStep("message_length", process_message_length, ("message", "is_link"), ("msg_length",)),
+    PipelineStep(
+        "multimedia",
+        process_multimedia,
+        ("message", "words", "letters", "msg_length"),
+        ("message", "words", "letters", "msg_length", "is_image", "is_video", "is_gif",
+         "is_sticker", "is_audio", "is_media", "is_deleted", "is_edited"),
+        ("lang",),
+    ),
+    PipelineStep("emojis", process_emojis, ("message",), ("emojis", "is_emoji")),
+    PipelineStep(
+        "conversation_starter",
+        _flag_conversations,
+        ("timestamp",),
+        ("is_conversation_starter", "conversation_id"),
+        ("conversation_gap",),
+    ),
+    PipelineStep("locations", _extract_locations, ("timestamp", "author", "message"), ("message", "is_location")),
+    PipelineStep("year_week", add_year_week, ("timestamp",), ("year", "week")),
+    PipelineStep("compact", _compact, ALL_COLUMNS, ALL_COLUMNS, ("compact",)),
+]
 
 
 def preprocess_data(
     df: pd.DataFrame,
-    selected_lang: str,
-    selected_authors: List[str]
+    selected_lang: Optional[str],
+    selected_authors: List[str],
+    compact: bool = False,
+    conversation_gap: pd.Timedelta = CONVERSATION_GAP
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Run the complete preprocessing pipeline on WhatsApp chat data.
 
-    Pipeline steps:
-    1. Get language settings
-    2. Process timestamps and filter authors
-    3. Process links
-    4. Process message length
-    5. Process multimedia (including edited messages)
-    6. Process emojis
-    7. Filter invalid authors
-    8. Add conversation starter flags
-    9. Process locations
-    10. Add year/week columns
+    Equivalent to preprocess_chat() followed by select_authors(). When the
+    author selection changes often (as in the app), keep the result of
+    preprocess_chat() and only call select_authors() again.
 
     Args:
         df: Raw DataFrame from read_file()
-        selected_lang: Language ("English", "Turkish", or "German")
+        selected_lang: Language ("English", "Turkish", or "German"), or
+            None to detect it from the messages
         selected_authors: List of authors to include in analysis
+        compact: Store the result with compact column types
+            (see to_compact_schema) to reduce memory use
+        conversation_gap: Silence after which a new conversation starts
 
     Returns:
         Tuple of (processed DataFrame, locations DataFrame)
     """
-    lang = get_language_settings(selected_lang)
-    df = preprocess_timestamps(df, selected_authors)
-    df = process_links(df)
-    df = process_message_length(df)
-    df = process_multimedia(df, lang)
-    df = process_emojis(df)
-    df = filter_authors(df)
-    df = add_conversation_starter_flag(df)
-    df, locations = process_locations(df)
-    df = add_year_week(df)
+    df, locations = preprocess_chat(df, selected_lang, compact, conversation_gap=conversation_gap)
+    return select_authors(df, locations, selected_authors, conversation_gap)
+
+
+def preprocess_chat(
+    df: pd.DataFrame,
+    selected_lang: Optional[str],
+    compact: bool = False,
+    cache: Optional[PipelineCache] = None,
+    fingerprint: Optional[str] = None,
+    conversation_gap: pd.Timedelta = CONVERSATION_GAP
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Run the preprocessing steps over the messages of all authors.
+
+    Pipeline steps (see PIPELINE_STEPS):
+    1. Process timestamps and drop invalid authors
+    2. Process links
+    3. Process message length
+    4. Process multimedia (including edited messages)
+    5. Process emojis
+    6. Add conversation starter flags and conversation ids
+    7. Process locations
+    8. Add year/week columns
+    9. Optionally convert to compact column types
+
+    Invalid authors (see filter_authors) are dropped while the rows are
+    sorted, so rows are taken from the input only once. The steps run under
+    pandas copy-on-write: each one attaches its new columns without copying
+    the frame, and the input frame is never modified.
+
+    Without a selected language, the languages are detected from the
+    messages (see detect_languages); chats mixing several export languages
+    are processed with the placeholders of all of them.
+
+    Args:
+        df: Raw DataFrame from read_file()
+        selected_lang: Language ("English", "Turkish", or "German"), or
+            None to detect it from the messages
+        compact: Store the result with compact column types
+            (see to_compact_schema) to reduce memory use
+        cache: Reuse step results of earlier runs; afterwards
+            cache.last_run tells which steps were cache hits
+        fingerprint: Identifies the contents of df (such as the upload's
+            content hash); hashed from the data if not given
+        conversation_gap: Silence after which a new conversation starts
+
+    Returns:
+        Tuple of (processed DataFrame, locations DataFrame with the
+        sharing author and time of each location), to be narrowed down
+        with select_authors()
+    """
+    with profile_stage("preprocess", rows_in=len(df)) as stage, pd.option_context("mode.copy_on_write", True):
+        with profile_stage("preprocess.detect_language", rows_in=len(df)):
+            languages, lang = resolve_language_settings(df["message"], selected_lang)
+        logger.info("preprocess languages: %s", ", ".join(languages))
+        params = {"lang": lang, "compact": compact, "conversation_gap": pd.Timedelta(conversation_gap)}
+        df, extras = run_pipeline(df, PIPELINE_STEPS, params, cache, fingerprint)
+        stage.rows_out = len(df)
+    return df, extras["locations"]
+
+
+def run_pipeline(
+    df: pd.DataFrame,
+    steps: List[PipelineStep],
+    params: Dict[str, Any],
+    cache: Optional[PipelineCache] = None,
+    fingerprint: Optional[str] = None
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Run declared pipeline steps in order, reusing cached step results.
+
+    Every step run is logged at INFO level as computed or cache hit, and
+    profiled as stage "preprocess.<step name>" (see utils.profiling).
+
+    Args:
+        df: Input DataFrame
+        steps: Steps in execution order
+        params: Parameter values by name
+        cache: Step result cache; steps always run if None
+        fingerprint: Identifies the contents of df; hashed from the data
+            if not given
+
+    Returns:
+        Tuple of (resulting DataFrame, extra results of all steps)
+    """
+    fingerprints = _input_fingerprints(df, fingerprint) if cache is not None else {}
+    extras: Dict[str, Any] = {}
+    last_run: Dict[str, bool] = {}
+
+    for step in steps:
+        inputs = list(df.columns) if step.inputs == ALL_COLUMNS else list(step.inputs)
+        step_params = {name: params[name] for name in step.params}
+        key = _step_key(step, step_params, [fingerprints.get(column) for column in inputs])
+
+        with profile_stage(f"preprocess.{step.name}", rows_in=len(df)) as stage:
+            entry = cache.get(key) if cache is not None else None
+            last_run[step.name] = stage.cache_hit = entry is not None
+            if entry is None:
+                result = step.function(df[inputs], **step_params)
+                output, step_extras = result if isinstance(result, tuple) else (result, {})
+                if step.outputs != ALL_COLUMNS:
+                    # In the order the step added them, so reruns and cache hits match
+                    output = output[[column for column in output.columns if column in step.outputs]]
+                entry = (output, step_extras)
+                if cache is not None:
+                    cache.put(key, output, step_extras)
+
+            output, step_extras = entry
+            df = output if step.outputs == ALL_COLUMNS else df.assign(**{column: output[column] for column in output})
+            stage.rows_out = len(df)
+        logger.info("preprocess step %s: %s", step.name, "cache hit" if last_run[step.name] else "computed")
+        extras.update(step_extras)
+        fingerprints.update({column: _hash(key, column) for column in output.columns})
+
+    if cache is not None:
+        cache.last_run = last_run
+    return df, extras
+
+
+def select_authors(
+    df: pd.DataFrame,
+    locations: pd.DataFrame,
+    selected_authors: List[str],
+    conversation_gap: pd.Timedelta = CONVERSATION_GAP
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Narrow preprocessed chat data down to the selected authors.
+
+    Only the conversation starter flags and conversation ids depend on
+    which authors are selected; they are updated for the kept rows (see
+    update_conversation_starter_flag). Everything else is a row filter, so
+    changing the selection is cheap even for very large chats.
+
+    Args:
+        df: Processed DataFrame from preprocess_chat()
+        locations: Locations DataFrame from preprocess_chat()
+        selected_authors: List of authors to include in analysis
+        conversation_gap: The gap preprocess_chat() was run with
+
+    Returns:
+        Tuple of (processed DataFrame, locations DataFrame), the same as
+        preprocess_data() returns for these authors
+    """
+    authors = valid_authors(selected_authors)
+    with profile_stage("select_authors", rows_in=len(df)) as stage, pd.option_context("mode.copy_on_write", True):
+        df = update_conversation_starter_flag(df, df["author"].isin(authors), conversation_gap)
+        locations = locations[locations["author"].isin(authors)]
+        stage.rows_out = len(df)
     return df, locations
+
+
+def _input_fingerprints(df: pd.DataFrame, fingerprint: Optional[str]) -> Dict[str, str]:
+    """Fingerprint every input column, from the given fingerprint or the data."""
+    if fingerprint is not None:
+        return {column: _hash(fingerprint, column) for column in df.columns}
+    return {
+        column: _hash(column, len(df), pd.util.hash_pandas_object(df[column], index=True).sum())
+        for column in df.columns
+    }
+
+
+def _step_key(step: PipelineStep, params: Dict[str, Any], input_fingerprints: List[Optional[str]]) -> str:
+    """Cache key of a step from its name, parameters and input fingerprints."""
+    return _hash(step.name, json.dumps(params, sort_keys=True, default=str), *input_fingerprints)
+
+
+def _hash(*parts) -> str:
+    """md5 hex digest of the parts' string forms."""
+    return hashlib.md5("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()
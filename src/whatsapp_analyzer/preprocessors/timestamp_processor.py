@@ -3,13 +3,24 @@ Timestamp processing utilities for WhatsApp chat data.
 """
 
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 from typing import List
 
+from whatsapp_analyzer.utils.dates import DAY_COLUMN, day_ordinals
+
 
 def preprocess_timestamps(df: pd.DataFrame, selected_authors: List[str]) -> pd.DataFrame:
     """
     Process timestamps and filter by selected authors.
 
+    Timestamps from read_file() are already datetime64 and are used as is;
+    other input is converted. Selected rows are taken in sorted order in a
+    single step; the input frame is not modified.
+
+    The calendar day of every message is stored twice (see utils.dates):
+    as a datetime64 'date' column and as an int32 'day' ordinal for
+    per-day aggregation.
+
     Args:
         df: DataFrame with 'timestamp' and 'author' columns
         selected_authors: List of authors to include
@@ -17,11 +28,19 @@ def preprocess_timestamps(df: pd.DataFrame, selected_authors: List[str]) -> pd.D
     Returns:
         DataFrame with processed timestamps, sorted chronologically
     """
-    df = df.copy()
-    df["timestamp"] = pd.to_datetime(df["timestamp"], errors='coerce')
-    df["date"] = df["timestamp"].dt.strftime('%Y-%m-%d')
-    df = df.loc[df["author"].isin(selected_authors)]
-    return df.sort_values(["timestamp"])
+    if not is_datetime64_any_dtype(df["timestamp"]):
+        df = df.assign(timestamp=pd.to_datetime(df["timestamp"], errors='coerce'))
+
+    # Same order as sort_values() on the selected rows, computed on the
+    # timestamp column alone so only one full-frame take is needed. The sort
+    # is stable, so messages sent in the same minute keep their export order
+    # whichever authors are selected.
+    selected = df["author"].isin(selected_authors).to_numpy()
+    order = df["timestamp"].reset_index(drop=True)[selected].sort_values(kind="stable").index
+    df = df.take(order)
+    # Truncating the datetime64 values to days is far cheaper than strftime
+    dates = pd.Series(df["timestamp"].to_numpy().astype("datetime64[D]"), index=df.index, dtype="datetime64[s]")
+    return df.assign(date=dates, **{DAY_COLUMN: day_ordinals(df["timestamp"])})
 
 
 def add_year_week(df: pd.DataFrame) -> pd.DataFrame:
@@ -34,7 +53,7 @@ def add_year_week(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with 'year' and 'week' columns added
     """
-    df = df.copy()
-    df['year'] = df['timestamp'].dt.year
-    df['week'] = df['timestamp'].dt.isocalendar().week
-    return df
+    return df.assign(
+        year=df['timestamp'].dt.year,
+        week=df['timestamp'].dt.isocalendar().week,
+    )
@@ -4,7 +4,11 @@ Chat summary calculation for WhatsApp chat analysis UI.
 
 import pandas as pd
 
+from whatsapp_analyzer.utils.dates import MISSING_DAY, days_of, ordinals_to_dates
+from whatsapp_analyzer.utils.profiling import profiled
 
+
+@profiled("analyzer.calculate_chat_summary")
 def calculate_chat_summary(df: pd.DataFrame) -> dict:
     """
     Calculate summary statistics for a chat.
@@ -24,17 +28,15 @@ def calculate_chat_summary(df: pd.DataFrame) -> dict:
         - most_active_author_messages: Their message count
         - most_active_author_percentage: Their percentage of total
     """
-    df = df.copy()
     total_messages = len(df)
     unique_authors = len(df.author.unique())
 
-    # Convert date strings to datetime objects if needed
-    if df['date'].dtype == object:
-        df['date'] = pd.to_datetime(df['date'])
-
-    start_date = df.date.min()
-    end_date = df.date.max()
-    total_days = (end_date - start_date).days + 1  # Include both start and end dates
+    # Day bounds come straight from the day ordinals
+    days = days_of(df)
+    days = days[days != MISSING_DAY]
+    first_day, last_day = days.min(), days.max()
+    start_date, end_date = ordinals_to_dates([first_day, last_day])
+    total_days = int(last_day - first_day) + 1  # Include both start and end dates
     avg_messages_per_day = total_messages / total_days
 
     author_counts = df['author'].value_counts()
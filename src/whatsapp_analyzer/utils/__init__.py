@@ -1,6 +1,32 @@
 """Utility modules for WhatsApp chat analysis."""
 
+from whatsapp_analyzer.utils.emojis import (
+    EMOJI_COLUMN,
+    emoji_graphemes,
+    find_emojis,
+    explode_emojis,
+    count_emojis,
+)
+from whatsapp_analyzer.utils.attachments import attachment_kinds
+from whatsapp_analyzer.utils.dates import (
+    DAY_COLUMN,
+    MISSING_DAY,
+    day_ordinals,
+    days_of,
+    ordinals_to_dates,
+    ordinal_weekdays,
+    ordinal_months,
+    months_to_periods,
+)
+from whatsapp_analyzer.utils.frame_cache import frame_cached
 from whatsapp_analyzer.utils.math_helpers import gcd, findnum, percent_helper
+from whatsapp_analyzer.utils.profiling import (
+    ProfileReport,
+    StageProfile,
+    profiling,
+    profile_stage,
+    profiled,
+)
 from whatsapp_analyzer.utils.validators import (
     validate_dataframe,
     validate_language,
@@ -16,4 +42,24 @@ __all__ = [
     "validate_language",
     "validate_authors",
     "ValidationError",
+    "EMOJI_COLUMN",
+    "emoji_graphemes",
+    "find_emojis",
+    "explode_emojis",
+    "count_emojis",
+    "attachment_kinds",
+    "DAY_COLUMN",
+    "MISSING_DAY",
+    "day_ordinals",
+    "days_of",
+    "ordinals_to_dates",
+    "ordinal_weekdays",
+    "ordinal_months",
+    "months_to_periods",
+    "frame_cached",
+    "ProfileReport",
+    "StageProfile",
+    "profiling",
+    "profile_stage",
+    "profiled",
 ]
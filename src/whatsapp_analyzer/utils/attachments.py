@@ -0,0 +1,74 @@
+"""
+Attachment references of WhatsApp exports with media.
+
+Exports with media name each attached file instead of writing a
+placeholder text: ``<attached: 00000012-PHOTO-2022-03-12-01-05-33.jpg>``
+on iOS and ``IMG-20220312-WA0001.jpg (file attached)`` on Android. The
+file names follow the same patterns in every export language, so the
+media kind of a message is read from the name it references. Zip exports
+are indexed with the same patterns (see parsers.zip_reader).
+"""
+
+import re
+
+import pandas as pd
+
+# iOS: 00000012-PHOTO-2022-03-12-01-05-33.jpg
+IOS_MEDIA_PATTERN = re.compile(
+    r"^\d+-(?P<kind>PHOTO|VIDEO|AUDIO|STICKER|GIF)-(?P<date>\d{4}-\d{2}-\d{2})-\d{2}-\d{2}-\d{2}\."
+)
+# Android: IMG-20220312-WA0001.jpg
+ANDROID_MEDIA_PATTERN = re.compile(r"^(?P<kind>IMG|VID|AUD|PTT|STK|DOC)-(?P<date>\d{8})-WA\d+")
+
+# Media kinds use the same names as the language settings placeholders
+MEDIA_KINDS = {
+    "PHOTO": "image", "IMG": "image",
+    "VIDEO": "video", "VID": "video",
+    "AUDIO": "audio", "AUD": "audio", "PTT": "audio",
+    "STICKER": "sticker", "STK": "sticker",
+    "GIF": "gif",
+    "DOC": "media",
+}
+
+# An attachment referenced anywhere in a message (names are looked up in
+# the archive, so the Android form may be loose)
+ATTACHMENT_PATTERN = r"<attached: (?P<ios>[^>]+)>|^(?P<android>[\w-]+\.\w+) \("
+
+# A message that is only an attachment reference; the iOS label and the
+# Android suffix are translated, the file names are not
+_ATTACHMENT_MESSAGE_PATTERN = (
+    r"^\s*<[^<>:]+: (?P<ios>\d+-[^<>]+)>\s*$"
+    r"|^(?P<android>(?:IMG|VID|AUD|PTT|STK|DOC)-\d{8}-WA\d+\.\w+) \([^()]*\)\s*$"
+)
+
+# Cheap pre-filter: attachment messages end with the reference's bracket
+_ATTACHMENT_END_PATTERN = r"[>)]\s*$"
+
+_MEDIA_NAME_KIND_PATTERN = (
+    r"^\d+-(?P<ios>PHOTO|VIDEO|AUDIO|STICKER|GIF)-"
+    r"|^(?P<android>IMG|VID|AUD|PTT|STK|DOC)-\d{8}-WA"
+)
+
+
+def attachment_kinds(messages: pd.Series) -> pd.Series:
+    """
+    Get the media kind of messages that are only an attachment reference.
+
+    Matching runs on an Arrow-backed copy of the column; only messages
+    ending in a bracket are matched against the full pattern.
+
+    Args:
+        messages: Series of message texts
+
+    Returns:
+        Series aligned with messages: the media kind (image, video, audio,
+        sticker, gif or media) of attachment messages, NaN for the others
+    """
+    text = messages.astype("string[pyarrow]")
+    candidates = text[text.str.contains(_ATTACHMENT_END_PATTERN, regex=True, na=False).astype(bool)]
+    names = candidates.str.extract(_ATTACHMENT_MESSAGE_PATTERN)
+    names = names["ios"].fillna(names["android"])
+    referenced = names[names.notna()]
+    prefixes = referenced.str.extract(_MEDIA_NAME_KIND_PATTERN)
+    kinds = prefixes["ios"].fillna(prefixes["android"]).astype(object).map(MEDIA_KINDS).fillna("media")
+    return kinds.reindex(messages.index)
@@ -0,0 +1,113 @@
+"""
+Calendar days shared by preprocessing and the analyzers.
+
+The processed frame carries two day columns derived from the timestamps:
+
+- ``date``: the timestamp truncated to the day, as a datetime64 column
+- ``day``: the day ordinal, days since 1970-01-01 as int32
+
+Day ordinals are plain small integers, so per-day aggregations can use
+``np.bincount`` (offset by the first day) instead of a groupby on dates.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+DAY_COLUMN = "day"
+
+# Day ordinal of missing timestamps
+MISSING_DAY = -1
+
+
+def day_ordinals(timestamps: pd.Series) -> np.ndarray:
+    """
+    Convert timestamps to day ordinals.
+
+    Args:
+        timestamps: datetime64 Series
+
+    Returns:
+        int32 array of days since 1970-01-01 (MISSING_DAY for NaT)
+    """
+    days = timestamps.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    missing = np.isnat(days)
+    ordinals = days.astype(np.int64)
+    if missing.any():
+        ordinals[missing] = MISSING_DAY
+    return ordinals.astype(np.int32)
+
+
+def days_of(df: pd.DataFrame) -> np.ndarray:
+    """
+    Get the day ordinals of a frame's messages.
+
+    Args:
+        df: DataFrame with a 'day' column, or a 'timestamp' column for
+            frames that were not preprocessed
+
+    Returns:
+        int32 array of day ordinals aligned with df
+    """
+    if DAY_COLUMN in df.columns:
+        return df[DAY_COLUMN].to_numpy(dtype=np.int32)
+    return day_ordinals(df["timestamp"])
+
+
+def ordinals_to_dates(ordinals: np.ndarray) -> pd.DatetimeIndex:
+    """
+    Convert day ordinals back to dates.
+
+    Args:
+        ordinals: Array of day ordinals
+
+    Returns:
+        DatetimeIndex at midnight of each day
+    """
+    return pd.DatetimeIndex(np.asarray(ordinals, dtype=np.int64).astype("datetime64[D]"))
+
+
+def ordinal_weekdays(ordinals: np.ndarray) -> np.ndarray:
+    """
+    Get the weekdays of day ordinals.
+
+    Args:
+        ordinals: Array of day ordinals
+
+    Returns:
+        int64 array of weekdays, Monday=0 to Sunday=6
+    """
+    # 1970-01-01 was a Thursday
+    return (np.asarray(ordinals, dtype=np.int64) + 3) % 7
+
+
+def ordinal_months(ordinals: np.ndarray) -> np.ndarray:
+    """
+    Get the months of day ordinals.
+
+    Args:
+        ordinals: Array of day ordinals
+
+    Returns:
+        int64 array of months since January 1970, the ordinals of monthly
+        pandas Periods (the year is ``months // 12 + 1970``)
+    """
+    days = np.asarray(ordinals, dtype=np.int64).astype("datetime64[D]")
+    return days.astype("datetime64[M]").astype(np.int64)
+
+
+def months_to_periods(months: np.ndarray, name: Optional[str] = None) -> pd.PeriodIndex:
+    """
+    Convert month ordinals back to monthly periods.
+
+    Args:
+        months: Array of months since January 1970 (see ordinal_months)
+        name: Name of the index
+
+    Returns:
+        Monthly PeriodIndex
+    """
+    # PeriodIndex.from_ordinals needs pandas 2.2; PeriodArray takes ordinals on all 2.x
+    periods = pd.arrays.PeriodArray(np.asarray(months, dtype=np.int64), dtype=pd.PeriodDtype("M"))
+    return pd.PeriodIndex(periods, name=name)
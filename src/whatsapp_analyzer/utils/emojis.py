@@ -0,0 +1,150 @@
+"""
+Emoji scanning shared by preprocessing and the content analyzers.
+
+Emojis are matched as whole graphemes against the sequences known to the
+``emoji`` package (longest match first), so ZWJ sequences (👨‍👩‍👧), skin
+tones (👍🏽), flags (🇩🇪) and keycaps (1️⃣) count as one emoji each.
+Messages are pre-filtered with one regex over an Arrow-backed copy of the
+column, so only messages that can contain an emoji are scanned in Python.
+
+The scan result is kept in the ``emojis`` column of the processed frame:
+a tuple of the message's emojis, or None for messages without any. The
+emoji flag, the top-emoji table and per-author emoji stats are all derived
+from that column.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
+
+import emoji
+import numpy as np
+import pandas as pd
+
+EMOJI_COLUMN = "emojis"
+
+_KEYCAP_PATTERN = "[#*0-9]️?⃣"
+
+# Bare symbols below this code point (©, ®, ™, ↔, ...) are ordinary text
+# unless followed by the emoji variation selector
+_FIRST_BARE_EMOJI = 0x2300
+
+
+def emoji_graphemes(text: str) -> List[str]:
+    """
+    Extract the emojis of a text as whole graphemes.
+
+    Bare text symbols that the emoji set also covers (©, ®, ™, arrows) are
+    only counted when written with the emoji variation selector.
+
+    Args:
+        text: Input string
+
+    Returns:
+        List of emoji strings in order of appearance
+    """
+    start_pattern, lengths = _emoji_index()
+    found = []
+    match = start_pattern.search(text)
+    while match is not None:
+        start = match.start()
+        end = start + 1
+        for length in lengths[text[start]]:
+            sequence = text[start:start + length]
+            if sequence in emoji.EMOJI_DATA:
+                if length > 1 or ord(sequence) >= _FIRST_BARE_EMOJI:
+                    found.append(sequence)
+                end = start + length
+                break
+        match = start_pattern.search(text, end)
+    return found
+
+
+def find_emojis(messages: pd.Series) -> pd.Series:
+    """
+    Scan a message column for emojis.
+
+    Args:
+        messages: Series of message texts (NaN for cleared messages)
+
+    Returns:
+        Object Series aligned with messages holding a tuple of emojis per
+        message, or None where a message has no emojis
+    """
+    text = messages.astype("string[pyarrow]")
+    candidates = text.str.contains(_candidate_pattern(), regex=True, na=False).astype(bool)
+
+    # Chats repeat short emoji messages a lot, so each distinct text is scanned once
+    candidate_messages = messages[candidates]
+    found = {message: tuple(emoji_graphemes(message)) or None for message in candidate_messages.unique()}
+    result = pd.Series(np.full(len(messages), None, dtype=object), index=messages.index)
+    result[candidates] = candidate_messages.map(found)
+    return result
+
+
+def explode_emojis(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per emoji occurrence, from a frame with an ``emojis`` column.
+
+    Frames without the column (not preprocessed) are scanned on the fly.
+
+    Args:
+        df: DataFrame with 'author' and 'emojis' (or 'message') columns
+
+    Returns:
+        DataFrame with 'author' and 'emoji' columns
+    """
+    emojis = df[EMOJI_COLUMN] if EMOJI_COLUMN in df.columns else find_emojis(df["message"])
+    # Arrow list columns (compact schema) come back as arrays; tuples explode the same way
+    emojis = emojis[emojis.notna()].map(tuple)
+    exploded = pd.DataFrame({"author": df.loc[emojis.index, "author"], "emoji": emojis}).explode("emoji")
+    return exploded.reset_index(drop=True)
+
+
+def count_emojis(df: pd.DataFrame, top: Optional[int] = None) -> pd.DataFrame:
+    """
+    Count emoji occurrences over a whole frame.
+
+    Args:
+        df: DataFrame with 'author' and 'emojis' (or 'message') columns
+        top: Only return the most used emojis
+
+    Returns:
+        DataFrame with 'Emoji' and 'Count' columns, most used first
+    """
+    counts = explode_emojis(df)["emoji"].value_counts()
+    if top is not None:
+        counts = counts.head(top)
+    return pd.DataFrame({"Emoji": counts.index.astype(object), "Count": counts.to_numpy(dtype=int)})
+
+
+@lru_cache(maxsize=1)
+def _emoji_index() -> Tuple[Pattern, Dict[str, List[int]]]:
+    """Regex of emoji start characters and sequence lengths per start character."""
+    lengths: Dict[str, set] = {}
+    for sequence in emoji.EMOJI_DATA:
+        lengths.setdefault(sequence[0], set()).add(len(sequence))
+    start_pattern = re.compile(_character_class(ord(char) for char in lengths))
+    return start_pattern, {char: sorted(found, reverse=True) for char, found in lengths.items()}
+
+
+@lru_cache(maxsize=1)
+def _candidate_pattern() -> str:
+    """Regex matching any text that may contain an emoji."""
+    code_points = (ord(char) for sequence in emoji.EMOJI_DATA for char in sequence if ord(char) >= 128)
+    return f"{_character_class(code_points)}|{_KEYCAP_PATTERN}"
+
+
+def _character_class(code_points) -> str:
+    """Build a regex character class of code points, merged into ranges."""
+    ranges: List[List[int]] = []
+    for code_point in sorted(set(code_points)):
+        if ranges and ranges[-1][1] == code_point - 1:
+            ranges[-1][1] = code_point
+        else:
+            ranges.append([code_point, code_point])
+    # Escape every bound; a raw '#', '*' or '-' would be read as regex syntax
+    return "[" + "".join(
+        re.escape(chr(low)) if low == high else f"{re.escape(chr(low))}-{re.escape(chr(high))}"
+        for low, high in ranges
+    ) + "]"
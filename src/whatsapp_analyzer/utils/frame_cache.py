@@ -0,0 +1,48 @@
+"""
+Per-frame cache of aggregates derived from a processed frame.
+
+Several analyzers read the same derived tables (the activity cube, the
+daily activity matrix, the reply events). Each table is built on first
+use and cached by the identity of the frame it was built from, for as
+long as that frame is alive, so every analyzer and every rerun of the app
+on the same processed frame share it.
+
+Processed frames are not modified in place; a frame that is changed after
+an aggregate was built from it must be copied first.
+"""
+
+import weakref
+from typing import Any, Callable, Dict, Tuple
+
+import pandas as pd
+
+from whatsapp_analyzer.utils.profiling import profile_stage
+
+# Aggregates by id() of the frame they were built from and aggregate name
+_cache: Dict[Tuple[int, str], Any] = {}
+
+
+def frame_cached(df: pd.DataFrame, name: str, build: Callable[[pd.DataFrame], Any]) -> Any:
+    """
+    Get an aggregate of a frame, building and caching it if missing.
+
+    Lookups are profiled as stage ``analyzer.<name>``, with cache_hit set.
+
+    Args:
+        df: Frame the aggregate is derived from
+        name: Aggregate name, unique per build function
+        build: Function building the aggregate from df
+
+    Returns:
+        The cached or newly built aggregate
+    """
+    key = (id(df), name)
+    with profile_stage(f"analyzer.{name}", rows_in=len(df)) as stage:
+        value = _cache.get(key)
+        stage.cache_hit = value is not None
+        if value is None:
+            value = build(df)
+            _cache[key] = value
+            # Drop the entry with the frame, before its id can be reused
+            weakref.finalize(df, _cache.pop, key, None)
+    return value
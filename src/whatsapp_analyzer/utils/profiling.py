@@ -0,0 +1,273 @@
+"""
+Per-stage timing and memory profiling.
+
+Pipeline steps, file reading and analyzer calls are wrapped in
+profile_stage() (analyzers through the @profiled decorator). Outside of a
+profiling() block these wrappers only look up the active report and do
+nothing else, so they are cheap enough to stay in place permanently.
+
+Inside a profiling() block every stage is recorded in a ProfileReport with
+its wall time, CPU time, peak memory allocated while it ran (tracemalloc)
+and the row counts going in and out. Stages may nest; the nesting depth is
+kept for display.
+
+tracemalloc is process-global while reports belong to one run (one app
+session), so tracing is shared: the first profiling() block that traces
+memory starts it and the last one to finish stops it. While more than one
+such block is active, their allocations cannot be told apart and stages
+record no peak memory.
+
+Configuration (environment variables):
+- WHATSAPP_ANALYZER_PROFILE_LOG: append every profiled run to this file as
+  JSON lines (one object per stage)
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, Iterator, List, NamedTuple, Optional
+
+import pandas as pd
+
+PROFILE_LOG_ENV = "WHATSAPP_ANALYZER_PROFILE_LOG"
+
+_active_report: contextvars.ContextVar = contextvars.ContextVar("active_profile_report", default=None)
+
+# Active profiling() blocks tracing memory, and whether tracing was started
+# by them (rather than already running), guarded by _tracing_lock
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_started_tracing = False
+
+
+class StageProfile(NamedTuple):
+    """Measurements of one profiled stage."""
+
+    stage: str
+    depth: int
+    wall_seconds: float
+    cpu_seconds: float
+    peak_mb: Optional[float]
+    rows_in: Optional[int]
+    rows_out: Optional[int]
+    cache_hit: Optional[bool]
+
+
+class StageRecorder:
+    """
+    Handle for a running stage, to fill in what is only known at its end.
+
+    Attributes:
+        rows_out: Number of rows the stage produced
+        cache_hit: Whether the stage was served from a cache
+    """
+
+    def __init__(self):
+        self.rows_out: Optional[int] = None
+        self.cache_hit: Optional[bool] = None
+
+
+class ProfileReport:
+    """
+    Stage measurements of one profiled run.
+
+    Stages are listed in the order they started, so an enclosing stage
+    comes before the stages it ran.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        """
+        Args:
+            trace_memory: Measure peak memory with tracemalloc (slows the
+                profiled code down noticeably)
+        """
+        self.trace_memory = trace_memory
+        self.started = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.stages: List[StageProfile] = []
+        # Peak traced memory of the stages still running, innermost last
+        self._open_peaks: List[int] = []
+
+    def total_seconds(self) -> float:
+        """
+        Get the wall time of all top-level stages.
+
+        Returns:
+            Seconds spent in profiled stages
+        """
+        return sum(stage.wall_seconds for stage in self.stages if stage.depth == 0)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Get the stage measurements as a table.
+
+        Returns:
+            DataFrame with one row per stage and one column per
+            StageProfile field
+        """
+        table = pd.DataFrame(self.stages, columns=StageProfile._fields)
+        return table.astype({"rows_in": "Int64", "rows_out": "Int64"})
+
+    def to_json_lines(self) -> str:
+        """
+        Serialize the report as JSON lines.
+
+        Returns:
+            One JSON object per stage, each tagged with the run start time
+        """
+        return "".join(
+            json.dumps({"run": self.started, **stage._asdict()}) + "\n"
+            for stage in self.stages
+        )
+
+    def write_json_lines(self, path: str):
+        """
+        Append the report to a JSON lines file.
+
+        Args:
+            path: Log file path (created if missing)
+        """
+        with open(path, "a", encoding="utf-8") as log:
+            log.write(self.to_json_lines())
+
+
+@contextmanager
+def profiling(report: Optional[ProfileReport] = None, log_path: Optional[str] = None) -> Iterator[ProfileReport]:
+    """
+    Record all stages run inside the block.
+
+    Args:
+        report: Report to record into (a new one if not given)
+        log_path: Append the report to this JSON lines file at the end;
+            defaults to the WHATSAPP_ANALYZER_PROFILE_LOG variable
+
+    Yields:
+        The ProfileReport being recorded
+    """
+    report = report or ProfileReport()
+    log_path = log_path or os.environ.get(PROFILE_LOG_ENV)
+    if report.trace_memory:
+        _acquire_tracing()
+    token = _active_report.set(report)
+    try:
+        yield report
+    finally:
+        _active_report.reset(token)
+        if report.trace_memory:
+            _release_tracing()
+        if log_path:
+            report.write_json_lines(log_path)
+
+
+def _acquire_tracing():
+    """Register a profiling() block tracing memory, starting tracemalloc if needed."""
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracing_users += 1
+
+
+def _release_tracing():
+    """Unregister a profiling() block; the last one stops tracing it started."""
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+def _tracing_exclusively() -> bool:
+    """Whether the calling run is the only one tracing memory."""
+    with _tracing_lock:
+        return _tracing_users == 1 and tracemalloc.is_tracing()
+
+
+@contextmanager
+def profile_stage(name: str, rows_in: Optional[int] = None) -> Iterator[StageRecorder]:
+    """
+    Measure a stage if a profiling() block is active.
+
+    Args:
+        name: Stage name, such as "preprocess.links"
+        rows_in: Number of rows the stage starts from
+
+    Yields:
+        StageRecorder to set rows_out and cache_hit on
+    """
+    recorder = StageRecorder()
+    report = _active_report.get()
+    if report is None:
+        yield recorder
+        return
+
+    # Peaks are reset per stage, which would disturb another traced run
+    tracing = report.trace_memory and _tracing_exclusively()
+    if tracing:
+        start_memory, peak_so_far = tracemalloc.get_traced_memory()
+        # Resetting the peak below would lose the enclosing stage's peak so far
+        if report._open_peaks:
+            report._open_peaks[-1] = max(report._open_peaks[-1], peak_so_far)
+        tracemalloc.reset_peak()
+    depth = len(report._open_peaks)
+    report._open_peaks.append(0)
+    # Reserve the stage's place in start order; it is filled in at the end
+    position = len(report.stages)
+    report.stages.append(None)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield recorder
+    finally:
+        wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+        # Nested stages reset the peak, so theirs are carried up explicitly
+        peak = max(tracemalloc.get_traced_memory()[1], report._open_peaks.pop()) if tracing else 0
+        if report._open_peaks:
+            report._open_peaks[-1] = max(report._open_peaks[-1], peak)
+        # Another run that started tracing meanwhile may have reset the peak
+        measured = tracing and _tracing_exclusively()
+        report.stages[position] = StageProfile(
+            stage=name,
+            depth=depth,
+            wall_seconds=wall,
+            cpu_seconds=cpu,
+            peak_mb=(peak - start_memory) / (1024 * 1024) if measured else None,
+            rows_in=rows_in,
+            rows_out=recorder.rows_out,
+            cache_hit=recorder.cache_hit,
+        )
+
+
+def profiled(name: str):
+    """
+    Decorator profiling every call of an analyzer.
+
+    Row counts are taken from a DataFrame first argument and a DataFrame or
+    Series result.
+
+    Args:
+        name: Stage name, such as "analyzer.basic_stats"
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active_report.get() is None:
+                return func(*args, **kwargs)
+            rows_in = _row_count(args[0]) if args else None
+            with profile_stage(name, rows_in=rows_in) as stage:
+                result = func(*args, **kwargs)
+                stage.rows_out = _row_count(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _row_count(value: Any) -> Optional[int]:
+    """Row count of frames and series, None for anything else."""
+    return len(value) if isinstance(value, (pd.DataFrame, pd.Series)) else None
@@ -2,6 +2,7 @@
 Word cloud generation for WhatsApp chat data.
 """
 
+import numpy as np
 import pandas as pd
 from wordcloud import WordCloud
 
@@ -19,7 +20,9 @@ def create_word_cloud(df: pd.DataFrame, min_word_length: int = 4, max_words: int
         PIL Image object of the word cloud
     """
     # Combine all messages and split into words
-    all_words = ' '.join(df['message'].astype(str)).split()
+    # Missing messages read as "nan" whatever the column's string dtype
+    messages = df['message'].to_numpy(dtype=object, na_value=np.nan).astype(str)
+    all_words = ' '.join(messages).split()
 
     # Filter by minimum word length
     all_words = [w for w in all_words if len(w) >= min_word_length]
@@ -7,6 +7,7 @@ English, Turkish, and German languages.
 
 import os
 import sys
+from contextlib import nullcontext
 
 import streamlit as st
 
@@ -15,8 +16,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from ui.sidebar import render_sidebar
 from ui.tabs import render_tabs
-from ui.compat import safe_status, safe_toast
-from whatsapp_analyzer.preprocessors import preprocess_data
+from ui.compat import safe_query_param, safe_status, safe_toast
+from ui.components import debug_panel_enabled, render_debug_panel
+from whatsapp_analyzer.preprocessors import PipelineCache, build_sessions, preprocess_chat, select_authors
+from whatsapp_analyzer.utils.frame_cache import frame_cached
+from whatsapp_analyzer.utils.profiling import PROFILE_LOG_ENV, ProfileReport, profiling
 
 # Page configuration
 st.set_page_config(
@@ -35,9 +39,16 @@ def initialize_session_state():
     """Initialize session state variables if they don't exist."""
     defaults = {
         'raw_data': None,
+        'chat_data': None,
+        'chat_locations': None,
+        'chat_key': None,
+        'selection_key': None,
+        'pipeline_cache': None,
         'processed_data': None,
         'locations': None,
+        'sessions': None,
         'file_hash': None,
+        'detected_languages': None,
     }
 
     for key, default_value in defaults.items():
@@ -47,6 +58,24 @@ def initialize_session_state():
 
 def main():
     """Main application entry point."""
+    # Profile runs for the hidden debug panel (?debug=1, if the deployment
+    # allows it) or the JSON lines log; only the panel traces memory
+    debug = debug_panel_enabled() and safe_query_param("debug") is not None
+    if debug:
+        report = ProfileReport()
+    elif os.environ.get(PROFILE_LOG_ENV):
+        report = ProfileReport(trace_memory=False)
+    else:
+        report = None
+    with profiling(report) if report is not None else nullcontext():
+        _run_app()
+
+    if debug:
+        render_debug_panel(report)
+
+
+def _run_app():
+    """Render the sidebar and the main content area."""
     # Initialize session state
     initialize_session_state()
 
@@ -59,7 +88,9 @@ def main():
         _run_analysis(config)
 
     elif st.session_state.processed_data is not None:
-        # Show existing analysis
+        # Show existing analysis for the current author selection
+        if config['ready_to_analyze'] and st.session_state.chat_key == _chat_key(config):
+            _select_authors(config)
         _show_analysis()
 
     else:
@@ -67,20 +98,60 @@ def main():
         _show_welcome()
 
 
+def _chat_key(config):
+    """Identify the preprocessed chat: it only depends on file and settings, not on authors."""
+    return (st.session_state.file_hash, config['selected_lang'], config['compact'], config['conversation_gap'])
+
+
+def _select_authors(config):
+    """
+    Narrow the preprocessed chat down to the selected authors.
+
+    The selection is only applied again when the chat or the authors
+    changed, so reruns keep the same frame and the aggregates cached for it.
+    """
+    selection_key = (_chat_key(config), tuple(config['selected_authors']))
+    if st.session_state.selection_key == selection_key:
+        return
+
+    df, locations = select_authors(
+        st.session_state.chat_data,
+        st.session_state.chat_locations,
+        config['selected_authors'],
+        config['conversation_gap']
+    )
+    st.session_state.processed_data = df
+    st.session_state.locations = locations
+    # Kept with the messages so session analyses need no pass over them;
+    # cached per frame, so a selection mapping to the same frame reuses it
+    st.session_state.sessions = frame_cached(df, "sessions", build_sessions)
+    st.session_state.selection_key = selection_key
+
+
 def _run_analysis(config):
     """Run the analysis pipeline and store results."""
     with safe_status("Analyzing your chat...", expanded=True) as status:
-        status.update(label="Preprocessing data...")
-
-        df, locations = preprocess_data(
-            df=st.session_state.raw_data.copy(),
-            selected_lang=config['selected_lang'],
-            selected_authors=config['selected_authors']
-        )
-
-        # Store processed data in session state
-        st.session_state.processed_data = df
-        st.session_state.locations = locations
+        # The pipeline runs once per file and language for all authors;
+        # re-analyzing with other authors only applies the selection
+        if st.session_state.chat_key != _chat_key(config):
+            status.update(label="Preprocessing data...")
+            if st.session_state.pipeline_cache is None:
+                st.session_state.pipeline_cache = PipelineCache()
+            # Steps that do not depend on a changed setting are reused
+            df, locations = preprocess_chat(
+                df=st.session_state.raw_data,
+                selected_lang=config['selected_lang'],
+                compact=config['compact'],
+                cache=st.session_state.pipeline_cache,
+                fingerprint=st.session_state.file_hash,
+                conversation_gap=config['conversation_gap']
+            )
+            st.session_state.chat_data = df
+            st.session_state.chat_locations = locations
+            st.session_state.chat_key = _chat_key(config)
+
+        status.update(label="Selecting authors...")
+        _select_authors(config)
 
         status.update(label="Analysis complete!", state="complete")
 
@@ -96,9 +167,10 @@ def _show_analysis():
 
     df = st.session_state.processed_data
     locations = st.session_state.locations
+    sessions = st.session_state.sessions
 
     # Render tabs with analysis
-    render_tabs(df, locations)
+    render_tabs(df, locations, sessions)
 
 
 def _show_welcome():
@@ -118,8 +190,8 @@ def _show_welcome():
     - ☁️ Word clouds and emoji analysis
 
     **Getting Started:**
-    1. Export your chat from WhatsApp (without media)
-    2. Upload the .txt file using the sidebar
+    1. Export your chat from WhatsApp (with or without media)
+    2. Upload the .txt or .zip file using the sidebar
     3. Select participants and language
     4. Click "Analyze Chat"
 
@@ -132,10 +204,11 @@ def _show_welcome():
     with col1:
         with st.expander("🔒 Privacy & Security"):
             st.markdown("""
-            - Your data stays on your device
-            - We don't store any chat data
-            - Processing happens locally in your browser
-            - No data is sent to external servers
+            - Uploaded chats are parsed and analyzed on the server running the app
+            - Parsed chats are kept in a cache on that server (`~/.cache/whatsapp-analyzer`,
+              1 GB budget) until they are evicted to make room for newer uploads
+            - The server's operator can turn the cache off with `WHATSAPP_ANALYZER_CACHE_MAX_MB=0`
+            - No data is sent to external services
             """)
 
     with col2:
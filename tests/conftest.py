@@ -109,7 +109,8 @@ def sample_german_messages():
 def preprocessed_df(sample_messages):
     """Create a preprocessed DataFrame with all standard columns."""
     df = sample_messages.copy()
-    df["date"] = df["timestamp"].dt.strftime('%Y-%m-%d')
+    df["date"] = df["timestamp"].dt.normalize()
+    df["day"] = (df["timestamp"] - pd.Timestamp("1970-01-01")).dt.days.astype("int32")
     df["year"] = df["timestamp"].dt.year
     df["week"] = df["timestamp"].dt.isocalendar().week
     df["is_link"] = df.message.str.contains('https?:', regex=True, na=False).astype(int)
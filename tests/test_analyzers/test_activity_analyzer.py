@@ -0,0 +1,60 @@
+"""
+Tests for activity analyzer module.
+"""
+
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.analyzers.activity_analyzer import activity
+
+
+def _days(author_days):
+    """Frame with one message per (author, day ordinal) pair."""
+    return pd.DataFrame({
+        "author": [author for author, _ in author_days],
+        "day": np.array([day for _, day in author_days], dtype=np.int32),
+        "words": 1,
+    })
+
+
+class TestActivity:
+    """Tests for activity function."""
+
+    def test_percent_of_days_since_first_message(self):
+        """Test that active days are counted from each author's first day."""
+        df = _days([("Bob", 100), ("Alice", 100), ("Alice", 101), ("Bob", 104), ("Alice", 104), ("Bob", 104)])
+
+        result = activity(df)
+
+        assert list(result.columns) == ["index", "author", "Activity %"]
+        assert result["author"].tolist() == ["Alice", "Bob"]
+        assert result["Activity %"].tolist() == [75.0, 50.0]
+
+    def test_days_without_words_not_active(self):
+        """Test that days with only messages without a word count are not active."""
+        df = _days([("Alice", 0), ("Alice", 1), ("Alice", 2), ("Alice", 4)])
+        df.loc[1, "words"] = np.nan
+
+        result = activity(df)
+
+        assert result["Activity %"].tolist() == [75.0]
+
+    def test_author_starting_on_last_day(self):
+        """Test that an author whose first day is the last day has no day range to divide by."""
+        result = activity(_days([("Alice", 0), ("Bob", 5)]))
+
+        assert result["Activity %"].tolist() == [20.0, np.inf]
+
+    def test_from_timestamps(self, preprocessed_df):
+        """Test that frames without a day column use their timestamps."""
+        df = preprocessed_df.assign(words=1)
+
+        result = activity(df.drop(columns="day"))
+
+        assert set(result["author"]) == set(preprocessed_df["author"])
+        pd.testing.assert_frame_equal(result, activity(df))
@@ -0,0 +1,146 @@
+"""
+Tests for the activity cube shared by the temporal analyzers.
+"""
+
+import gc
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.analyzers.activity_cube import activity_cube, cube_matrix, cube_dates
+from whatsapp_analyzer.analyzers.activity_analyzer import smoothed_daily_activity, relative_activity_ts
+from whatsapp_analyzer.analyzers.temporal_analyzer import heatmap, year_month
+from whatsapp_analyzer.analyzers.trend_analyzer import prepare_time_data
+from whatsapp_analyzer.utils import frame_cache
+from whatsapp_analyzer.utils.profiling import ProfileReport, profiling
+
+
+def _chat():
+    """Messages of two authors over three days, two of them at the same minute."""
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime([
+            "2024-01-30 09:15", "2024-01-30 09:15", "2024-01-30 23:59",
+            "2024-02-01 09:15", "2024-02-01 10:00",
+        ]),
+        "author": ["Bob", "Bob", "Alice", "Alice", "Bob"],
+        "message": ["hello", "hi there", None, "good morning", "ok"],
+        "msg_length": [5.0, 8.0, np.nan, 12.0, 2.0],
+    })
+
+
+class TestActivityCube:
+    """Tests for activity_cube and its reductions."""
+
+    def test_cells(self):
+        """Test that messages of an author in the same minute share a cell."""
+        cube = activity_cube(_chat())
+
+        assert list(cube.authors) == ["Alice", "Bob"]
+        assert cube.day_count == 3
+        assert cube.author.tolist() == [0, 0, 1, 1]
+        assert (cube.day - cube.first_day).tolist() == [0, 2, 0, 2]
+        assert cube.hour.tolist() == [23, 9, 9, 10]
+        assert cube.minute.tolist() == [59, 15, 15, 0]
+        assert cube.messages.tolist() == [1, 1, 2, 1]
+        assert cube.texts.tolist() == [0, 1, 2, 1]
+        assert cube.msg_length.tolist() == [0.0, 12.0, 13.0, 2.0]
+        # Only Bob's first message at 09:15 counts
+        assert cube.first_msg_length.tolist() == [0.0, 12.0, 5.0, 2.0]
+
+    def test_cube_matrix(self):
+        """Test summing cells into a days by authors matrix."""
+        cube = activity_cube(_chat())
+
+        lengths = cube_matrix(cube, cube.day - cube.first_day, cube.day_count, cube.msg_length)
+        messages = cube_matrix(cube, cube.day - cube.first_day, cube.day_count, cells=cube.author == 1)
+
+        assert lengths.tolist() == [[0.0, 13.0], [0.0, 0.0], [12.0, 2.0]]
+        assert messages.tolist() == [[0.0, 1.0], [0.0, 0.0], [0.0, 1.0]]
+        assert cube_dates(cube)[0] == pd.Timestamp("2024-01-30")
+
+    def test_cached_per_frame(self):
+        """Test that the cube is built once per frame and freed with it."""
+        df = _chat()
+
+        with profiling(ProfileReport(trace_memory=False)) as report:
+            first = activity_cube(df)
+            second = activity_cube(df)
+            activity_cube(df.copy())
+
+        assert first is second
+        assert [stage.cache_hit for stage in report.stages] == [False, True, False]
+
+        key = (id(df), "activity_cube")
+        del df
+        gc.collect()
+        assert key not in frame_cache._cache
+
+    def test_missing_timestamps_and_authors_skipped(self):
+        """Test that messages without timestamp or author are left out."""
+        df = _chat()
+        df.loc[0, "timestamp"] = pd.NaT
+        df.loc[4, "author"] = None
+
+        cube = activity_cube(df)
+
+        assert cube.messages.sum() == 3
+
+
+class TestCubeAnalyzers:
+    """Tests for analyzers reducing the activity cube."""
+
+    def test_prepare_time_data(self):
+        """Test message counts per month and author."""
+        result = prepare_time_data(_chat())
+
+        assert result.index.astype(str).tolist() == ["2024-01", "2024-02"]
+        assert result.to_numpy().tolist() == [[1, 2], [1, 1]]
+
+    def test_year_month(self):
+        """Test that only messages with text are counted per month."""
+        result = year_month(_chat())
+
+        assert result.to_numpy().tolist() == [[2024, 202401, 2], [2024, 202402, 2]]
+
+    def test_heatmap_counts(self):
+        """Test that days with only cleared messages are shown with zero text messages."""
+        df = _chat()
+        df.loc[[0, 1], "message"] = None
+
+        data = heatmap(df).data
+
+        assert data["message"].tolist() == [0, 2]
+
+    def test_daily_activity(self, preprocessed_df):
+        """Test the daily activity index, columns and normalization."""
+        smoothed = smoothed_daily_activity(preprocessed_df, years=3)
+        relative = relative_activity_ts(preprocessed_df, years=3)
+
+        assert smoothed.index.freqstr == "D"
+        assert smoothed.index[0] == preprocessed_df["timestamp"].min().normalize()
+        assert set(smoothed.columns) == set(preprocessed_df["author"])
+        assert relative.sum(axis=1).to_numpy() == pytest.approx(1.0)
+
+    def test_daily_activity_window(self):
+        """Test that the years window starts at its first message and drops authors without messages in it."""
+        df = pd.DataFrame({
+            "timestamp": pd.to_datetime(["2019-05-01 10:00", "2022-03-01 10:00", "2024-01-01 12:00", "2024-01-03 08:00"]),
+            "author": ["Alice", "Bob", "Bob", "Carol"],
+            "msg_length": [3.0, 4.0, 5.0, 6.0],
+        })
+
+        recent = smoothed_daily_activity(df, years=1)
+        everything = smoothed_daily_activity(df, years=10)
+
+        assert recent.index[0] == pd.Timestamp("2024-01-01")
+        assert len(recent) == 3
+        assert list(recent.columns) == ["Bob", "Carol"]
+        assert recent.to_numpy().sum() == pytest.approx(11.0)
+        assert list(everything.columns) == ["Alice", "Bob", "Carol"]
+        assert everything.index[0] == pd.Timestamp("2019-05-01")
@@ -0,0 +1,81 @@
+"""
+Tests for response analyzer module.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.analyzers.response_analyzer import (
+    reply_events,
+    analyze_response_time,
+    response_matrix,
+)
+
+
+def _chat():
+    """Alice, Alice 1 min later, Bob 10 min later, Alice 5 min later, Alice 1h later, Bob at the same minute."""
+    start = pd.Timestamp("2024-01-01 08:00")
+    offsets = ["0min", "1min", "11min", "16min", "76min", "76min"]
+    return pd.DataFrame({
+        "timestamp": [start + pd.Timedelta(offset) for offset in offsets],
+        "author": ["Alice", "Alice", "Bob", "Alice", "Bob", "Alice"],
+    })
+
+
+class TestReplyEvents:
+    """Tests for reply_events function."""
+
+    def test_events(self):
+        """Test that quick self-continuations are dropped and ties keep the frame order."""
+        events = reply_events(_chat())
+
+        # The message at index 1 continues Alice's first message; the two
+        # messages at 09:16 stay in export order, Bob, then Alice
+        assert events.index.tolist() == [0, 2, 3, 4, 5]
+        assert events["responder"].tolist() == ["Alice", "Bob", "Alice", "Bob", "Alice"]
+        assert events["responded_to"].tolist()[1:] == ["Alice", "Bob", "Alice", "Bob"]
+        assert pd.isna(events["responded_to"].iloc[0])
+        assert events["latency"].tolist()[1:] == [600.0, 300.0, 3600.0, 0.0]
+
+    def test_unsorted_frame(self):
+        """Test that a frame out of time order is stable-sorted by timestamp."""
+        df = _chat().iloc[[3, 0, 1, 2, 4, 5]]
+
+        events = reply_events(df)
+
+        assert events.index.tolist() == [0, 2, 3, 4, 5]
+        assert events["latency"].tolist()[1:] == [600.0, 300.0, 3600.0, 0.0]
+
+    def test_cached_per_frame(self):
+        """Test that both analyzers share one event table."""
+        df = _chat()
+
+        assert reply_events(df) is reply_events(df)
+
+
+class TestResponseAnalyzers:
+    """Tests for analyze_response_time and response_matrix."""
+
+    def test_median_response_time(self):
+        """Test medians in minutes per responder."""
+        result = analyze_response_time(_chat())
+
+        medians = result["median_chart"].data.set_index("author")["response_time"]
+        assert medians["Alice"] == pytest.approx(2.5)
+        assert medians["Bob"] == pytest.approx(35.0)
+        assert result["slowest_responder"] == "Bob"
+
+    def test_response_matrix(self):
+        """Test each responder's share of replies per author responded to."""
+        data = response_matrix(_chat()).data
+
+        shares = data.pivot(index="author", columns="responding_to", values="response_rate")
+        assert shares.loc["Alice", "Bob"] == pytest.approx(1.0)
+        assert shares.loc["Bob", "Alice"] == pytest.approx(1.0)
+        assert np.allclose(shares.sum(axis=1), 1.0)
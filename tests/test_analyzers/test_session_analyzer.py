@@ -0,0 +1,32 @@
+"""
+Tests for session analyzer module.
+"""
+
+import pandas as pd
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.analyzers.session_analyzer import conversation_stats
+
+
+class TestConversationStats:
+    """Tests for conversation_stats function."""
+
+    def test_stats_per_initiator(self):
+        """Test counts, shares and medians per conversation starter."""
+        sessions = pd.DataFrame({
+            "messages": [4, 10, 2],
+            "duration": pd.to_timedelta(["10min", "30min", "1min"]),
+            "initiator": ["Bob", "Alice", "Alice"],
+        })
+
+        stats = conversation_stats(sessions)
+
+        assert stats["Author"].tolist() == ["Alice", "Bob"]
+        assert stats["Conversations Started"].tolist() == [2, 1]
+        assert stats["Share (%)"].tolist() == [66.7, 33.3]
+        assert stats["Median Messages"].tolist() == [6.0, 4.0]
+        assert stats["Median Duration (minutes)"].tolist() == [15.5, 10.0]
@@ -0,0 +1,58 @@
+"""
+Tests for temporal analyzer module.
+"""
+
+import pytest
+import pandas as pd
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.analyzers.temporal_analyzer import activity_time_of_day_ts
+
+
+def _activity(df, **kwargs):
+    """Smoothed activity of a time of day chart, minutes by authors."""
+    data = activity_time_of_day_ts(df, **kwargs).data
+    return data.pivot(index=['hour', 'minute'], columns='author', values='activity')
+
+
+def _chat(times, authors=None):
+    """One message of length 10 per time of day."""
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime([f"2024-01-01 {time}" for time in times]),
+        "author": authors or ["Alice"] * len(times),
+        "msg_length": 10.0,
+    })
+
+
+class TestActivityTimeOfDay:
+    """Tests for activity_time_of_day_ts function."""
+
+    def test_wraps_around_midnight(self):
+        """Test that activity just before midnight is smoothed into the early morning."""
+        activity = _activity(_chat(["23:59"]))["Alice"]
+
+        assert activity.loc[(0, 30)] == pytest.approx(activity.loc[(23, 28)])
+        assert activity.loc[(2, 0)] > 0
+        assert activity.sum() == pytest.approx(10.0)
+
+    def test_bandwidth(self):
+        """Test that a smaller bandwidth keeps a sharper peak."""
+        df = _chat(["12:00"])
+
+        narrow = _activity(df, bandwidth=10)["Alice"]
+        wide = _activity(df, bandwidth=120)["Alice"]
+
+        assert narrow.loc[(12, 0)] > wide.loc[(12, 0)]
+        assert narrow.sum() == pytest.approx(wide.sum())
+
+    def test_one_line_per_author(self):
+        """Test that every author gets a full day of points."""
+        activity = _activity(_chat(["08:00", "20:15"], ["Alice", "Bob"]))
+
+        assert list(activity.columns) == ["Alice", "Bob"]
+        assert len(activity) == 24 * 60
+        assert activity["Bob"].idxmax() == (20, 15)
@@ -84,6 +84,179 @@ class TestFullPipeline:
 
             assert result['is_edited'].sum() == 1, f"Failed for {lang}"
 
+    def test_detected_language_matches_selected(self, sample_messages):
+        """Test that auto-detection gives the same result as selecting the language."""
+        from whatsapp_analyzer.preprocessors import preprocess_data
+
+        authors = sample_messages['author'].unique().tolist()
+        expected, _ = preprocess_data(sample_messages, "English", authors)
+        result, _ = preprocess_data(sample_messages, None, authors)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_mixed_language_chat(self):
+        """Test that placeholders of every detected language are recognized."""
+        from whatsapp_analyzer.preprocessors import preprocess_data
+
+        base_time = datetime(2024, 1, 1, 10, 0, 0)
+        df = pd.DataFrame({
+            "timestamp": [base_time + timedelta(minutes=i) for i in range(4)],
+            "author": ["Alice", "Hans", "Alice", "Hans"],
+            "message": ["image omitted", "Bild weggelassen", "Hello", "Diese Nachricht wurde gelöscht."],
+        })
+        df["words"] = df["message"].str.count(" ") + 1
+        df["letters"] = df["message"].str.len()
+
+        result, _ = preprocess_data(df, None, ["Alice", "Hans"])
+
+        assert result['is_image'].tolist() == [1, 1, 0, 0]
+        assert result['is_deleted'].tolist() == [0, 0, 0, 1]
+
+    def test_does_not_modify_input(self, sample_messages):
+        """Test that the raw frame is left untouched."""
+        from whatsapp_analyzer.preprocessors import preprocess_data
+
+        original = sample_messages.copy()
+        authors = sample_messages['author'].unique().tolist()
+        df, _ = preprocess_data(sample_messages, "English", authors)
+        df.loc[df.index[0], 'message'] = "changed"
+
+        pd.testing.assert_frame_equal(sample_messages, original)
+
+    def test_matches_step_functions(self, sample_messages):
+        """Test that the pipeline equals running the public steps in order."""
+        from whatsapp_analyzer.preprocessors import (
+            preprocess_data,
+            get_language_settings,
+            preprocess_timestamps,
+            process_links,
+            process_message_length,
+            process_multimedia,
+            process_emojis,
+            filter_authors,
+            add_conversation_starter_flag,
+            process_locations,
+            add_year_week,
+        )
+
+        sample_messages.loc[3, 'author'] = "+49 151 234"
+        authors = sample_messages['author'].unique().tolist()
+        df = preprocess_timestamps(sample_messages, authors)
+        df = process_links(df)
+        df = process_message_length(df)
+        df = process_multimedia(df, get_language_settings("English"))
+        df = process_emojis(df)
+        df = filter_authors(df)
+        df = add_conversation_starter_flag(df)
+        expected, _ = process_locations(df)
+        expected = add_year_week(expected)
+
+        result, _ = preprocess_data(sample_messages, "English", authors)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert "+49 151 234" not in result['author'].tolist()
+
+    def test_select_authors_matches_filtering_first(self, sample_messages):
+        """Test that selecting authors after preprocessing equals filtering before it."""
+        from whatsapp_analyzer.preprocessors import (
+            preprocess_chat,
+            select_authors,
+            get_language_settings,
+            preprocess_timestamps,
+            process_links,
+            process_message_length,
+            process_multimedia,
+            process_emojis,
+            add_conversation_starter_flag,
+            process_locations,
+            add_year_week,
+        )
+
+        # Gaps that only exist once the other author is removed
+        sample_messages['timestamp'] = pd.date_range("2024-01-01", periods=len(sample_messages), freq="4h")
+        chat, chat_locations = preprocess_chat(sample_messages, "English")
+
+        for author in sample_messages['author'].unique():
+            df = preprocess_timestamps(sample_messages, [author])
+            df = process_links(df)
+            df = process_message_length(df)
+            df = process_multimedia(df, get_language_settings("English"))
+            df = process_emojis(df)
+            df = add_conversation_starter_flag(df)
+            expected, expected_locations = process_locations(df)
+            expected = add_year_week(expected)
+
+            result, locations = select_authors(chat, chat_locations, [author])
+
+            pd.testing.assert_frame_equal(result, expected)
+            pd.testing.assert_frame_equal(locations, expected_locations)
+
+
+class TestPipelineCache:
+    """Tests for step-level caching of the preprocessing pipeline."""
+
+    def test_second_run_is_all_hits(self, sample_messages):
+        """Test that an unchanged rerun is served entirely from the cache."""
+        from whatsapp_analyzer.preprocessors import preprocess_chat, PipelineCache, PIPELINE_STEPS
+
+        cache = PipelineCache()
+        expected, _ = preprocess_chat(sample_messages, "English", cache=cache)
+        assert cache.hits() == []
+
+        result, _ = preprocess_chat(sample_messages, "English", cache=cache)
+
+        assert cache.hits() == [step.name for step in PIPELINE_STEPS]
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_language_change_reruns_language_steps(self, sample_messages):
+        """Test that only steps depending on the language run again."""
+        from whatsapp_analyzer.preprocessors import preprocess_chat, PipelineCache
+
+        cache = PipelineCache()
+        preprocess_chat(sample_messages, "English", cache=cache, fingerprint="chat")
+        result, locations = preprocess_chat(sample_messages, "German", cache=cache, fingerprint="chat")
+
+        computed = [name for name, hit in cache.last_run.items() if not hit]
+        assert computed == ["multimedia", "emojis", "locations", "compact"]
+
+        expected, expected_locations = preprocess_chat(sample_messages, "German")
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(locations, expected_locations)
+
+    def test_changed_messages_are_not_reused(self, sample_messages):
+        """Test that hashing the input tells different chats apart."""
+        from whatsapp_analyzer.preprocessors import preprocess_chat, PipelineCache
+
+        cache = PipelineCache()
+        preprocess_chat(sample_messages, "English", cache=cache)
+        changed = sample_messages.assign(message=sample_messages['message'] + " 😀")
+        result, _ = preprocess_chat(changed, "English", cache=cache)
+
+        assert "emojis" not in cache.hits()
+        assert result['is_emoji'].all()
+
+    def test_gap_change_reruns_conversation_step(self, sample_messages):
+        """Test that a new conversation gap only reruns the steps depending on it."""
+        from whatsapp_analyzer.preprocessors import preprocess_chat, PipelineCache, PIPELINE_STEPS
+
+        cache = PipelineCache()
+        preprocess_chat(sample_messages, "English", cache=cache)
+        result, _ = preprocess_chat(sample_messages, "English", cache=cache, conversation_gap=pd.Timedelta("1min"))
+
+        computed = [step.name for step in PIPELINE_STEPS if step.name not in cache.hits()]
+        assert computed == ["conversation_starter", "compact"]
+        expected, _ = preprocess_chat(sample_messages, "English", conversation_gap=pd.Timedelta("1min"))
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_evicts_least_recently_used(self, sample_messages):
+        """Test that the cache stays within its entry budget."""
+        from whatsapp_analyzer.preprocessors import preprocess_chat, PipelineCache
+
+        cache = PipelineCache(max_entries=3)
+        preprocess_chat(sample_messages, "English", cache=cache)
+
+        assert len(cache) == 3
+
 
 class TestAnalyzerIntegration:
     """Integration tests for analyzer modules."""
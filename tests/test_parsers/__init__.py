@@ -0,0 +1 @@
+"""Tests for parser modules."""
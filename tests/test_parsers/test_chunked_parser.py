@@ -0,0 +1,86 @@
+"""
+Tests for parallel chunked parsing.
+"""
+
+import io
+import pytest
+import pandas as pd
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.parsers import chunked_parser
+from whatsapp_analyzer.parsers.chunked_parser import find_chunk_boundaries, parse_bytes_parallel
+from whatsapp_analyzer.parsers.whatsapp_parser import is_header, parse_stream
+
+
+@pytest.fixture
+def export_bytes():
+    """Export with many multi-line messages and a byte order mark."""
+    lines = []
+    for i in range(300):
+        lines.append(f"3/{i % 28 + 1}/22, {i % 12 + 1}:0{i % 10} PM - Author{i % 4}: message {i}")
+        for j in range(i % 3):
+            lines.append(f"continuation {i}.{j}")
+    return b"\xef\xbb\xbf" + "\n".join(lines).encode("utf-8")
+
+
+class TestFindChunkBoundaries:
+    """Tests for find_chunk_boundaries function."""
+
+    def test_boundaries_start_on_headers(self, export_bytes):
+        """Test that every boundary starts a header line."""
+        boundaries = find_chunk_boundaries(export_bytes, 16)
+
+        assert boundaries[0] == 0
+        assert boundaries[-1] == len(export_bytes)
+        for offset in boundaries[1:-1]:
+            assert export_bytes[offset - 1:offset] == b"\n"
+            line = export_bytes[offset:export_bytes.find(b"\n", offset)].decode("utf-8")
+            assert is_header(line)
+
+    def test_boundaries_are_increasing(self, export_bytes):
+        """Test that boundaries are strictly increasing."""
+        boundaries = find_chunk_boundaries(export_bytes, 50)
+
+        assert boundaries == sorted(set(boundaries))
+
+    def test_no_header_after_offset(self):
+        """Test that a chunk without later headers is not split."""
+        data = b"3/1/22, 1:00 PM - A: hi\n" + b"more text\n" * 100
+
+        assert find_chunk_boundaries(data, 4) == [0, len(data)]
+
+
+class TestParseBytesParallel:
+    """Tests for parse_bytes_parallel function."""
+
+    @pytest.mark.parametrize("workers", [1, 2, 7])
+    def test_matches_serial_parser(self, export_bytes, workers, monkeypatch):
+        """Test that parallel output is row-for-row identical to serial output."""
+        monkeypatch.setattr(chunked_parser, "MIN_CHUNK_BYTES", 1)
+
+        serial = parse_stream(io.BytesIO(export_bytes))
+        parallel = parse_bytes_parallel(export_bytes, workers=workers)
+
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_keeps_continuation_lines(self, export_bytes, monkeypatch):
+        """Test that continuation lines stay with their header."""
+        monkeypatch.setattr(chunked_parser, "MIN_CHUNK_BYTES", 1)
+
+        df = parse_bytes_parallel(export_bytes, workers=5)
+
+        assert df.loc[2, "message"] == "message 2 continuation 2.0 continuation 2.1"
+
+    def test_single_cpu_parses_serially(self, export_bytes, monkeypatch):
+        """Test that without a second usable CPU no process pool is started."""
+        monkeypatch.setattr(chunked_parser, "MIN_CHUNK_BYTES", 1)
+        monkeypatch.setattr(chunked_parser, "_usable_cpu_count", lambda: 1)
+        monkeypatch.setattr(chunked_parser, "ProcessPoolExecutor", None)
+
+        df = parse_bytes_parallel(export_bytes)
+
+        pd.testing.assert_frame_equal(df, parse_stream(io.BytesIO(export_bytes)))
@@ -0,0 +1,83 @@
+"""
+Tests for incremental re-ingest of appended exports.
+"""
+
+import io
+import pandas as pd
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.parsers.incremental import export_metadata, find_cached_prefix, parse_suffix
+from whatsapp_analyzer.parsers.parse_cache import ParseCache
+from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+
+
+OLD_EXPORT = (
+    "3/12/22, 1:05 AM - Jack: hello\n"
+    "3/13/22, 1:05 PM - Sam: first line\n"
+    "second line\n"
+    "3/14/22, 11:59 PM - Jack: last"
+)
+
+
+def _cache_export(cache, data):
+    df = parse_stream(io.BytesIO(data))
+    cache.put("old", df, export_metadata(data, df))
+    return df
+
+
+def _reingest(cache, data):
+    match = find_cached_prefix(data, cache)
+    if match is None:
+        return None
+    prefix, metadata = match
+    new_rows = parse_suffix(data, metadata)
+    if new_rows is None:
+        return None
+    return pd.concat([prefix, new_rows], ignore_index=True)
+
+
+class TestIncrementalReingest:
+    """Tests for find_cached_prefix and parse_suffix."""
+
+    def test_metadata_excludes_last_message(self):
+        """Test that the cached prefix ends before the last message."""
+        data = OLD_EXPORT.encode("utf-8")
+        df = parse_stream(io.BytesIO(data))
+
+        metadata = export_metadata(data, df)
+
+        assert data[metadata["prefix_size"]:].startswith(b"3/14/22")
+        assert metadata["prefix_rows"] == 2
+        assert metadata["date_order"] == "MDY"
+
+    def test_appended_export_matches_full_parse(self, tmp_path):
+        """Test that appending new messages gives the same rows as a full parse."""
+        cache = ParseCache(str(tmp_path))
+        _cache_export(cache, OLD_EXPORT.encode("utf-8"))
+        new = (OLD_EXPORT + " and more\n3/15/22, 9:00 AM - Sam: new\n").encode("utf-8")
+
+        result = _reingest(cache, new)
+
+        pd.testing.assert_frame_equal(result, parse_stream(io.BytesIO(new)))
+        assert result.loc[2, "message"] == "last and more"
+
+    def test_unrelated_export_is_not_matched(self, tmp_path):
+        """Test that a different chat does not match a cached prefix."""
+        cache = ParseCache(str(tmp_path))
+        _cache_export(cache, OLD_EXPORT.encode("utf-8"))
+        other = OLD_EXPORT.replace("hello", "howdy").encode("utf-8")
+
+        assert find_cached_prefix(other, cache) is None
+
+    def test_conflicting_date_order_forces_full_parse(self, tmp_path):
+        """Test that new messages contradicting the cached date order are rejected."""
+        cache = ParseCache(str(tmp_path))
+        ambiguous = "3/12/22, 1:05 AM - Jack: a\n3/11/22, 1:05 AM - Sam: b\n"
+        _cache_export(cache, ambiguous.encode("utf-8"))
+        new = (ambiguous + "3/13/22, 1:05 AM - Sam: c\n").encode("utf-8")
+
+        assert _reingest(cache, new) is None
@@ -0,0 +1,101 @@
+"""
+Tests for the on-disk parse cache.
+"""
+
+import io
+import os
+import pytest
+import pandas as pd
+import sys
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.parsers.parse_cache import ParseCache, content_hash, get_parse_cache
+
+
+@pytest.fixture
+def parsed_df():
+    """Small parsed frame."""
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime(["2024-01-01 10:00", "2024-01-01 10:01"]),
+        "author": ["Alice", "Bob"],
+        "message": ["Hello", "Hi"],
+        "hour": pd.Series([10, 10], dtype="int32"),
+    })
+
+
+class TestParseCache:
+    """Tests for ParseCache."""
+
+    def test_miss_returns_none(self, tmp_path):
+        """Test that an unknown hash is a cache miss."""
+        cache = ParseCache(str(tmp_path))
+
+        assert cache.get("abc") is None
+
+    def test_round_trip(self, tmp_path, parsed_df):
+        """Test that a stored frame is returned unchanged."""
+        cache = ParseCache(str(tmp_path))
+        cache.put("abc", parsed_df)
+
+        pd.testing.assert_frame_equal(cache.get("abc"), parsed_df)
+
+    def test_key_includes_parser_version(self, tmp_path, parsed_df, monkeypatch):
+        """Test that a parser version bump invalidates entries."""
+        from whatsapp_analyzer.parsers import parse_cache
+
+        cache = ParseCache(str(tmp_path))
+        cache.put("abc", parsed_df)
+        monkeypatch.setattr(parse_cache, "PARSER_VERSION", parse_cache.PARSER_VERSION + 1)
+
+        assert cache.get("abc") is None
+
+    def test_evicts_least_recently_used(self, tmp_path, parsed_df):
+        """Test that the oldest unused entry is evicted over budget."""
+        cache = ParseCache(str(tmp_path), max_bytes=10 ** 9)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, parsed_df)
+            os.utime(cache.path(key), (i, i))
+        cache.get("a")  # refreshes "a", leaving "b" as least recently used
+
+        cache.max_bytes = 2 * os.path.getsize(cache.path("a"))
+        cache.evict()
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path, parsed_df):
+        """Test that an unreadable entry is dropped."""
+        cache = ParseCache(str(tmp_path))
+        with open(cache.path("abc"), "wb") as f:
+            f.write(b"not arrow")
+
+        assert cache.get("abc") is None
+        assert not os.path.exists(cache.path("abc"))
+
+    def test_disabled_cache_stores_nothing(self, tmp_path, parsed_df):
+        """Test that a zero budget disables the cache."""
+        cache = ParseCache(str(tmp_path), max_bytes=0)
+        cache.put("abc", parsed_df)
+
+        assert cache.get("abc") is None
+        assert os.listdir(tmp_path) == []
+
+    def test_configured_from_environment(self, tmp_path, monkeypatch):
+        """Test environment configuration."""
+        monkeypatch.setenv("WHATSAPP_ANALYZER_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("WHATSAPP_ANALYZER_CACHE_MAX_MB", "2")
+
+        cache = get_parse_cache()
+
+        assert cache.directory == str(tmp_path)
+        assert cache.max_bytes == 2 * 1024 * 1024
+
+
+def test_content_hash_matches_md5():
+    """Test that the content hash is the md5 of the upload bytes."""
+    import hashlib
+
+    assert content_hash(io.BytesIO(b"chat")) == hashlib.md5(b"chat").hexdigest()
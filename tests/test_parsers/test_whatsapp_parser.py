@@ -0,0 +1,189 @@
+"""
+Tests for the native WhatsApp export parser.
+"""
+
+import io
+import pandas as pd
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.parsers.whatsapp_parser import (
+    parse_lines,
+    parse_stream,
+    parse_timestamps,
+    sniff_date_order,
+    sniff_timestamp_format,
+)
+
+
+ANDROID_EXPORT = (
+    "3/12/22, 12:34 AM - Jack created group \"Friends\"\n"
+    "3/12/22, 1:05 AM - Jack: hello\n"
+    "3/13/22, 1:05 PM - Sam: first line\n"
+    "second line\n"
+    "3/14/22, 11:59 PM - Jack: time: now\n"
+)
+
+IOS_EXPORT = (
+    "\u200e[13/03/2022, 01:05:33] Group: \u200eMessages are end-to-end encrypted.\n"
+    "[13/03/2022, 13:05:40] Alice: hi\n"
+    "there\n"
+    "\u200e[15/03/2022, 09:00:00] Bob: \u200eimage omitted\n"
+)
+
+
+class TestParseLines:
+    """Tests for parse_lines function."""
+
+    def test_android_headers(self):
+        """Test parsing of Android export lines."""
+        columns = parse_lines(io.StringIO(ANDROID_EXPORT))
+
+        assert columns["author"] == ["Jack", "Sam", "Jack"]
+        assert columns["timestamp"][0] == "3/12/22, 1:05 AM"
+
+    def test_skips_system_messages(self):
+        """Test that header lines without an author are skipped."""
+        columns = parse_lines(io.StringIO(ANDROID_EXPORT))
+
+        assert not any("created group" in m for m in columns["message"])
+
+    def test_joins_continuation_lines(self):
+        """Test that multi-line messages are joined with a space."""
+        columns = parse_lines(io.StringIO(ANDROID_EXPORT))
+
+        assert columns["message"][1] == "first line second line"
+
+    def test_splits_on_first_author_separator(self):
+        """Test that colons inside the message body are preserved."""
+        columns = parse_lines(io.StringIO(ANDROID_EXPORT))
+
+        assert columns["message"][2] == "time: now"
+
+    def test_word_and_letter_counts(self):
+        """Test that counts match splitting on spaces and len()."""
+        columns = parse_lines(io.StringIO(ANDROID_EXPORT))
+
+        assert columns["words"] == [len(m.split(" ")) for m in columns["message"]]
+        assert columns["letters"] == [len(m) for m in columns["message"]]
+
+    def test_ios_headers(self):
+        """Test parsing of bracketed iOS export lines."""
+        columns = parse_lines(io.StringIO(IOS_EXPORT))
+
+        assert columns["author"] == ["Group", "Alice", "Bob"]
+        assert columns["message"][1] == "hi there"
+        assert columns["message"][2] == "image omitted"
+
+    def test_ignores_lines_before_first_header(self):
+        """Test that leading non-header lines are dropped."""
+        columns = parse_lines(io.StringIO("preamble\n" + ANDROID_EXPORT))
+
+        assert len(columns["message"]) == 3
+
+
+class TestParseTimestamps:
+    """Tests for parse_timestamps function."""
+
+    def test_month_first_12h(self):
+        """Test month-first dates with AM/PM times."""
+        result = parse_timestamps(pd.Series(["3/12/22, 12:34 AM", "3/13/22, 1:05 PM"]))
+
+        assert result[0] == pd.Timestamp("2022-03-12 00:34")
+        assert result[1] == pd.Timestamp("2022-03-13 13:05")
+
+    def test_day_first_with_seconds(self):
+        """Test day-first dates with seconds."""
+        result = parse_timestamps(pd.Series(["13/03/2022, 01:05:33"]))
+
+        assert result[0] == pd.Timestamp("2022-03-13 01:05:33")
+
+    def test_year_first(self):
+        """Test year-first dates."""
+        result = parse_timestamps(pd.Series(["2022-03-13, 21:05"]))
+
+        assert result[0] == pd.Timestamp("2022-03-13 21:05")
+
+    def test_ambiguous_falls_back_to_day_first(self):
+        """Test that ambiguous dates are read day-first."""
+        result = parse_timestamps(pd.Series(["03.04.22, 10:00"]))
+
+        assert result[0] == pd.Timestamp("2022-04-03 10:00")
+
+    def test_two_digit_years_are_2000s(self):
+        """Test that late two-digit years are not read as the 1900s."""
+        result = parse_timestamps(pd.Series(["1/13/75, 9:00 AM"]))
+
+        assert result[0] == pd.Timestamp("2075-01-13 09:00")
+
+    def test_stamps_outside_sniffed_format(self):
+        """Test that stamps in another layout are still read."""
+        result = parse_timestamps(pd.Series(["13.03.22, 21:05", "14.03.22, 9:05 p. m."]))
+
+        assert result[0] == pd.Timestamp("2022-03-13 21:05")
+        assert result[1] == pd.Timestamp("2022-03-14 21:05")
+
+
+class TestSniffing:
+    """Tests for date order and timestamp format sniffing."""
+
+    def test_android_format(self):
+        """Test the format of Android 12h timestamps."""
+        stamps = pd.Series(["3/12/22, 1:05 AM", "3/13/22, 1:05 PM"])
+
+        assert sniff_timestamp_format(stamps, "MDY") == "%m/%d/%y, %I:%M %p"
+
+    def test_ios_format(self):
+        """Test the format of iOS 24h timestamps with seconds."""
+        stamps = pd.Series(["13/03/2022, 01:05:33"])
+
+        assert sniff_timestamp_format(stamps, "DMY") == "%d/%m/%Y, %H:%M:%S"
+
+    def test_most_common_layout_wins(self):
+        """Test that the majority layout of the sample is chosen."""
+        stamps = pd.Series(["13.03.22, 21:05", "14.03.22, 21:05", "15.03.22 21:05"])
+
+        assert sniff_timestamp_format(stamps, "DMY") == "%d.%m.%y, %H:%M"
+
+    def test_unreadable_layout(self):
+        """Test that no format is returned for dotted am/pm markers."""
+        assert sniff_timestamp_format(pd.Series(["13.03.22, 9:05 p. m."]), "DMY") is None
+
+    def test_date_order_beyond_sample(self):
+        """Test that an ambiguous sample falls back to the whole column."""
+        stamps = pd.Series(["1/2/22, 10:00"] * 5 + ["1/13/22, 10:00"])
+
+        assert sniff_date_order(stamps, sample_size=3) == "MDY"
+
+
+class TestParseStream:
+    """Tests for parse_stream function."""
+
+    def test_returns_dataframe(self):
+        """Test parsing a binary stream into a DataFrame."""
+        stream = io.BytesIO(IOS_EXPORT.encode("utf-8"))
+        df = parse_stream(stream)
+
+        assert list(df.columns) == ["timestamp", "author", "message", "words", "letters"]
+        assert pd.api.types.is_datetime64_any_dtype(df["timestamp"])
+        assert len(df) == 3
+
+    def test_does_not_close_stream(self):
+        """Test that the caller's stream stays usable."""
+        stream = io.BytesIO(ANDROID_EXPORT.encode("utf-8"))
+        parse_stream(stream)
+
+        assert not stream.closed
+
+    def test_sample_file(self):
+        """Test parsing the bundled sample export."""
+        path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'sample_file.txt')
+        with open(path, "rb") as f:
+            df = parse_stream(f)
+
+        assert len(df) == 8340
+        assert set(df["author"]) == {"Jack", "Sam"}
+        assert df["timestamp"].notna().all()
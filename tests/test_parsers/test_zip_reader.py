@@ -0,0 +1,133 @@
+"""
+Tests for reading zip exports.
+"""
+
+import io
+import zipfile
+import pytest
+import pandas as pd
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.parsers.whatsapp_parser import parse_stream
+from whatsapp_analyzer.preprocessors import preprocess_data
+from whatsapp_analyzer.parsers.zip_reader import (
+    find_chat_member,
+    index_media_members,
+    is_zip_export,
+    match_media,
+    open_chat_member,
+)
+
+
+CHAT = (
+    "[12/03/2022, 01:05:33] Alice: <attached: 00000001-PHOTO-2022-03-12-01-05-33.jpg>\n"
+    "[12/03/2022, 01:06:00] Bob: nice\n"
+    "[13/03/2022, 09:00:00] Bob: image omitted\n"
+)
+
+
+@pytest.fixture
+def zip_export():
+    """In-memory iOS zip export with one photo and one voice note."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("_chat.txt", CHAT)
+        archive.writestr("00000001-PHOTO-2022-03-12-01-05-33.jpg", b"x" * 100)
+        archive.writestr("00000002-AUDIO-2022-03-13-09-00-00.opus", b"x" * 40)
+    buffer.seek(0)
+    return buffer
+
+
+class TestZipReader:
+    """Tests for zip export reading."""
+
+    def test_detects_zip(self, zip_export):
+        """Test zip detection."""
+        assert is_zip_export(zip_export)
+        assert not is_zip_export(io.BytesIO(CHAT.encode("utf-8")))
+
+    def test_parses_chat_member(self, zip_export):
+        """Test that the chat member parses like a plain export."""
+        with open_chat_member(zip_export) as chat:
+            df = parse_stream(chat)
+
+        expected = parse_stream(io.BytesIO(CHAT.encode("utf-8")))
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_prefers_chat_txt(self):
+        """Test that _chat.txt is chosen over other text members."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("notes.txt", "x" * 1000)
+            archive.writestr("_chat.txt", CHAT)
+
+        with zipfile.ZipFile(buffer) as archive:
+            assert find_chat_member(archive).filename == "_chat.txt"
+
+    def test_missing_chat_raises(self):
+        """Test that an archive without text raises ValueError."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("photo.jpg", b"x")
+
+        with pytest.raises(ValueError):
+            with open_chat_member(buffer):
+                pass
+
+    def test_closes_member_and_archive(self, zip_export, monkeypatch):
+        """Test that leaving the context closes the chat stream and the archive."""
+        archives = []
+
+        class RecordingZipFile(zipfile.ZipFile):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                archives.append(self)
+
+        monkeypatch.setattr(zipfile, "ZipFile", RecordingZipFile)
+
+        with open_chat_member(zip_export) as chat:
+            chat.read()
+
+        assert chat.closed
+        assert len(archives) == 1
+        assert archives[0].fp is None
+
+    def test_indexes_media(self, zip_export):
+        """Test media member names, sizes and kinds."""
+        media = index_media_members(zip_export)
+
+        assert list(media["name"]) == [
+            "00000001-PHOTO-2022-03-12-01-05-33.jpg",
+            "00000002-AUDIO-2022-03-13-09-00-00.opus",
+        ]
+        assert list(media["size"]) == [100, 40]
+        assert list(media["kind"]) == ["image", "audio"]
+        assert media.loc[0, "date"] == pd.Timestamp("2022-03-12")
+
+    def test_matches_attachments(self, zip_export):
+        """Test matching attachment references to media members."""
+        with open_chat_member(zip_export) as chat:
+            df = parse_stream(chat)
+
+        matched = match_media(df, index_media_members(zip_export))
+
+        assert matched.loc[0, "media_file"] == "00000001-PHOTO-2022-03-12-01-05-33.jpg"
+        assert matched.loc[0, "media_size"] == 100
+        assert matched.loc[1:, "media_file"].isna().all()
+
+    def test_media_messages_flagged(self, zip_export):
+        """Test that attachment rows of an export with media count as media, not as text."""
+        with open_chat_member(zip_export) as chat:
+            raw = parse_stream(chat)
+        raw.insert(3, "weekday", raw["timestamp"].dt.strftime("%A"))
+        raw.insert(4, "hour", raw["timestamp"].dt.hour)
+
+        df, _ = preprocess_data(raw, "English", raw["author"].unique().tolist())
+
+        # The attached photo and the "image omitted" placeholder
+        assert df["is_image"].tolist() == [1, 0, 1]
+        assert df["message"].isna().tolist() == [True, False, True]
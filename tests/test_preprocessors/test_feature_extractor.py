@@ -0,0 +1,141 @@
+"""
+Tests for feature extractor module.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.preprocessors.feature_extractor import (
+    process_locations,
+    add_conversation_starter_flag,
+    update_conversation_starter_flag,
+    build_sessions,
+)
+
+
+def _chat(messages):
+    """Build a frame of messages from alternating authors, one per hour."""
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=len(messages), freq="h"),
+        "author": ["Alice", "Bob"] * (len(messages) // 2) + ["Alice"] * (len(messages) % 2),
+        "message": messages,
+    })
+
+
+class TestProcessLocations:
+    """Tests for process_locations function."""
+
+    @pytest.mark.parametrize("message, lat, lon", [
+        ("Location https://maps.google.com/?q=41.0082,28.9784", 41.0082, 28.9784),
+        ("Konum https://maps.google.com/?q=-33.86,151.2", -33.86, 151.2),
+        ("https://maps.google.com/maps?hl=en&q=loc:10.5,-20.25", 10.5, -20.25),
+        ("https://www.google.com/maps/place/48.8584,2.2945", 48.8584, 2.2945),
+        ("https://www.google.com/maps/search/?api=1&query=52.52%2C13.405", 52.52, 13.405),
+        ("https://www.google.de/maps/@52.52,13.405,15z", 52.52, 13.405),
+        ("geo:1.5,-2.5", 1.5, -2.5),
+        ("here geo:-1.5,2.5", -1.5, 2.5),
+    ])
+    def test_url_formats(self, message, lat, lon):
+        """Test that coordinates are read from every supported link format."""
+        _, locations = process_locations(_chat([message]))
+
+        assert locations[["lat", "lon"]].values.tolist() == [[lat, lon]]
+
+    def test_keeps_author_and_timestamp(self):
+        """Test that each location keeps its sharing message's author and time."""
+        df = _chat(["hello", "Location https://maps.google.com/?q=1.0,2.0", "Location https://maps.google.com/?q=1.0,2.0"])
+
+        _, locations = process_locations(df)
+
+        assert locations.index.tolist() == [1, 2]
+        assert locations["author"].tolist() == ["Bob", "Alice"]
+        assert locations["timestamp"].tolist() == df["timestamp"].iloc[1:].tolist()
+        assert locations["lat"].dtype == np.float64
+
+    def test_flags_and_clears_location_messages(self):
+        """Test that map links are flagged and removed from the text."""
+        df = _chat(["Location https://maps.google.com/?q=1.0,2.0", "see https://maps.google.com/", "hi", np.nan])
+
+        result, locations = process_locations(df)
+
+        assert result["is_location"].tolist() == [1, 1, 0, 0]
+        assert result["message"].isna().tolist() == [True, True, False, True]
+        # A link without coordinates is a location share that cannot be mapped
+        assert len(locations) == 1
+
+    def test_geo_inside_word_not_flagged(self):
+        """Test that "geo:" ending a word is not read as a geo URI."""
+        result, locations = process_locations(_chat(["apogeo: stuff", "apogeo:1.5,2.5"]))
+
+        assert result["is_location"].tolist() == [0, 0]
+        assert result["message"].tolist() == ["apogeo: stuff", "apogeo:1.5,2.5"]
+        assert locations.empty
+
+    def test_out_of_range_coordinates_skipped(self):
+        """Test that impossible coordinates are not returned."""
+        _, locations = process_locations(_chat(["https://maps.google.com/?q=95.0,10.0"]))
+
+        assert locations.empty
+
+    def test_no_locations(self):
+        """Test that a chat without locations gives an empty frame."""
+        _, locations = process_locations(_chat(["hello", "world"]))
+
+        assert locations.empty
+        assert list(locations.columns) == ["timestamp", "author", "lat", "lon"]
+
+
+def _conversations():
+    """Two conversations 10 hours apart: Alice, Bob, Alice then Bob, Bob."""
+    start = pd.Timestamp("2024-01-01 08:00")
+    offsets = ["0min", "5min", "30min", "10h30min", "10h40min"]
+    return pd.DataFrame({
+        "timestamp": [start + pd.Timedelta(offset) for offset in offsets],
+        "author": ["Alice", "Bob", "Alice", "Bob", "Bob"],
+        "message": ["a", "b", "c", "d", "e"],
+    })
+
+
+class TestConversations:
+    """Tests for conversation flags, ids and the session table."""
+
+    def test_conversation_ids(self):
+        """Test that conversations are numbered by the running count of starters."""
+        result = add_conversation_starter_flag(_conversations())
+
+        assert result["is_conversation_starter"].tolist() == [0, 0, 0, 1, 0]
+        assert result["conversation_id"].tolist() == [0, 0, 0, 1, 1]
+
+    def test_configurable_gap(self):
+        """Test that a shorter gap splits conversations earlier."""
+        result = add_conversation_starter_flag(_conversations(), gap=pd.Timedelta("20min"))
+
+        assert result["conversation_id"].tolist() == [0, 0, 1, 2, 2]
+
+    def test_update_renumbers_conversations(self):
+        """Test that dropping rows gives the same ids as flagging the kept rows."""
+        df = _conversations()
+        gap = pd.Timedelta("20min")
+        keep = df["author"] == "Alice"
+
+        result = update_conversation_starter_flag(add_conversation_starter_flag(df, gap), keep, gap)
+        expected = add_conversation_starter_flag(df[keep], gap)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_build_sessions(self):
+        """Test the per-conversation summary."""
+        sessions = build_sessions(add_conversation_starter_flag(_conversations()))
+
+        assert sessions.index.tolist() == [0, 1]
+        assert sessions["messages"].tolist() == [3, 2]
+        assert sessions["participants"].tolist() == [2, 1]
+        assert sessions["initiator"].tolist() == ["Alice", "Bob"]
+        assert sessions["duration"].tolist() == [pd.Timedelta("30min"), pd.Timedelta("10min")]
+        assert sessions.loc[1, "start"] == pd.Timestamp("2024-01-01 18:30")
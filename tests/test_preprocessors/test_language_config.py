@@ -3,6 +3,9 @@ Tests for language configuration module.
 """
 
 import pytest
+import re
+import json
+import pandas as pd
 import sys
 import os
 
@@ -11,6 +14,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from whatsapp_analyzer.preprocessors.language_config import (
     get_language_settings,
+    combine_language_settings,
+    detect_languages,
+    resolve_language_settings,
+    language_matcher,
+    _load_language_pack,
+    _trie_pattern,
     SUPPORTED_LANGUAGES,
     LANGUAGE_SETTINGS,
 )
@@ -103,3 +112,106 @@ class TestEditedMessagePatterns:
 
         assert "Diese Nachricht wurde bearbeitet" in edited
         assert "Du hast diese Nachricht bearbeitet" in edited
+
+
+class TestLanguageDetection:
+    """Tests for detecting the chat language from placeholders."""
+
+    def test_detects_each_language(self):
+        """Test that every language is found from its placeholders."""
+        for lang in SUPPORTED_LANGUAGES:
+            settings = get_language_settings(lang)
+            messages = pd.Series(["hello", settings["image"], settings["deleted"][0], None])
+            assert detect_languages(messages) == [lang]
+
+    def test_detects_edited_and_location_messages(self):
+        """Test that edit markers and location prefixes count as evidence."""
+        messages = pd.Series([
+            "Hallo <Diese Nachricht wurde bearbeitet>",
+            "Konum https://maps.google.com/?q=41.0,29.0",
+        ])
+        assert sorted(detect_languages(messages)) == ["German", "Turkish"]
+
+    def test_mixed_languages_most_frequent_first(self):
+        """Test that mixed chats list all languages by frequency."""
+        messages = pd.Series(["image omitted", "Bild weggelassen", "Bild weggelassen", "hi"])
+        assert detect_languages(messages) == ["German", "English"]
+
+    def test_placeholder_must_be_whole_message(self):
+        """Test that a placeholder inside ordinary text is not evidence."""
+        messages = pd.Series(["I said image omitted earlier", "no placeholders"])
+        assert detect_languages(messages) == []
+
+    def test_sample_spans_whole_chat(self):
+        """Test that a language used only at the end is found."""
+        messages = pd.Series(["hi"] * 1000 + ["Bild weggelassen"] * 10)
+        assert detect_languages(messages, sample_size=100) == ["German"]
+
+    def test_combine_merges_patterns(self):
+        """Test that combined settings hold the patterns of all languages."""
+        combined = combine_language_settings(["English", "German"])
+
+        assert combined["image"] == ["image omitted", "Bild weggelassen"]
+        assert "This message was edited" in combined["edited"]
+        assert "Diese Nachricht wurde bearbeitet" in combined["edited"]
+        assert combine_language_settings(["English"]) == get_language_settings("English")
+
+    def test_resolve_falls_back_to_all_languages(self):
+        """Test that chats without placeholders use every language."""
+        languages, settings = resolve_language_settings(pd.Series(["hello"]))
+
+        assert languages == SUPPORTED_LANGUAGES
+        assert "görüntü dahil edilmedi" in settings["image"]
+
+    def test_resolve_uses_selected_language(self):
+        """Test that a selected language overrides detection."""
+        languages, settings = resolve_language_settings(pd.Series(["Bild weggelassen"]), "English")
+
+        assert languages == ["English"]
+        assert settings == get_language_settings("English")
+
+
+class TestLanguagePacks:
+    """Tests for language pack files and the shared matcher."""
+
+    def test_settings_match_pack_files(self):
+        """Test that LANGUAGE_SETTINGS holds every pack."""
+        assert sorted(LANGUAGE_SETTINGS) == SUPPORTED_LANGUAGES
+        assert LANGUAGE_SETTINGS["German"] is get_language_settings("German")
+
+    def test_pack_missing_keys_raises_error(self, tmp_path, monkeypatch):
+        """Test that a pack without all required keys is rejected."""
+        import whatsapp_analyzer.preprocessors.language_config as language_config
+
+        (tmp_path / "english.json").write_text(json.dumps({"image": "image omitted"}), encoding="utf-8")
+        monkeypatch.setattr(language_config, "LANGUAGE_PACK_DIR", str(tmp_path))
+        _load_language_pack.cache_clear()
+        try:
+            with pytest.raises(ValueError, match="missing keys"):
+                get_language_settings("English")
+        finally:
+            _load_language_pack.cache_clear()
+
+    def test_matcher_compiled_once(self):
+        """Test that the matcher is shared between calls."""
+        assert language_matcher() is language_matcher()
+
+    def test_matcher_covers_all_languages(self):
+        """Test that placeholders of every language are in the matcher."""
+        matcher = language_matcher()
+        for position, lang in enumerate(SUPPORTED_LANGUAGES):
+            settings = get_language_settings(lang)
+            found = matcher.placeholders.get_loc(settings["image"])
+            assert matcher.placeholder_languages[found] & (1 << position)
+            assert matcher.edited_languages[settings["edited"][0].lower()] & (1 << position)
+
+    def test_trie_pattern_matches_exactly_its_texts(self):
+        """Test that the trie regex matches each text and nothing shorter."""
+        texts = ["ab", "abc", "abd", "b.c"]
+        pattern = re.compile(f"(?:{_trie_pattern(texts)})$")
+
+        for text in texts:
+            assert pattern.match(text)
+        assert not pattern.match("a")
+        assert not pattern.match("bxc")
+        assert re.match(_trie_pattern(texts), "abcd").group() == "abc"
@@ -14,7 +14,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 from whatsapp_analyzer.preprocessors.message_processor import (
     process_multimedia,
     process_emojis,
-    _check_edited,
+    classify_placeholders,
+    strip_edited_markers,
 )
 from whatsapp_analyzer.preprocessors.language_config import get_language_settings
 
@@ -76,42 +77,137 @@ class TestProcessMultimedia:
         assert not edited_rows["message"].isna().all()
 
 
-class TestCheckEdited:
-    """Tests for _check_edited helper function."""
+    def test_detects_attachments(self, english_language_settings):
+        """Test that attachments named in exports with media are flagged by file kind and cleared."""
+        df = pd.DataFrame({"message": [
+            "<attached: 00000012-PHOTO-2022-03-12-01-05-33.jpg>",
+            "<Anhang: 00000013-AUDIO-2022-03-12-01-06-00.opus>",
+            "PTT-20220312-WA0002.opus (file attached)",
+            "<attached: 00000014-report.pdf>",
+            "notes.txt (see above)",
+        ]})
+
+        result = process_multimedia(df, english_language_settings)
+
+        assert result["is_image"].tolist() == [1, 0, 0, 0, 0]
+        assert result["is_audio"].tolist() == [0, 1, 1, 0, 0]
+        assert result["is_media"].tolist() == [0, 0, 0, 1, 0]
+        assert result["message"].isna().tolist() == [True, True, True, True, False]
+
+
+class TestClassifyPlaceholders:
+    """Tests for classify_placeholders function."""
+
+    def test_codes(self, english_language_settings):
+        """Test that each placeholder maps to its category code."""
+        messages = pd.Series(["image omitted", "hello", "You deleted this message.", "<Media omitted>", np.nan])
+
+        codes = classify_placeholders(messages, english_language_settings)
+
+        assert codes.tolist() == [0, -1, 6, 5, -1]
+
+    def test_media_wins_over_deleted(self):
+        """Test that a text listed as media and deleted counts as media."""
+        lang = {
+            "image": "gone", "video": "v", "gif": "g", "sticker": "s",
+            "audio": "a", "media": "m", "deleted": ["gone"],
+        }
+
+        assert classify_placeholders(pd.Series(["gone"]), lang).tolist() == [0]
+
+    def test_flags_match_codes(self, sample_messages, english_language_settings):
+        """Test that every flagged message is cleared exactly once."""
+        result = process_multimedia(sample_messages, english_language_settings)
+        flags = result[["is_image", "is_video", "is_gif", "is_sticker", "is_audio", "is_media", "is_deleted"]]
+
+        assert flags.sum(axis=1).max() == 1
+        assert result.loc[flags.sum(axis=1) == 1, "message"].isna().all()
+
+
+class TestStripEditedMarkers:
+    """Tests for strip_edited_markers function."""
+
+    def test_strips_marker(self):
+        """Test that the marker is removed and the message flagged."""
+        messages = pd.Series(["See you THIS MESSAGE WAS EDITED ", "plain", np.nan])
+
+        result, is_edited = strip_edited_markers(messages, ["This message was edited"])
+
+        assert result.iloc[0] == "See you"
+        assert result.iloc[1] == "plain"
+        assert pd.isna(result.iloc[2])
+        assert is_edited.tolist() == [True, False, False]
+
+    def test_strips_bracketed_marker(self):
+        """Test the Android '<This message was edited>' form."""
+        messages = pd.Series(["See you <This message was edited>"])
+
+        result, is_edited = strip_edited_markers(messages, ["This message was edited"])
+
+        assert result.iloc[0] == "See you"
+        assert is_edited.iloc[0]
+
+    def test_marker_inside_message_is_kept(self):
+        """Test that only a trailing marker counts."""
+        messages = pd.Series(["This message was edited, right?"])
+
+        result, is_edited = strip_edited_markers(messages, ["This message was edited"])
+
+        assert result.iloc[0] == "This message was edited, right?"
+        assert not is_edited.iloc[0]
+
+    def test_counts_exclude_marker(self, sample_df_with_edited_messages, english_language_settings):
+        """Test that words and letters are recounted without the marker."""
+        result = process_multimedia(sample_df_with_edited_messages, english_language_settings)
+
+        assert result.loc[0, "message"] == "Original message"
+        assert result.loc[0, "words"] == 2
+        assert result.loc[0, "letters"] == len("Original message")
+
+
+class TestEditedDetection:
+    """Tests for detecting edited messages in processed chats."""
+
+    PATTERNS = ["This message was edited"]
 
     def test_detects_edited_at_end(self):
         """Test detection of edited indicator at end of message."""
-        patterns = ["This message was edited"]
+        messages = pd.Series(["Hello world This message was edited", "Test This message was edited"])
+
+        _, is_edited = strip_edited_markers(messages, self.PATTERNS)
 
-        assert _check_edited("Hello world This message was edited", patterns)
-        assert _check_edited("Test This message was edited", patterns)
+        assert is_edited.all()
 
     def test_case_insensitive(self):
         """Test that detection is case-insensitive."""
-        patterns = ["This message was edited"]
+        messages = pd.Series(["Hello THIS MESSAGE WAS EDITED", "Hello this message was edited"])
 
-        assert _check_edited("Hello THIS MESSAGE WAS EDITED", patterns)
-        assert _check_edited("Hello this message was edited", patterns)
+        _, is_edited = strip_edited_markers(messages, self.PATTERNS)
+
+        assert is_edited.all()
 
     def test_exact_match(self):
         """Test detection of exact match (entire message is the pattern)."""
-        patterns = ["This message was edited"]
+        result, is_edited = strip_edited_markers(pd.Series(["This message was edited"]), self.PATTERNS)
 
-        assert _check_edited("This message was edited", patterns)
+        assert is_edited.iloc[0]
+        assert result.iloc[0] == ""
 
     def test_no_false_positives(self):
         """Test that normal messages aren't flagged."""
-        patterns = ["This message was edited"]
+        messages = pd.Series(["Hello world", "This message was great"])
+
+        _, is_edited = strip_edited_markers(messages, self.PATTERNS)
+
+        assert not is_edited.any()
 
-        assert not _check_edited("Hello world", patterns)
-        assert not _check_edited("This message was great", patterns)
+    def test_handles_empty_input(self, english_language_settings):
+        """Test handling of empty and missing messages."""
+        df = pd.DataFrame({"message": ["", None, np.nan]})
 
-    def test_handles_empty_input(self):
-        """Test handling of empty/None input."""
-        patterns = ["This message was edited"]
+        result = process_multimedia(df, english_language_settings)
 
-        assert not _check_edited("", patterns)
-        assert not _check_edited(None, patterns)
+        assert result["is_edited"].tolist() == [0, 0, 0]
 
 
 class TestProcessEmojis:
@@ -140,3 +236,14 @@ class TestProcessEmojis:
 
         assert result.loc[0, "is_emoji"] == 0
         assert result.loc[1, "is_emoji"] == 0
+
+    def test_stores_emojis_per_message(self):
+        """Test that the emojis of each message are kept as graphemes."""
+        df = pd.DataFrame({
+            "message": ["Hello", "Great 👍🏽👍🏽", "中文 text", "Off to 🇩🇪!"]
+        })
+
+        result = process_emojis(df)
+
+        assert result["emojis"].tolist() == [None, ("👍🏽", "👍🏽"), None, ("🇩🇪",)]
+        assert result["is_emoji"].tolist() == [0, 1, 0, 1]
@@ -0,0 +1,96 @@
+"""
+Tests for the compact schema of the preprocessed frame.
+"""
+
+import pytest
+import pandas as pd
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.preprocessors import preprocess_data
+from whatsapp_analyzer.preprocessors.schema import memory_usage_mb, to_compact_schema
+from whatsapp_analyzer.analyzers import (
+    activity,
+    calculate_author_stats,
+    emoji_stats_by_author,
+    find_longest_consecutive_streak,
+    get_message_count_by_author,
+    get_most_used_emoji,
+    word_stats,
+)
+
+
+@pytest.fixture
+def processed(sample_messages):
+    """Preprocess the sample messages with all authors selected."""
+    authors = sample_messages["author"].unique().tolist()
+    df, _ = preprocess_data(sample_messages, "English", authors)
+    return df
+
+
+class TestToCompactSchema:
+    """Tests for to_compact_schema function."""
+
+    def test_column_types(self, processed):
+        """Test that columns get their compact types."""
+        result = to_compact_schema(processed)
+
+        assert isinstance(result["author"].dtype, pd.CategoricalDtype)
+        assert result["message"].dtype == "string[pyarrow]"
+        assert str(result["date"].dtype) == "date32[day][pyarrow]"
+        assert result["is_image"].dtype == "uint8"
+        assert result["hour"].dtype == "int8"
+
+    def test_keeps_values(self, processed):
+        """Test that values survive the conversion."""
+        result = to_compact_schema(processed)
+
+        assert result["author"].tolist() == processed["author"].tolist()
+        assert result["message"].isna().tolist() == processed["message"].isna().tolist()
+        assert [str(d) for d in result["date"]] == processed["date"].dt.strftime("%Y-%m-%d").tolist()
+        assert result["day"].tolist() == processed["day"].tolist()
+        assert result["is_deleted"].tolist() == processed["is_deleted"].tolist()
+
+    def test_reduces_memory(self, processed):
+        """Test that the compact frame is smaller."""
+        assert memory_usage_mb(to_compact_schema(processed)) < memory_usage_mb(processed)
+
+    def test_pipeline_option(self, sample_messages):
+        """Test that preprocess_data can return the compact frame."""
+        authors = sample_messages["author"].unique().tolist()
+        df, _ = preprocess_data(sample_messages, "English", authors, compact=True)
+
+        assert isinstance(df["author"].dtype, pd.CategoricalDtype)
+
+
+class TestAnalyzersOnCompactSchema:
+    """Analyzers must give the same results on both schemas."""
+
+    @pytest.mark.parametrize("analyzer", [
+        activity,
+        calculate_author_stats,
+        emoji_stats_by_author,
+        get_message_count_by_author,
+        get_most_used_emoji,
+        word_stats,
+    ])
+    def test_same_frames(self, processed, analyzer):
+        """Test that analyzer frames are identical apart from dtypes."""
+        expected = analyzer(processed)
+        result = analyzer(to_compact_schema(processed))
+
+        pd.testing.assert_frame_equal(
+            result.astype(object), expected.astype(object), check_dtype=False, check_categorical=False
+        )
+
+    def test_same_streak(self, processed):
+        """Test that the longest streak is found on both schemas."""
+        expected = find_longest_consecutive_streak(processed)
+        result = find_longest_consecutive_streak(to_compact_schema(processed))
+
+        assert result["author"] == expected["author"]
+        assert result["streak_length"] == expected["streak_length"]
+        assert result["start_time"] == expected["start_time"]
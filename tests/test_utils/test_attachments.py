@@ -0,0 +1,42 @@
+"""
+Tests for recognising attachment references.
+"""
+
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.utils.attachments import attachment_kinds
+
+
+class TestAttachmentKinds:
+    """Tests for attachment_kinds function."""
+
+    def test_kinds_from_file_names(self):
+        """Test that the kind is read from iOS and Android file names."""
+        messages = pd.Series([
+            "<attached: 00000001-VIDEO-2022-03-12-01-05-33.mp4>",
+            "STK-20220312-WA0003.webp (Datei angehängt)",
+            "<attached: 00000002-GIF-2022-03-12-01-05-33.mp4>",
+            "DOC-20220312-WA0004.pdf (file attached)",
+        ])
+
+        assert attachment_kinds(messages).tolist() == ["video", "sticker", "gif", "media"]
+
+    def test_only_whole_references(self):
+        """Test that text around a reference and ordinary messages are not attachments."""
+        messages = pd.Series([
+            "look <attached: 00000001-PHOTO-2022-03-12-01-05-33.jpg> here",
+            "IMG-20220312-WA0001.jpg is nice",
+            "hello",
+            np.nan,
+        ], index=[10, 11, 12, 13])
+
+        kinds = attachment_kinds(messages)
+
+        assert kinds.index.tolist() == [10, 11, 12, 13]
+        assert kinds.isna().all()
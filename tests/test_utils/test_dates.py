@@ -0,0 +1,63 @@
+"""
+Tests for the shared day ordinal helpers.
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.utils.dates import (
+    MISSING_DAY,
+    day_ordinals,
+    days_of,
+    months_to_periods,
+    ordinal_months,
+    ordinals_to_dates,
+)
+
+
+class TestDayOrdinals:
+    """Tests for day ordinal conversion."""
+
+    def test_days_since_epoch(self):
+        """Test that ordinals count days since 1970-01-01, ignoring the time."""
+        timestamps = pd.Series(pd.to_datetime(["1970-01-01 23:59", "1970-01-02 00:00", "2024-03-01 12:00"]))
+
+        ordinals = day_ordinals(timestamps)
+
+        assert ordinals.dtype == np.int32
+        assert ordinals.tolist() == [0, 1, 19783]
+
+    def test_missing_timestamps(self):
+        """Test that NaT maps to MISSING_DAY."""
+        timestamps = pd.Series(pd.to_datetime(["2024-03-01", None]))
+
+        assert day_ordinals(timestamps).tolist() == [19783, MISSING_DAY]
+
+    def test_round_trip(self):
+        """Test that ordinals convert back to midnight of the same day."""
+        timestamps = pd.Series(pd.to_datetime(["2020-02-29 18:30", "2024-12-31 00:01"]))
+
+        dates = ordinals_to_dates(day_ordinals(timestamps))
+
+        assert dates.tolist() == timestamps.dt.normalize().tolist()
+
+    def test_days_of_prefers_day_column(self):
+        """Test that a stored day column is used and timestamps are the fallback."""
+        df = pd.DataFrame({"timestamp": pd.to_datetime(["2024-03-01"]), "day": np.array([5], dtype=np.int32)})
+
+        assert days_of(df).tolist() == [5]
+        assert days_of(df.drop(columns="day")).tolist() == [19783]
+
+    def test_months_to_periods(self):
+        """Test that month ordinals convert to the monthly periods of their days."""
+        timestamps = pd.Series(pd.to_datetime(["1970-01-31 08:00", "2024-02-29 23:00"]))
+
+        periods = months_to_periods(ordinal_months(day_ordinals(timestamps)), name="yearmonth")
+
+        assert periods.name == "yearmonth"
+        assert periods.tolist() == timestamps.dt.to_period("M").tolist()
@@ -0,0 +1,102 @@
+"""
+Tests for the shared emoji scanning engine.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.utils.emojis import (
+    emoji_graphemes,
+    find_emojis,
+    explode_emojis,
+    count_emojis,
+)
+from whatsapp_analyzer.analyzers.content_analyzer import emoji_stats_by_author, get_most_used_emoji
+
+
+class TestEmojiGraphemes:
+    """Tests for emoji_graphemes function."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("family 👨‍👩‍👧 time", ["👨‍👩‍👧"]),
+        ("thanks 👍🏽", ["👍🏽"]),
+        ("🇹🇷🇩🇪", ["🇹🇷", "🇩🇪"]),
+        ("press 1️⃣ or #️⃣", ["1️⃣", "#️⃣"]),
+        ("love ❤️ and ❤", ["❤️", "❤"]),
+    ])
+    def test_whole_graphemes(self, text, expected):
+        """Test that multi-codepoint emojis are returned as one emoji."""
+        assert emoji_graphemes(text) == expected
+
+    def test_ignores_text_symbols(self):
+        """Test that bare text symbols and non-Latin scripts are not emojis."""
+        assert emoji_graphemes("© 2024 ™ 中文 ① 10 #tag") == []
+
+
+class TestFindEmojis:
+    """Tests for find_emojis function."""
+
+    def test_aligned_with_messages(self):
+        """Test that results keep the message index and None for plain messages."""
+        messages = pd.Series(["hi 😂", np.nan, "plain", "hi 😂"], index=[5, 6, 7, 8])
+
+        result = find_emojis(messages)
+
+        assert result.index.tolist() == [5, 6, 7, 8]
+        assert result.tolist() == [("😂",), None, None, ("😂",)]
+
+
+class TestEmojiCounts:
+    """Tests for the emoji tables derived from the scan."""
+
+    @pytest.fixture
+    def chat(self):
+        """Messages of two authors with their emoji column."""
+        df = pd.DataFrame({
+            "author": ["Ann", "Bob", "Ann", "Bob", "Ann"],
+            "message": ["😂😂", "ok 👍🏽", "🇩🇪 👍🏽", "nothing", "😂"],
+        })
+        return df.assign(emojis=find_emojis(df["message"]))
+
+    def test_explode(self, chat):
+        """Test that every emoji occurrence becomes one row."""
+        result = explode_emojis(chat)
+
+        assert len(result) == 6
+        assert result[result["author"] == "Bob"]["emoji"].tolist() == ["👍🏽"]
+
+    def test_count_without_column(self, chat):
+        """Test that counts match whether or not the frame was preprocessed."""
+        with_column = count_emojis(chat)
+        without_column = count_emojis(chat.drop(columns="emojis"))
+
+        pd.testing.assert_frame_equal(with_column, without_column)
+        assert with_column.iloc[0].tolist() == ["😂", 3]
+
+    def test_most_used(self, chat):
+        """Test the top emoji table."""
+        result = get_most_used_emoji(chat)
+
+        assert result.columns.tolist() == ["Emoji", "Count"]
+        assert dict(zip(result["Emoji"], result["Count"])) == {"😂": 3, "👍🏽": 2, "🇩🇪": 1}
+
+    def test_stats_by_author(self, chat):
+        """Test per-author totals, distinct emojis and favourites."""
+        result = emoji_stats_by_author(chat)
+
+        assert result["Author"].tolist() == ["Ann", "Bob"]
+        assert result["Emojis"].tolist() == [5, 1]
+        assert result["Distinct"].tolist() == [3, 1]
+        assert result["Favourite"].tolist() == ["😂", "👍🏽"]
+
+    def test_stats_without_emojis(self):
+        """Test that a chat without emojis gives an empty table."""
+        df = pd.DataFrame({"author": ["Ann"], "message": ["hello"]})
+
+        assert emoji_stats_by_author(df).empty
@@ -0,0 +1,114 @@
+"""
+Tests for the pipeline and analyzer profiling.
+"""
+
+import json
+import tracemalloc
+import pytest
+import pandas as pd
+import sys
+import os
+
+# Add src to path for direct imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from whatsapp_analyzer.utils.profiling import ProfileReport, profile_stage, profiled, profiling
+from whatsapp_analyzer.preprocessors import PIPELINE_STEPS, preprocess_data
+
+
+@profiled("analyzer.double")
+def double(df):
+    """Toy analyzer returning twice as many rows."""
+    return pd.concat([df, df])
+
+
+class TestProfileStage:
+    """Tests for profile_stage and the profiled decorator."""
+
+    def test_no_report_outside_profiling(self):
+        """Test that stages outside a profiling block are not recorded."""
+        report = ProfileReport(trace_memory=False)
+        with profile_stage("outside"):
+            pass
+        with profiling(report):
+            pass
+
+        assert report.stages == []
+
+    def test_nested_stages(self):
+        """Test that nested stages are listed after their enclosing stage."""
+        with profiling() as report:
+            with profile_stage("outer", rows_in=3) as stage:
+                with profile_stage("inner"):
+                    data = list(range(100_000))
+                stage.rows_out = len(data)
+
+        outer, inner = report.stages
+        assert (outer.stage, outer.depth, outer.rows_in, outer.rows_out) == ("outer", 0, 3, 100_000)
+        assert (inner.stage, inner.depth) == ("inner", 1)
+        # The inner allocation counts towards the enclosing stage as well
+        assert outer.peak_mb >= inner.peak_mb > 0.5
+        assert outer.wall_seconds >= inner.wall_seconds
+
+    def test_profiled_row_counts(self):
+        """Test that decorated analyzers record rows in and out."""
+        df = pd.DataFrame({"a": [1, 2]})
+        with profiling(ProfileReport(trace_memory=False)) as report:
+            result = double(df)
+
+        assert len(result) == 4
+        stage = report.stages[0]
+        assert (stage.stage, stage.rows_in, stage.rows_out, stage.peak_mb) == ("analyzer.double", 2, 4, None)
+
+
+    def test_overlapping_runs_share_tracing(self):
+        """Test that tracing outlives an overlapping run and peaks are only kept for a run tracing alone."""
+        was_tracing = tracemalloc.is_tracing()
+        with profiling() as first:
+            with profiling() as second:
+                with profile_stage("shared"):
+                    pass
+            assert tracemalloc.is_tracing()
+            with profile_stage("alone"):
+                data = list(range(100_000))
+
+        assert tracemalloc.is_tracing() == was_tracing
+        assert second.stages[0].peak_mb is None
+        assert first.stages[0].peak_mb > 0.5
+        assert len(data) == 100_000
+
+    def test_log_only_report_skips_tracing(self):
+        """Test that a report without memory tracing leaves tracemalloc alone."""
+        was_tracing = tracemalloc.is_tracing()
+        with profiling(ProfileReport(trace_memory=False)):
+            assert tracemalloc.is_tracing() == was_tracing
+
+
+class TestProfileReport:
+    """Tests for ProfileReport output."""
+
+    def test_pipeline_steps_recorded(self, sample_messages):
+        """Test that every preprocessing step is recorded with its cache status."""
+        authors = sample_messages["author"].unique().tolist()
+        with profiling() as report:
+            preprocess_data(sample_messages, "English", authors)
+
+        table = report.to_frame()
+        steps = [f"preprocess.{step.name}" for step in PIPELINE_STEPS]
+        assert table["stage"].tolist() == ["preprocess", "preprocess.detect_language"] + steps + ["select_authors"]
+        assert not table.loc[table["depth"] == 1, "cache_hit"].any()
+        assert report.total_seconds() == pytest.approx(table.loc[table["depth"] == 0, "wall_seconds"].sum())
+
+    def test_json_lines_log(self, tmp_path):
+        """Test that a profiled run is appended to the log as JSON lines."""
+        log_path = tmp_path / "profile.jsonl"
+        for _ in range(2):
+            with profiling(ProfileReport(trace_memory=False), log_path=str(log_path)):
+                with profile_stage("stage", rows_in=1):
+                    pass
+
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert len(records) == 2
+        assert records[0]["stage"] == "stage"
+        assert records[0]["rows_in"] == 1
+        assert "run" in records[0]
@@ -116,3 +116,21 @@ def safe_fragment(func):
     except AttributeError:
         # Fallback: return function as-is
         return func
+
+
+def safe_query_param(name):
+    """
+    Read a URL query parameter, with fallback for older Streamlit versions.
+
+    Args:
+        name: Query parameter name
+
+    Returns:
+        The parameter's (first) value, or None if it is not set
+    """
+    try:
+        return st.query_params.get(name)
+    except AttributeError:
+        # Fallback: experimental API (Streamlit < 1.30.0)
+        values = st.experimental_get_query_params().get(name)
+        return values[0] if values else None
@@ -1 +1,5 @@
 """Reusable UI components for WhatsApp Chat Analyzer."""
+
+from ui.components.debug_panel import DEBUG_PANEL_ENV, debug_panel_enabled, render_debug_panel
+
+__all__ = ["DEBUG_PANEL_ENV", "debug_panel_enabled", "render_debug_panel"]
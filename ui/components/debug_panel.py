@@ -0,0 +1,60 @@
+"""
+Debug panel showing the profile of the last app run.
+
+Hidden unless the app is opened with ``?debug=1`` and the deployment
+allows it by setting WHATSAPP_ANALYZER_DEBUG_PANEL=1.
+"""
+
+import os
+
+import streamlit as st
+
+DEBUG_PANEL_ENV = "WHATSAPP_ANALYZER_DEBUG_PANEL"
+
+
+def debug_panel_enabled() -> bool:
+    """
+    Check whether the deployment allows the debug panel.
+
+    Returns:
+        True if WHATSAPP_ANALYZER_DEBUG_PANEL is set to 1
+    """
+    return os.environ.get(DEBUG_PANEL_ENV) == "1"
+
+
+def render_debug_panel(report):
+    """
+    Render the stage timings and memory of a profiled run.
+
+    Args:
+        report: ProfileReport of the run, or None if nothing was profiled
+    """
+    with st.expander("Debug: run profile"):
+        if report is None or not report.stages:
+            st.info("No profiled stages in this run.")
+            return
+
+        st.caption(f"Run started {report.started} UTC, {report.total_seconds():.2f} s in profiled stages")
+        table = report.to_frame()
+        # Indent nested stages under the stage that ran them
+        table["stage"] = ["· " * depth + stage for stage, depth in zip(table["stage"], table["depth"])]
+        st.dataframe(
+            table.drop(columns="depth"),
+            column_config={
+                "stage": st.column_config.TextColumn("Stage"),
+                "wall_seconds": st.column_config.NumberColumn("Wall (s)", format="%.3f"),
+                "cpu_seconds": st.column_config.NumberColumn("CPU (s)", format="%.3f"),
+                "peak_mb": st.column_config.NumberColumn("Peak (MB)", format="%.1f"),
+                "rows_in": st.column_config.NumberColumn("Rows in", format="%d"),
+                "rows_out": st.column_config.NumberColumn("Rows out", format="%d"),
+                "cache_hit": st.column_config.CheckboxColumn("Cache hit"),
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+        st.download_button(
+            label="Download as JSON lines",
+            data=report.to_json_lines().encode("utf-8"),
+            file_name="profile.jsonl",
+            mime="application/jsonl"
+        )
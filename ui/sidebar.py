@@ -4,7 +4,6 @@ Sidebar component for WhatsApp Chat Analyzer.
 Handles file upload, configuration, and action buttons.
 """
 
-import hashlib
 import os
 import sys
 
@@ -14,10 +13,12 @@ import streamlit as st
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from whatsapp_analyzer.parsers import read_file
-from whatsapp_analyzer.preprocessors import SUPPORTED_LANGUAGES
+from whatsapp_analyzer.parsers import read_file, content_hash
+from whatsapp_analyzer.preprocessors import CONVERSATION_GAP, SUPPORTED_LANGUAGES, detect_languages
 from ui.compat import safe_toast, safe_status, safe_link_button, safe_dialog
 
+AUTO_DETECT_LANGUAGE = "Auto-detect"
+
 
 def render_sidebar():
     """
@@ -29,7 +30,9 @@ def render_sidebar():
             - ready_to_analyze: bool
             - analysis_requested: bool
             - selected_authors: list
-            - selected_lang: str
+            - selected_lang: str, or None to detect the language
+            - compact: bool
+            - conversation_gap: pd.Timedelta
     """
     with st.sidebar:
         st.header("WhatsApp Chat Analyzer")
@@ -60,14 +63,14 @@ def _render_upload_section():
     st.subheader("Upload")
 
     file = st.file_uploader(
-        "Upload WhatsApp chat file (.txt)",
-        type="txt",
-        help="Export your chat without media from WhatsApp"
+        "Upload WhatsApp chat file (.txt or .zip)",
+        type=["txt", "zip"],
+        help="Export your chat from WhatsApp; .zip exports with media are read without extracting"
     )
 
     if file is not None:
         # Calculate file hash for change detection
-        file_hash = hashlib.md5(file.getvalue()).hexdigest()
+        file_hash = content_hash(file)
 
         # Only process if file changed
         if file_hash != st.session_state.get('file_hash'):
@@ -76,16 +79,24 @@ def _render_upload_section():
                 df = read_file(file)
 
                 status.update(label="Preparing data...")
-                df["timestamp"] = pd.to_datetime(df["timestamp"])
-                df = df.sort_values("timestamp")
+                # read_file() already returns datetime64 timestamps
+                # Stable sort keeps export order for messages sent in the same minute
+                df = df.sort_values("timestamp", kind="stable")
                 # Skip first three entries (typically group creation messages)
                 df = df[3:]
 
                 # Store in session state
                 st.session_state.raw_data = df
                 st.session_state.file_hash = file_hash
+                st.session_state.detected_languages = detect_languages(df["message"])
                 st.session_state.processed_data = None  # Clear old processed data
                 st.session_state.locations = None
+                st.session_state.sessions = None
+                st.session_state.chat_data = None
+                st.session_state.chat_locations = None
+                st.session_state.chat_key = None
+                st.session_state.selection_key = None
+                st.session_state.pipeline_cache = None
 
                 status.update(label="File uploaded!", state="complete")
 
@@ -118,7 +129,9 @@ def _render_config_section():
         'ready_to_analyze': False,
         'analysis_requested': False,
         'selected_authors': [],
-        'selected_lang': 'English'
+        'selected_lang': None,
+        'compact': False,
+        'conversation_gap': CONVERSATION_GAP
     }
 
     if st.session_state.get('raw_data') is None:
@@ -136,17 +149,38 @@ def _render_config_section():
         "Select authors to include",
         author_list,
         default=author_list,
-        help="Choose which chat participants to analyze"
+        help="Choose which chat participants to analyze; after the first analysis, changes apply immediately"
     )
     config['selected_authors'] = selected_authors
 
     # Language selection
     selected_lang = st.radio(
         "Chat language",
-        SUPPORTED_LANGUAGES,
-        help="Select the language used in your WhatsApp"
+        [AUTO_DETECT_LANGUAGE] + SUPPORTED_LANGUAGES,
+        help="Detected from the chat's media and deleted message placeholders; select a language to override"
+    )
+    config['selected_lang'] = None if selected_lang == AUTO_DETECT_LANGUAGE else selected_lang
+    if config['selected_lang'] is None:
+        detected = st.session_state.get('detected_languages')
+        if detected:
+            st.caption(f"Detected: {', '.join(detected)}")
+        else:
+            st.caption("No language detected; placeholders of all languages are recognized")
+
+    gap_hours = st.number_input(
+        "Conversation gap (hours)",
+        min_value=0.5,
+        max_value=72.0,
+        value=CONVERSATION_GAP / pd.Timedelta(hours=1),
+        step=0.5,
+        help="A message sent after this much silence starts a new conversation"
+    )
+    config['conversation_gap'] = pd.Timedelta(hours=gap_hours)
+
+    config['compact'] = st.checkbox(
+        "Compact memory mode",
+        help="Store the analyzed chat with compact column types; recommended for very large chats"
     )
-    config['selected_lang'] = selected_lang
 
     # Validate and show analyze button
     if len(selected_authors) >= 2:
@@ -186,7 +220,7 @@ def _render_actions_section():
     # Reset button
     if st.button("Start Over", use_container_width=True):
         # Clear all session state
-        for key in ['raw_data', 'processed_data', 'locations', 'file_hash']:
+        for key in ['raw_data', 'chat_data', 'chat_locations', 'chat_key', 'selection_key', 'pipeline_cache', 'processed_data', 'locations', 'sessions', 'file_hash', 'detected_languages']:
             if key in st.session_state:
                 del st.session_state[key]
         st.rerun()
@@ -219,7 +253,7 @@ def _show_about_dialog():
     """Show the about dialog."""
     st.markdown("""
     ### Privacy First
-    Your data stays on your device. We don't store any of your chat data.
+    Your data is never sent to external servers. Parsed chats are cached only on the machine running the app.
 
     ### Supported Languages
     - English
@@ -233,7 +267,7 @@ def _show_about_dialog():
     - Word clouds and emoji analysis
 
     ### Acknowledgements
-    - [chat-miner](https://github.com/joweich/chat-miner) for WhatsApp parsing
+    - [chat-miner](https://github.com/joweich/chat-miner) for the original WhatsApp parsing
     - [Dinesh Vatvani](https://dvatvani.github.io/whatsapp-analysis.html) for inspiration
     """)
 
@@ -254,7 +288,7 @@ def _show_help_dialog():
        - Tap menu (...) > More > Export chat
        - Choose "Without Media"
 
-    2. **Upload the .txt file** using the upload button
+    2. **Upload the .txt or .zip file** using the upload button
 
     3. **Configure your analysis**:
        - Select which participants to include
@@ -6,13 +6,14 @@ from ui.tabs.authors import render_authors_tab
 from ui.tabs.content import render_content_tab
 
 
-def render_tabs(df, locations):
+def render_tabs(df, locations, sessions):
     """
     Render all analysis tabs.
 
     Args:
         df: Preprocessed DataFrame
         locations: Locations DataFrame
+        sessions: Session table (one row per conversation)
     """
     import streamlit as st
 
@@ -30,7 +31,7 @@ def render_tabs(df, locations):
         render_activity_tab(df)
 
     with tab3:
-        render_authors_tab(df)
+        render_authors_tab(df, sessions)
 
     with tab4:
         render_content_tab(df)
@@ -12,12 +12,14 @@ import streamlit as st
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from whatsapp_analyzer.analyzers import (
+    TIME_OF_DAY_BANDWIDTH,
     smoothed_daily_activity,
     relative_activity_ts,
     activity_time_of_day_ts,
     activity_day_of_week_ts,
     heatmap,
 )
+from ui.compat import safe_fragment
 
 
 def render_activity_tab(df):
@@ -72,17 +74,28 @@ def _render_volume_trends(df):
         st.area_chart(relative_df)
 
 
+@safe_fragment
 def _render_time_of_day(df):
-    """Render time of day activity chart."""
+    """Render time of day activity chart, re-smoothed in a fragment when the bandwidth changes."""
     st.header("Activity by Time of Day")
 
     with st.expander("About this chart"):
         st.write(
             "Shows when each participant is most active throughout the day. "
-            "Data is smoothed for better visualization of patterns."
+            "Data is smoothed for better visualization of patterns; the smoothing "
+            "wraps around midnight. Use the slider to adjust it."
         )
 
-    chart = activity_time_of_day_ts(df)
+    bandwidth = st.slider(
+        "Smoothing (minutes)",
+        min_value=10,
+        max_value=180,
+        value=TIME_OF_DAY_BANDWIDTH,
+        step=10,
+        help="Width of the smoothing window; smaller values show shorter peaks"
+    )
+
+    chart = activity_time_of_day_ts(df, bandwidth=bandwidth)
     st.altair_chart(chart, use_container_width=True)
 
 
@@ -19,6 +19,7 @@ from whatsapp_analyzer.analyzers import (
     analyze_response_time,
     response_matrix,
     find_longest_consecutive_streak,
+    conversation_stats,
 )
 from whatsapp_analyzer.visualizations import create_message_count_chart
 
@@ -35,7 +36,7 @@ except ImportError:
     HAS_RESPONSES = False
 
 
-def render_authors_tab(df):
+def render_authors_tab(df, sessions):
     """Render the author insights tab."""
 
     # Talkativeness & Trends
@@ -53,6 +54,11 @@ def render_authors_tab(df):
 
     st.divider()
 
+    # Conversation Starters
+    _render_conversation_stats(sessions)
+
+    st.divider()
+
     # Response Analysis
     _render_response_analysis(df)
 
@@ -122,6 +128,21 @@ def _render_activity_stats(df):
     st.altair_chart(activity_stats['chart'])
 
 
+def _render_conversation_stats(sessions):
+    """Render who starts conversations and how long they last."""
+    st.header("Conversation Starters")
+
+    with st.expander("About this table"):
+        st.write(
+            "A conversation starts with a message sent after a long silence "
+            "(the conversation gap set in the sidebar). Shows how many "
+            "conversations each author started and how long those lasted."
+        )
+
+    st.caption(f"{len(sessions):,} conversations")
+    st.dataframe(conversation_stats(sessions), use_container_width=True, hide_index=True)
+
+
 def _render_response_analysis(df):
     """Render response time and matrix analysis."""
 
@@ -11,7 +11,7 @@ import streamlit as st
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from whatsapp_analyzer.analyzers import get_most_used_emoji
+from whatsapp_analyzer.analyzers import emoji_stats_by_author, get_most_used_emoji
 from whatsapp_analyzer.visualizations import create_word_cloud
 from ui.compat import safe_fragment
 
@@ -99,6 +99,27 @@ def _render_emoji_analysis(df):
             use_container_width=True
         )
 
+    _render_emoji_authors(df)
+
+
+def _render_emoji_authors(df):
+    """Render per-author emoji usage."""
+    stats = emoji_stats_by_author(df)
+    if stats.empty:
+        return
+
+    st.subheader("Emojis by Author")
+    st.dataframe(
+        stats,
+        column_config={
+            "Emojis": st.column_config.NumberColumn("Emojis", format="%d", help="Total emojis sent"),
+            "Distinct": st.column_config.NumberColumn("Distinct", format="%d", help="Different emojis used"),
+            "Favourite": st.column_config.TextColumn("Favourite", help="Most used emoji"),
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
 
 def _render_raw_data(df):
     """Render expandable raw data view."""
@@ -105,7 +105,7 @@ def _render_statistics_tables(df):
         - **Words**: Average words per message
         - **Message Length**: Average characters per message
         - **Link**: % of messages with links
-        - **Conversation Starter**: % of messages starting new conversations (7+ hours gap)
+        - **Conversation Starter**: % of messages starting new conversations (after the conversation gap set in the sidebar)
         - **Image/Video/GIF/Audio/Sticker**: % containing each media type
         - **Deleted**: % of deleted messages
         - **Edited**: % of edited messages